@@ -20,15 +20,24 @@ from agno.learn import (
     LearningMachine,
     LearningMode,
 )
+from agno.run import RunContext
+from agno.run.agent import RunInput
 from agno.tools.mcp import MCPTools
-from agno.tools.sql import SQLTools
-from db import create_knowledge, db_url, get_postgres_db
+from db import create_knowledge, get_postgres_db
+from recall import create_recall_tool
 
 from cookbook_config import model
 
+from .analytics import analytics_db_url
 from .context.business_rules import BUSINESS_CONTEXT
+from .context.relevance import SemanticModelIndex
 from .context.semantic_model import SEMANTIC_MODEL_STR
-from .tools import create_introspect_schema_tool, create_save_validated_query_tool
+from .tools import (
+    CachedSQLTools,
+    ValidatedQueryCatalog,
+    create_introspect_schema_tool,
+    create_save_validated_query_tool,
+)
 
 # ---------------------------------------------------------------------------
 # Setup
@@ -44,13 +53,21 @@ dash_learnings = create_knowledge("Dash Learnings", "dash_learnings")
 # ---------------------------------------------------------------------------
 # Tools
 # ---------------------------------------------------------------------------
-save_validated_query = create_save_validated_query_tool(dash_knowledge)
-introspect_schema = create_introspect_schema_tool(db_url)
+# Postgres by default; DASH_ENGINE=duckdb runs SQL on DuckDB over Parquet
+analytics_url = analytics_db_url()
+
+# Validated queries are materialized; matching queries read the precomputed result
+validated_queries = ValidatedQueryCatalog(analytics_url)
+save_validated_query = create_save_validated_query_tool(dash_knowledge, catalog=validated_queries)
+introspect_schema = create_introspect_schema_tool(analytics_url)
+recall = create_recall_tool(dash_knowledge, dash_learnings)
 EXA_API_KEY = getenv("EXA_API_KEY", "")
 EXA_MCP_URL = f"https://mcp.exa.ai/mcp?exaApiKey={EXA_API_KEY}&tools=web_search_exa,get_code_context_exa"
 
 dash_tools: list = [
-    SQLTools(db_url=db_url),
+    # Repeated read-only queries are served from a result cache
+    CachedSQLTools(db_url=analytics_url, catalog=validated_queries),
+    recall,
     introspect_schema,
     save_validated_query,
     MCPTools(url=EXA_MCP_URL),
@@ -59,7 +76,12 @@ dash_tools: list = [
 # ---------------------------------------------------------------------------
 # Instructions
 # ---------------------------------------------------------------------------
-instructions = f"""\
+# "full" pastes every table into the prompt; "relevant" injects only the
+# tables that match the question (for large schemas)
+SEMANTIC_CONTEXT = getenv("DASH_SEMANTIC_CONTEXT", "full")
+QUESTION_KEY = "dash_question"
+
+INSTRUCTIONS_TEMPLATE = """\
 You are Dash, a self-learning data agent that provides **insights**, not just query results.
 
 ## Your Purpose
@@ -86,7 +108,8 @@ Your goal: make the user look like they've been working with this data for years
 
 ## Workflow
 
-1. Always start by running `search_knowledge_base` and `search_learnings` for table info, patterns, gotchas. Context that will help you write the best possible SQL.
+1. Always start with `recall`, which searches knowledge and learnings in one call, for table info, patterns,
+   gotchas. Context that will help you write the best possible SQL.
 2. Write SQL (LIMIT 50, no SELECT *, ORDER BY for rankings)
 3. If error -> `introspect_schema` -> fix -> `save_learning`
 4. Provide **insights**, not just data, based on the context you found.
@@ -145,12 +168,32 @@ Don't guess. If the schema doesn't have it, say so and explain what IS available
 
 ## SEMANTIC MODEL
 
-{SEMANTIC_MODEL_STR}
+{semantic_model}
 ---
 
-{BUSINESS_CONTEXT}\
+{business_context}\
 """
 
+instructions = INSTRUCTIONS_TEMPLATE.format(semantic_model=SEMANTIC_MODEL_STR, business_context=BUSINESS_CONTEXT)
+semantic_index = SemanticModelIndex.from_knowledge() if SEMANTIC_CONTEXT == "relevant" else None
+
+
+def remember_question(run_context: RunContext, run_input: RunInput) -> None:
+    """Pre-hook: keep the question so the instructions can select relevant tables."""
+    if run_context.session_state is None:
+        run_context.session_state = {}
+    run_context.session_state[QUESTION_KEY] = run_input.input_content_string()
+
+
+def get_instructions(run_context: RunContext) -> str:
+    """Instructions with only the semantic model blocks relevant to the current question."""
+    if semantic_index is None:
+        return instructions
+    question = (run_context.session_state or {}).get(QUESTION_KEY, "")
+    semantic_model, business_context = semantic_index.render(question)
+    return INSTRUCTIONS_TEMPLATE.format(semantic_model=semantic_model, business_context=business_context)
+
+
 # ---------------------------------------------------------------------------
 # Create Agent
 # ---------------------------------------------------------------------------
@@ -158,7 +201,8 @@ dash = Agent(
     name="Dash",
     model=model,
     db=agent_db,
-    instructions=instructions,
+    instructions=get_instructions if semantic_index is not None else instructions,
+    pre_hooks=[remember_question] if semantic_index is not None else None,
     knowledge=dash_knowledge,
     search_knowledge=True,
     learning=LearningMachine(
@@ -0,0 +1,49 @@
+"""Analytics engine selection.
+
+Dash runs its SQL on Postgres by default. With ``DASH_ENGINE=duckdb`` it runs
+on an embedded DuckDB database instead, whose tables are views over the
+Parquet files written by ``load_data --target parquet``. The semantic model,
+validated queries, and tools are the same for both; no Postgres container is
+needed for SQL in DuckDB mode (requires ``duckdb`` and ``duckdb-engine``).
+"""
+
+from os import getenv
+from pathlib import Path
+
+from db import db_url, get_engine
+from sqlalchemy import text
+
+from .paths import PARQUET_DIR
+
+DASH_ENGINE = getenv("DASH_ENGINE", "postgres").lower()
+
+DUCKDB_PATH = PARQUET_DIR / "dash.duckdb"
+
+# Postgres functions used by the semantic model and validated queries.
+# DuckDB's strptime needs a constant format, so to_date tries the formats the
+# F1 data uses rather than translating the Postgres format string.
+DUCKDB_COMPAT_MACROS = (
+    "CREATE OR REPLACE MACRO to_date(s, fmt) AS CAST(strptime(s, ['%d %b %Y', '%Y-%m-%d', '%d/%m/%Y']) AS DATE)",
+)
+
+
+def duckdb_url(path: Path = DUCKDB_PATH) -> str:
+    return f"duckdb:///{path}"
+
+
+def analytics_db_url() -> str:
+    """Database URL Dash's SQL tools should run against."""
+    if DASH_ENGINE == "duckdb":
+        return duckdb_url()
+    return db_url
+
+
+def build_duckdb(parquet_files: dict[str, Path], path: Path = DUCKDB_PATH) -> None:
+    """Create (or update) the DuckDB database with one view per Parquet file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with get_engine(duckdb_url(path)).begin() as conn:
+        for macro in DUCKDB_COMPAT_MACROS:
+            conn.execute(text(macro))
+        for table, file in parquet_files.items():
+            source = str(file.resolve()).replace("'", "''")
+            conn.execute(text(f"CREATE OR REPLACE VIEW \"{table}\" AS SELECT * FROM read_parquet('{source}')"))
@@ -3,13 +3,16 @@
 from .business_rules import (
     BUSINESS_CONTEXT,
     build_business_context,
+    format_business_context,
     load_business_rules,
 )
+from .relevance import SemanticModelIndex
 from .semantic_model import (
     SEMANTIC_MODEL,
     SEMANTIC_MODEL_STR,
     build_semantic_model,
     format_semantic_model,
+    format_table_block,
     load_table_metadata,
 )
 
@@ -17,9 +20,12 @@ __all__ = [
     "load_table_metadata",
     "build_semantic_model",
     "format_semantic_model",
+    "format_table_block",
     "SEMANTIC_MODEL",
     "SEMANTIC_MODEL_STR",
     "load_business_rules",
     "build_business_context",
+    "format_business_context",
     "BUSINESS_CONTEXT",
+    "SemanticModelIndex",
 ]
@@ -38,12 +38,21 @@ def load_business_rules(business_dir: Path | None = None) -> dict[str, list[Any]
 
 def build_business_context(business_dir: Path | None = None) -> str:
     """Build business context string for system prompt."""
-    business = load_business_rules(business_dir)
+    return format_business_context(load_business_rules(business_dir))
+
+
+def format_business_context(business: dict[str, list[Any]], tables: set[str] | None = None) -> str:
+    """Format business context, keeping only metrics and gotchas for ``tables`` if given."""
+    metrics = business["metrics"]
+    gotchas = business["common_gotchas"]
+    if tables is not None:
+        metrics = [m for m in metrics if not m.get("table") or m["table"] in tables]
+        gotchas = [g for g in gotchas if not g.get("tables_affected") or tables & set(g["tables_affected"])]
     lines: list[str] = []
 
-    if business["metrics"]:
+    if metrics:
         lines.append("## METRICS\n")
-        for m in business["metrics"]:
+        for m in metrics:
             lines.append(f"**{m.get('name', 'Unknown')}**: {m.get('definition', '')}")
             if m.get("table"):
                 lines.append(f"  - Table: `{m['table']}`")
@@ -57,9 +66,9 @@ def build_business_context(business_dir: Path | None = None) -> str:
             lines.append(f"- {rule}")
         lines.append("")
 
-    if business["common_gotchas"]:
+    if gotchas:
         lines.append("## COMMON GOTCHAS\n")
-        for g in business["common_gotchas"]:
+        for g in gotchas:
             lines.append(f"**{g.get('issue', 'Unknown')}**")
             if g.get("tables_affected"):
                 lines.append(f"  - Tables: {', '.join(g['tables_affected'])}")
@@ -0,0 +1,111 @@
+"""Select the semantic model blocks relevant to a question.
+
+Instead of pasting every table into the system prompt, a small in-process
+index (BM25 over table names, descriptions, use cases, quality notes, and
+column names) picks the top-k tables for the question, within a token budget.
+Metrics and gotchas are filtered to the selected tables; the remaining tables
+are listed by name so Dash knows to look them up.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Any
+
+from .business_rules import format_business_context, load_business_rules
+from .semantic_model import build_semantic_model, format_table_block
+
+TOP_K = 5
+MAX_CONTEXT_TOKENS = 2000
+
+# BM25 parameters
+K1 = 1.5
+B = 0.75
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase words, with a light plural strip so 'wins' matches 'win'."""
+    return [_singular(w) for w in _WORD_RE.findall(text.lower())]
+
+
+def _singular(word: str) -> str:
+    return word[:-1] if len(word) > 3 and word.endswith("s") and not word.endswith("ss") else word
+
+
+class SemanticModelIndex:
+    """BM25 index over the semantic model's table blocks."""
+
+    def __init__(self, model: dict[str, Any], business: dict[str, list[Any]]):
+        self.tables = {t["table_name"]: t for t in model.get("tables", [])}
+        self.blocks = {name: format_table_block(t) for name, t in self.tables.items()}
+        self.business = business
+
+        self._docs: dict[str, Counter[str]] = {}
+        for name, table in self.tables.items():
+            text = " ".join(
+                [
+                    name.replace("_", " "),
+                    table.get("description", ""),
+                    *table.get("use_cases", []),
+                    *table.get("data_quality_notes", []),
+                    " ".join(c.replace("_", " ") for c in table.get("column_names", [])),
+                ]
+            )
+            # Table name words count extra: a question naming the table is a strong signal
+            self._docs[name] = Counter(tokenize(text) + tokenize(name.replace("_", " ")) * 2)
+        self._avg_len = sum(sum(d.values()) for d in self._docs.values()) / max(len(self._docs), 1)
+        df: Counter[str] = Counter()
+        for doc in self._docs.values():
+            df.update(doc.keys())
+        n = len(self._docs)
+        self._idf = {term: math.log(1 + (n - f + 0.5) / (f + 0.5)) for term, f in df.items()}
+
+    @classmethod
+    def from_knowledge(cls) -> "SemanticModelIndex":
+        return cls(build_semantic_model(), load_business_rules())
+
+    def rank(self, question: str) -> list[tuple[str, float]]:
+        """Tables scored against ``question``, best first (zero scores dropped)."""
+        terms = set(tokenize(question))
+        scores: list[tuple[str, float]] = []
+        for name, doc in self._docs.items():
+            length = sum(doc.values())
+            score = 0.0
+            for term in terms & doc.keys():
+                tf = doc[term]
+                score += self._idf[term] * tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / self._avg_len))
+            if score > 0:
+                scores.append((name, score))
+        return sorted(scores, key=lambda s: -s[1])
+
+    def select(self, question: str, top_k: int = TOP_K, max_tokens: int = MAX_CONTEXT_TOKENS) -> list[str]:
+        """Top-k relevant tables whose blocks fit in ``max_tokens``."""
+        ranked = [name for name, _ in self.rank(question)] or list(self.tables)
+        selected: list[str] = []
+        used = 0
+        for name in ranked:
+            cost = estimate_tokens(self.blocks[name])
+            if len(selected) >= top_k or (selected and used + cost > max_tokens):
+                break
+            selected.append(name)
+            used += cost
+        return selected
+
+    def render(self, question: str, top_k: int = TOP_K, max_tokens: int = MAX_CONTEXT_TOKENS) -> tuple[str, str]:
+        """Return (semantic model, business context) for ``question``."""
+        selected = self.select(question, top_k=top_k, max_tokens=max_tokens)
+        semantic_model = "\n".join(self.blocks[name] for name in selected)
+        others = [name for name in self.tables if name not in selected]
+        if others:
+            semantic_model += (
+                "\nOther tables (use `search_knowledge_base` or `introspect_schema` for details): "
+                f"{', '.join(others)}\n"
+            )
+        return semantic_model, format_business_context(self.business, tables=set(selected))
@@ -30,6 +30,7 @@ def load_table_metadata(tables_dir: Path | None = None) -> list[dict[str, Any]]:
                     "description": table.get("table_description", ""),
                     "use_cases": table.get("use_cases", []),
                     "data_quality_notes": table.get("data_quality_notes", [])[:MAX_QUALITY_NOTES],
+                    "column_names": [c["name"] for c in table.get("table_columns", []) if "name" in c],
                 }
             )
         except (json.JSONDecodeError, KeyError, OSError) as e:
@@ -43,23 +44,24 @@ def build_semantic_model(tables_dir: Path | None = None) -> dict[str, Any]:
     return {"tables": load_table_metadata(tables_dir)}
 
 
+def format_table_block(table: dict[str, Any]) -> str:
+    """Format one table's entry in the semantic model."""
+    lines = [f"### {table['table_name']}"]
+    if table.get("description"):
+        lines.append(table["description"])
+    if table.get("use_cases"):
+        lines.append(f"**Use cases:** {', '.join(table['use_cases'])}")
+    if table.get("data_quality_notes"):
+        lines.append("**Data quality:**")
+        for note in table["data_quality_notes"]:
+            lines.append(f"  - {note}")
+    lines.append("")
+    return "\n".join(lines)
+
+
 def format_semantic_model(model: dict[str, Any]) -> str:
     """Format semantic model for system prompt."""
-    lines: list[str] = []
-
-    for table in model.get("tables", []):
-        lines.append(f"### {table['table_name']}")
-        if table.get("description"):
-            lines.append(table["description"])
-        if table.get("use_cases"):
-            lines.append(f"**Use cases:** {', '.join(table['use_cases'])}")
-        if table.get("data_quality_notes"):
-            lines.append("**Data quality:**")
-            for note in table["data_quality_notes"]:
-                lines.append(f"  - {note}")
-        lines.append("")
-
-    return "\n".join(lines)
+    return "\n".join(format_table_block(table) for table in model.get("tables", []))
 
 
 SEMANTIC_MODEL = build_semantic_model()
@@ -7,3 +7,9 @@ KNOWLEDGE_DIR = DASH_DIR / "knowledge"
 TABLES_DIR = KNOWLEDGE_DIR / "tables"
 BUSINESS_DIR = KNOWLEDGE_DIR / "business"
 QUERIES_DIR = KNOWLEDGE_DIR / "queries"
+
+# Downloaded source data (gitignored)
+DATA_DIR = DASH_DIR / "data"
+
+# Columnar copies of the F1 tables and the DuckDB database over them (DASH_ENGINE=duckdb)
+PARQUET_DIR = DATA_DIR / "parquet"
@@ -1,36 +1,315 @@
 """
 Load F1 Data - Downloads F1 data (1950-2020) and loads into PostgreSQL.
 
-Usage: python -m agents.dash.scripts.load_data
+Tables are downloaded concurrently and streamed to disk, column types are
+inferred in one chunked pass, and rows are bulk loaded with COPY FROM STDIN.
+Tables whose source checksum matches the last load are skipped.
+
+With ``--target parquet`` (or ``all``) tables are also written as Parquet and
+exposed through the DuckDB database used by ``DASH_ENGINE=duckdb``.
+
+Usage:
+    python -m agents.dash.scripts.load_data
+    python -m agents.dash.scripts.load_data --force
+    python -m agents.dash.scripts.load_data --source file:///path/to/f1
+    python -m agents.dash.scripts.load_data --target parquet
 """
 
-from io import StringIO
+import argparse
+import hashlib
+import json
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import unquote, urlparse
 
 import httpx
 import pandas as pd
-from db import db_url
-from sqlalchemy import create_engine
+from db import get_engine
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from ..analytics import build_duckdb, duckdb_url
+from ..paths import DATA_DIR, PARQUET_DIR
+from ..tools import ValidatedQueryCatalog, invalidate_query_cache, invalidate_schema_cache
+from ..tools.materialized import META_SCHEMA
 
 S3_URI = "https://agno-public.s3.amazonaws.com/f1"
 
-TABLES = {
-    "constructors_championship": f"{S3_URI}/constructors_championship_1958_2020.csv",
-    "drivers_championship": f"{S3_URI}/drivers_championship_1950_2020.csv",
-    "fastest_laps": f"{S3_URI}/fastest_laps_1950_to_2020.csv",
-    "race_results": f"{S3_URI}/race_results_1950_to_2020.csv",
-    "race_wins": f"{S3_URI}/race_wins_1950_to_2020.csv",
+FILES = {
+    "constructors_championship": "constructors_championship_1958_2020.csv",
+    "drivers_championship": "drivers_championship_1950_2020.csv",
+    "fastest_laps": "fastest_laps_1950_to_2020.csv",
+    "race_results": "race_results_1950_to_2020.csv",
+    "race_wins": "race_wins_1950_to_2020.csv",
 }
 
+# Checksums of loaded sources live outside the public schema so Dash never sees them
+MANIFEST_TABLE = f"{META_SCHEMA}.load_manifest"
+PARQUET_MANIFEST = PARQUET_DIR / "manifest.json"
+
+TARGETS = {"postgres": ("postgres",), "parquet": ("parquet",), "all": ("postgres", "parquet")}
+
+# Same column types in Parquet as in Postgres, so the semantic model holds for both
+DUCKDB_TYPES = {"BOOLEAN": "BOOLEAN", "BIGINT": "BIGINT", "DOUBLE PRECISION": "DOUBLE", "TEXT": "VARCHAR"}
+
+# Materialized views in the meta schema that read a table (the validated-query catalog)
+DEPENDENT_VIEWS_SQL = """
+SELECT DISTINCT quote_ident(vn.nspname) || '.' || quote_ident(v.relname)
+FROM pg_depend d
+JOIN pg_rewrite r ON r.oid = d.objid
+JOIN pg_class v ON v.oid = r.ev_class
+JOIN pg_namespace vn ON vn.oid = v.relnamespace
+WHERE d.refobjid = to_regclass(%s) AND v.oid <> d.refobjid AND v.relkind = 'm' AND vn.nspname = %s
+"""
+
+CHUNK_BYTES = 1024 * 1024
+INFER_CHUNK_ROWS = 50_000
+
+
+@dataclass
+class LoadResult:
+    table: str
+    rows: int | None
+    skipped: bool = False
+    target: str = "postgres"
+    checksum: str | None = None
+
+
+def fetch(url: str, dest_dir: Path) -> tuple[Path, str]:
+    """Stream a source to a local file (or use it in place for file://), returning (path, sha256)."""
+    digest = hashlib.sha256()
+    parsed = urlparse(url)
+
+    if parsed.scheme == "file":
+        path = Path(unquote(parsed.path))
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_BYTES), b""):
+                digest.update(chunk)
+        return path, digest.hexdigest()
+
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    path = dest_dir / Path(parsed.path).name
+    tmp = path.with_suffix(path.suffix + ".part")
+    with httpx.stream("GET", url, timeout=30.0, follow_redirects=True) as response:
+        response.raise_for_status()
+        with open(tmp, "wb") as f:
+            for chunk in response.iter_bytes(CHUNK_BYTES):
+                digest.update(chunk)
+                f.write(chunk)
+    shutil.move(tmp, path)
+    return path, digest.hexdigest()
+
+
+def infer_column_types(path: Path) -> dict[str, str]:
+    """Infer a Postgres type per column in one chunked pass over the CSV.
+
+    Widens across chunks (BIGINT -> DOUBLE PRECISION -> TEXT) so the result
+    matches what pandas would infer reading the whole file at once.
+    """
+    rank = {"BOOLEAN": 0, "BIGINT": 1, "DOUBLE PRECISION": 2, "TEXT": 3}
+    types: dict[str, str] = {}
+
+    for chunk in pd.read_csv(path, chunksize=INFER_CHUNK_ROWS):
+        for column, dtype in chunk.dtypes.items():
+            if pd.api.types.is_bool_dtype(dtype):
+                pg_type = "BOOLEAN"
+            elif pd.api.types.is_integer_dtype(dtype):
+                pg_type = "BIGINT"
+            elif pd.api.types.is_float_dtype(dtype):
+                pg_type = "DOUBLE PRECISION"
+            else:
+                pg_type = "TEXT"
+
+            current = types.get(str(column))
+            if current is None:
+                types[str(column)] = pg_type
+            elif current != pg_type:
+                # Booleans don't widen into numbers; mixed columns become TEXT
+                widened = max(current, pg_type, key=rank.__getitem__)
+                types[str(column)] = "TEXT" if "BOOLEAN" in (current, pg_type) else widened
+
+    return types
+
+
+def loaded_checksums(engine: Engine) -> dict[str, str]:
+    """Return {table: checksum} for tables that were loaded and still exist."""
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {META_SCHEMA}"))
+        conn.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {MANIFEST_TABLE} ("
+                "table_name TEXT PRIMARY KEY, checksum TEXT NOT NULL, row_count BIGINT, "
+                "loaded_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+            )
+        )
+        rows = conn.execute(
+            text(
+                f"SELECT m.table_name, m.checksum FROM {MANIFEST_TABLE} m "
+                "WHERE to_regclass(quote_ident(m.table_name)) IS NOT NULL"
+            )
+        )
+        return {row.table_name: row.checksum for row in rows}
+
+
+def copy_table(engine: Engine, table: str, path: Path, checksum: str) -> int:
+    """Replace the rows of ``table`` with the CSV at ``path`` using COPY, in one transaction.
+
+    An existing table with the inferred columns is truncated and reloaded in
+    place, so the validated-query views over it survive. If the columns
+    changed, the table is recreated; the catalog views that depend on it are
+    dropped first and re-materialized by ``ValidatedQueryCatalog.refresh``.
+    """
+    columns = infer_column_types(path)
+    column_sql = ", ".join(f'"{name}" {pg_type}' for name, pg_type in columns.items())
+
+    raw = engine.raw_connection()
+    try:
+        with raw.cursor() as cur:
+            cur.execute(
+                "SELECT column_name, upper(data_type) FROM information_schema.columns "
+                "WHERE table_schema = current_schema() AND table_name = %s ORDER BY ordinal_position",
+                (table,),
+            )
+            existing = [tuple(row) for row in cur.fetchall()]
+            if existing == list(columns.items()):
+                cur.execute(f'TRUNCATE "{table}"')
+            else:
+                if existing:
+                    cur.execute(DEPENDENT_VIEWS_SQL, (f'"{table}"', META_SCHEMA))
+                    for (view,) in cur.fetchall():
+                        cur.execute(f"DROP MATERIALIZED VIEW IF EXISTS {view}")
+                cur.execute(f'DROP TABLE IF EXISTS "{table}"')
+                cur.execute(f'CREATE TABLE "{table}" ({column_sql})')
+            with open(path, "rb") as f:
+                with cur.copy(f'COPY "{table}" FROM STDIN WITH (FORMAT csv, HEADER true)') as copy:
+                    for chunk in iter(lambda: f.read(CHUNK_BYTES), b""):
+                        copy.write(chunk)
+            rows = cur.rowcount
+            # Refresh planner stats so introspect_schema's row estimates are accurate
+            cur.execute(f'ANALYZE "{table}"')
+            cur.execute(
+                f"INSERT INTO {MANIFEST_TABLE} (table_name, checksum, row_count) VALUES (%s, %s, %s) "
+                "ON CONFLICT (table_name) DO UPDATE SET checksum = EXCLUDED.checksum, "
+                "row_count = EXCLUDED.row_count, loaded_at = now()",
+                (table, checksum, rows),
+            )
+        raw.commit()
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
+    return rows
+
+
+def parquet_checksums() -> dict[str, str]:
+    """Return {table: checksum} for Parquet files that were written and still exist."""
+    if not PARQUET_MANIFEST.exists():
+        return {}
+    manifest = json.loads(PARQUET_MANIFEST.read_text())
+    return {table: checksum for table, checksum in manifest.items() if (PARQUET_DIR / f"{table}.parquet").exists()}
+
+
+def write_parquet(table: str, path: Path) -> int:
+    """Convert the CSV at ``path`` to ``PARQUET_DIR/<table>.parquet`` with DuckDB."""
+    columns = infer_column_types(path)
+    spec = ", ".join(f"'{_quote(name)}': '{DUCKDB_TYPES[pg_type]}'" for name, pg_type in columns.items())
+    PARQUET_DIR.mkdir(parents=True, exist_ok=True)
+    dest = PARQUET_DIR / f"{table}.parquet"
+    tmp = dest.with_suffix(".parquet.part")
+
+    with get_engine("duckdb:///:memory:").connect() as conn:
+        conn.execute(
+            text(
+                f"COPY (SELECT * FROM read_csv('{_quote(str(path))}', header = true, columns = {{{spec}}})) "
+                f"TO '{_quote(str(tmp))}' (FORMAT parquet, COMPRESSION zstd)"
+            )
+        )
+        rows = conn.execute(text(f"SELECT count(*) FROM read_parquet('{_quote(str(tmp))}')")).scalar()
+    tmp.replace(dest)
+    return rows
+
+
+def load_table(
+    table: str, url: str, targets: tuple[str, ...], previous: dict[str, dict[str, str]], force: bool
+) -> list[LoadResult]:
+    path, checksum = fetch(url, DATA_DIR / "f1")
+    results: list[LoadResult] = []
+    for target in targets:
+        if not force and previous[target].get(table) == checksum:
+            results.append(LoadResult(table=table, rows=None, skipped=True, target=target))
+        elif target == "postgres":
+            rows = copy_table(get_engine(), table, path, checksum)
+            results.append(LoadResult(table=table, rows=rows, target=target, checksum=checksum))
+        else:
+            rows = write_parquet(table, path)
+            results.append(LoadResult(table=table, rows=rows, target=target, checksum=checksum))
+    return results
+
+
+def load_data(
+    source: str = S3_URI, force: bool = False, workers: int = 5, target: str = "postgres"
+) -> list[LoadResult]:
+    """Load every F1 table from ``source`` (an http(s):// or file:// base URI) into ``target``."""
+    targets = TARGETS[target]
+    previous: dict[str, dict[str, str]] = {}
+    if "postgres" in targets:
+        previous["postgres"] = loaded_checksums(get_engine())
+    if "parquet" in targets:
+        previous["parquet"] = parquet_checksums()
+
+    tables = {table: f"{source.rstrip('/')}/{filename}" for table, filename in FILES.items()}
+    results: list[LoadResult] = []
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(load_table, t, url, targets, previous, force) for t, url in tables.items()]
+        for future in as_completed(futures):
+            for result in future.result():
+                if result.skipped:
+                    print(f"  {result.table} ({result.target}): unchanged, skipped")
+                else:
+                    print(f"  {result.table} ({result.target}): {result.rows:,} rows")
+                results.append(result)
+
+    changed = {r.target for r in results if not r.skipped}
+    if "parquet" in changed:
+        manifest = {**previous["parquet"]}
+        manifest.update({r.table: r.checksum for r in results if r.target == "parquet" and r.checksum})
+        PARQUET_MANIFEST.write_text(json.dumps(manifest, indent=2))
+        build_duckdb({table: PARQUET_DIR / f"{table}.parquet" for table in manifest})
+
+    for name in sorted(changed):
+        catalog = ValidatedQueryCatalog(engine=get_engine() if name == "postgres" else get_engine(duckdb_url()))
+        materialized = catalog.materialize_files()
+        refreshed = catalog.refresh()
+        print(f"  validated queries ({name}): {materialized} materialized, {refreshed} refreshed")
+
+    if changed:
+        invalidate_schema_cache()
+        invalidate_query_cache()
+    return results
+
+
+def _quote(value: str) -> str:
+    return value.replace("'", "''")
+
+
 if __name__ == "__main__":
-    engine = create_engine(db_url)
-    total = 0
-
-    for table, url in TABLES.items():
-        print(f"Loading {table}...", end=" ", flush=True)
-        response = httpx.get(url, timeout=30.0)
-        df = pd.read_csv(StringIO(response.text))
-        df.to_sql(table, engine, if_exists="replace", index=False)
-        print(f"{len(df):,} rows")
-        total += len(df)
-
-    print(f"\nDone! {total:,} total rows")
+    parser = argparse.ArgumentParser(description="Load F1 data into PostgreSQL")
+    parser.add_argument("--source", default=S3_URI, help="Base URI of the CSV files (http(s):// or file://)")
+    parser.add_argument("--force", action="store_true", help="Reload tables even if the source is unchanged")
+    parser.add_argument("--workers", type=int, default=5, help="Tables to download and load concurrently")
+    parser.add_argument(
+        "--target",
+        choices=sorted(TARGETS),
+        default="postgres",
+        help="Load into Postgres, write Parquet for DASH_ENGINE=duckdb, or both",
+    )
+    args = parser.parse_args()
+
+    print(f"Loading F1 data from: {args.source}\n")
+    results = load_data(source=args.source, force=args.force, workers=args.workers, target=args.target)
+    total = sum(r.rows or 0 for r in results)
+    print(f"\nDone! {total:,} rows loaded")
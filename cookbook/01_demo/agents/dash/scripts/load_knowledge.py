@@ -4,12 +4,21 @@ Load Knowledge - Loads table metadata, queries, and business rules into knowledg
 Usage:
     python -m agents.dash.scripts.load_knowledge
     python -m agents.dash.scripts.load_knowledge --recreate
+    python -m agents.dash.scripts.load_knowledge --reindex
+
+Only new or changed files are embedded; files removed from disk are deleted
+from the knowledge base. The vector index (VECTOR_INDEX in db.py) is built
+after loading, or rebuilt with --reindex after changing its parameters.
 """
 
 import argparse
 
+from knowledge_sync import reset_manifest, sync_knowledge
+
 from ..paths import KNOWLEDGE_DIR
 
+SUBDIRS = ["tables", "queries", "business"]
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Load knowledge into vector database")
     parser.add_argument(
@@ -17,6 +26,11 @@ if __name__ == "__main__":
         action="store_true",
         help="Drop existing knowledge and reload from scratch",
     )
+    parser.add_argument(
+        "--reindex",
+        action="store_true",
+        help="Rebuild the vector index (e.g. after changing VECTOR_INDEX or its parameters)",
+    )
     args = parser.parse_args()
 
     from ..agent import dash_knowledge
@@ -26,19 +40,23 @@ if __name__ == "__main__":
         if dash_knowledge.vector_db:
             dash_knowledge.vector_db.drop()
             dash_knowledge.vector_db.create()
+        reset_manifest(dash_knowledge)
 
     print(f"Loading knowledge from: {KNOWLEDGE_DIR}\n")
 
-    for subdir in ["tables", "queries", "business"]:
-        path = KNOWLEDGE_DIR / subdir
+    directories = {subdir: KNOWLEDGE_DIR / subdir for subdir in SUBDIRS}
+    for subdir, path in directories.items():
         if not path.exists():
             print(f"  {subdir}/: (not found)")
-            continue
 
-        files = [f for f in path.iterdir() if f.is_file() and not f.name.startswith(".")]
-        print(f"  {subdir}/: {len(files)} files")
+    result = sync_knowledge(dash_knowledge, directories, legacy_names=[f"knowledge-{subdir}" for subdir in SUBDIRS])
+    print(f"  added: {len(result.added)}")
+    print(f"  updated: {len(result.updated)}")
+    print(f"  removed: {len(result.removed)}")
+    print(f"  unchanged: {len(result.unchanged)}")
 
-        if files:
-            dash_knowledge.insert(name=f"knowledge-{subdir}", path=str(path))
+    if dash_knowledge.vector_db:
+        # Build the ANN index once the vectors are in; a no-op if it already exists
+        dash_knowledge.vector_db.optimize(force_recreate=args.reindex)
 
     print("\nDone!")
@@ -0,0 +1,31 @@
+"""
+Refresh Views - Refreshes Dash's materialized validated queries.
+
+Run after changing data outside load_data, or on a schedule (e.g. cron).
+Uses the same analytics database as the agent: Postgres, or DuckDB with
+``DASH_ENGINE=duckdb``.
+
+Usage:
+    python -m agents.dash.scripts.refresh_views
+    python -m agents.dash.scripts.refresh_views --rebuild
+"""
+
+import argparse
+
+from ..analytics import analytics_db_url
+from ..tools import ValidatedQueryCatalog, invalidate_query_cache
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh materialized validated queries")
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Recreate views from knowledge/queries/*.sql before refreshing",
+    )
+    args = parser.parse_args()
+
+    catalog = ValidatedQueryCatalog(analytics_db_url())
+    if args.rebuild:
+        print(f"Materialized {catalog.materialize_files()} validated queries")
+    print(f"Refreshed {catalog.refresh()} views")
+    invalidate_query_cache()
@@ -1,9 +1,15 @@
 """Dash Tools."""
 
-from .introspect import create_introspect_schema_tool
+from .introspect import create_introspect_schema_tool, invalidate_schema_cache
+from .materialized import ValidatedQueryCatalog
 from .save_query import create_save_validated_query_tool
+from .sql_cache import CachedSQLTools, invalidate_query_cache
 
 __all__ = [
     "create_introspect_schema_tool",
     "create_save_validated_query_tool",
+    "invalidate_schema_cache",
+    "CachedSQLTools",
+    "invalidate_query_cache",
+    "ValidatedQueryCatalog",
 ]
@@ -1,20 +1,203 @@
-"""Runtime schema inspection (Layer 6)."""
+"""Runtime schema inspection (Layer 6).
+
+Schema metadata (columns, primary keys, foreign keys, row estimates) is read
+once into a cached snapshot. On Postgres the snapshot comes from a single
+catalog query and row counts from ``pg_class.reltuples``. It is refreshed when
+``invalidate_schema_cache`` is called or the catalog fingerprint changes. The
+fingerprint covers table OIDs, ``xmin`` and ``reltuples``, so it catches DDL,
+reloads and ANALYZE.
+"""
+
+import json
+import threading
+import time
+from typing import Any
 
 from agno.tools import tool
 from agno.utils.log import logger
-from sqlalchemy import create_engine, inspect, text
+from db import get_engine
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import DatabaseError, OperationalError
 
+# Seconds a snapshot is trusted without checking the catalog fingerprint
+SCHEMA_CHECK_INTERVAL = 5.0
+
+# Seconds a snapshot lives on databases without a catalog fingerprint
+SCHEMA_TTL = 300.0
+
+PG_SCHEMA_QUERY = text(
+    """
+    SELECT
+        c.relname AS table_name,
+        c.reltuples::bigint AS row_estimate,
+        (
+            SELECT json_agg(
+                json_build_array(a.attname, format_type(a.atttypid, a.atttypmod), NOT a.attnotnull)
+                ORDER BY a.attnum
+            )
+            FROM pg_attribute a
+            WHERE a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+        ) AS columns,
+        (
+            SELECT json_agg(
+                json_build_object(
+                    'type', con.contype,
+                    'columns', (
+                        SELECT json_agg(att.attname ORDER BY k.ord)
+                        FROM unnest(con.conkey) WITH ORDINALITY AS k(attnum, ord)
+                        JOIN pg_attribute att ON att.attrelid = con.conrelid AND att.attnum = k.attnum
+                    ),
+                    'ref_table', ref.relname,
+                    'ref_columns', (
+                        SELECT json_agg(att.attname ORDER BY k.ord)
+                        FROM unnest(con.confkey) WITH ORDINALITY AS k(attnum, ord)
+                        JOIN pg_attribute att ON att.attrelid = con.confrelid AND att.attnum = k.attnum
+                    )
+                )
+            )
+            FROM pg_constraint con
+            LEFT JOIN pg_class ref ON ref.oid = con.confrelid
+            WHERE con.conrelid = c.oid AND con.contype IN ('p', 'f')
+        ) AS constraints
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = current_schema() AND c.relkind IN ('r', 'p')
+    ORDER BY c.relname
+    """
+)
+
+# Changes whenever a table in the schema is created, dropped, altered, or analyzed.
+# ANALYZE and autovacuum update reltuples in place without a new xmin, so
+# reltuples is part of the fingerprint.
+PG_FINGERPRINT_QUERY = text(
+    """
+    SELECT md5(coalesce(
+        string_agg(c.oid::text || ':' || c.xmin::text || ':' || c.reltuples::bigint::text, ',' ORDER BY c.oid), ''
+    ))
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = current_schema() AND c.relkind IN ('r', 'p')
+    """
+)
+
+
+class SchemaCache:
+    """Cached schema snapshot for one engine."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self._tables: dict[str, dict[str, Any]] | None = None
+        self._fingerprint: str | None = None
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._tables = None
+
+    def tables(self) -> dict[str, dict[str, Any]]:
+        """Return the snapshot, reloading it if the schema changed."""
+        with self._lock:
+            if self._tables is None or self._is_stale():
+                self._tables = self._load()
+                self._loaded_at = self._checked_at = time.monotonic()
+            return self._tables
+
+    def _is_stale(self) -> bool:
+        now = time.monotonic()
+        if self.engine.dialect.name != "postgresql":
+            return now - self._loaded_at > SCHEMA_TTL
+        if now - self._checked_at < SCHEMA_CHECK_INTERVAL:
+            return False
+        self._checked_at = now
+        with self.engine.connect() as conn:
+            return conn.execute(PG_FINGERPRINT_QUERY).scalar() != self._fingerprint
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self.engine.dialect.name == "postgresql":
+            return self._load_postgres()
+        return self._load_generic()
+
+    def _load_postgres(self) -> dict[str, dict[str, Any]]:
+        tables: dict[str, dict[str, Any]] = {}
+        with self.engine.connect() as conn:
+            self._fingerprint = conn.execute(PG_FINGERPRINT_QUERY).scalar()
+            for row in conn.execute(PG_SCHEMA_QUERY).mappings():
+                columns = _json(row["columns"]) or []
+                constraints = _json(row["constraints"]) or []
+                pk = next((c["columns"] for c in constraints if c["type"] == "p"), [])
+                tables[row["table_name"]] = {
+                    "columns": [{"name": n, "type": t, "nullable": nullable} for n, t, nullable in columns],
+                    "primary_key": pk or [],
+                    "foreign_keys": [
+                        {
+                            "columns": c["columns"] or [],
+                            "ref_table": c["ref_table"],
+                            "ref_columns": c["ref_columns"] or [],
+                        }
+                        for c in constraints
+                        if c["type"] == "f"
+                    ],
+                    # -1 means never vacuumed/analyzed
+                    "row_estimate": row["row_estimate"] if row["row_estimate"] >= 0 else None,
+                }
+        return tables
+
+    def _load_generic(self) -> dict[str, dict[str, Any]]:
+        insp = inspect(self.engine)
+        tables: dict[str, dict[str, Any]] = {}
+        # DuckDB exposes Parquet-backed tables as views
+        for t in [*insp.get_table_names(), *insp.get_view_names()]:
+            pk = insp.get_pk_constraint(t) or {}
+            tables[t] = {
+                "columns": [
+                    {"name": c["name"], "type": str(c["type"]), "nullable": c.get("nullable", True)}
+                    for c in insp.get_columns(t)
+                ],
+                "primary_key": pk.get("constrained_columns") or [],
+                "foreign_keys": [
+                    {
+                        "columns": fk.get("constrained_columns") or [],
+                        "ref_table": fk.get("referred_table"),
+                        "ref_columns": fk.get("referred_columns") or [],
+                    }
+                    for fk in insp.get_foreign_keys(t)
+                ],
+                "row_estimate": None,
+            }
+        return tables
+
+
+_schema_caches: dict[str, SchemaCache] = {}
+
+
+def get_schema_cache(engine: Engine) -> SchemaCache:
+    """Return the process-wide schema cache for an engine's database."""
+    key = str(engine.url)
+    if key not in _schema_caches:
+        _schema_caches[key] = SchemaCache(engine)
+    return _schema_caches[key]
+
+
+def invalidate_schema_cache() -> None:
+    """Drop all cached schema snapshots (call after loading or altering tables)."""
+    for cache in _schema_caches.values():
+        cache.invalidate()
+
 
 def create_introspect_schema_tool(db_url: str):
     """Create introspect_schema tool with database connection."""
-    engine = create_engine(db_url)
+    engine = get_engine(db_url)
+    schema = get_schema_cache(engine)
 
     @tool
     def introspect_schema(
         table_name: str | None = None,
         include_sample_data: bool = False,
         sample_limit: int = 5,
+        exact_counts: bool = False,
     ) -> str:
         """Inspect database schema at runtime.
 
@@ -22,32 +205,33 @@ def create_introspect_schema_tool(db_url: str):
             table_name: Table to inspect. If None, lists all tables.
             include_sample_data: Include sample rows.
             sample_limit: Number of sample rows.
+            exact_counts: Count rows exactly (full scan) instead of using estimates.
         """
         try:
-            insp = inspect(engine)
+            snapshot = schema.tables()
 
             if table_name is None:
-                tables = insp.get_table_names()
-                if not tables:
+                if not snapshot:
                     return "No tables found."
 
+                counts = _exact_counts(engine, sorted(snapshot)) if exact_counts else {}
                 lines = ["## Tables", ""]
-                for t in sorted(tables):
-                    try:
-                        with engine.connect() as conn:
-                            count = conn.execute(text(f'SELECT COUNT(*) FROM "{t}"')).scalar()
-                            lines.append(f"- **{t}** ({count:,} rows)")
-                    except (OperationalError, DatabaseError):
+                for t in sorted(snapshot):
+                    if t in counts:
+                        lines.append(f"- **{t}** ({counts[t]:,} rows)")
+                    elif snapshot[t]["row_estimate"] is not None:
+                        lines.append(f"- **{t}** (~{snapshot[t]['row_estimate']:,} rows)")
+                    else:
                         lines.append(f"- **{t}**")
                 return "\n".join(lines)
 
-            tables = insp.get_table_names()
-            if table_name not in tables:
-                return f"Table '{table_name}' not found. Available: {', '.join(sorted(tables))}"
+            if table_name not in snapshot:
+                return f"Table '{table_name}' not found. Available: {', '.join(sorted(snapshot))}"
 
+            table = snapshot[table_name]
             lines = [f"## {table_name}", ""]
 
-            cols = insp.get_columns(table_name)
+            cols = table["columns"]
             if cols:
                 lines.extend(
                     [
@@ -58,13 +242,18 @@ def create_introspect_schema_tool(db_url: str):
                     ]
                 )
                 for c in cols:
-                    nullable = "Yes" if c.get("nullable", True) else "No"
+                    nullable = "Yes" if c["nullable"] else "No"
                     lines.append(f"| {c['name']} | {c['type']} | {nullable} |")
                 lines.append("")
 
-            pk = insp.get_pk_constraint(table_name)
-            if pk and pk.get("constrained_columns"):
-                lines.append(f"**Primary Key:** {', '.join(pk['constrained_columns'])}")
+            if table["primary_key"]:
+                lines.append(f"**Primary Key:** {', '.join(table['primary_key'])}")
+                lines.append("")
+
+            if table["foreign_keys"]:
+                lines.append("**Foreign Keys:**")
+                for fk in table["foreign_keys"]:
+                    lines.append(f"  - {', '.join(fk['columns'])} -> {fk['ref_table']}({', '.join(fk['ref_columns'])})")
                 lines.append("")
 
             if include_sample_data:
@@ -95,3 +284,20 @@ def create_introspect_schema_tool(db_url: str):
             return f"Error: {e}"
 
     return introspect_schema
+
+
+def _exact_counts(engine: Engine, tables: list[str]) -> dict[str, int]:
+    """Count rows in each table over a single connection."""
+    counts: dict[str, int] = {}
+    with engine.connect() as conn:
+        for t in tables:
+            try:
+                counts[t] = conn.execute(text(f'SELECT COUNT(*) FROM "{t}"')).scalar() or 0
+            except (OperationalError, DatabaseError):
+                conn.rollback()
+    return counts
+
+
+def _json(value: Any) -> Any:
+    """Decode a json column (psycopg already decodes, other drivers may not)."""
+    return json.loads(value) if isinstance(value, str) else value
@@ -0,0 +1,200 @@
+"""Materialized validated queries.
+
+Validated queries (from `knowledge/queries/*.sql` and `save_validated_query`)
+are stored as materialized views in the `dash_meta` schema and tracked in a
+catalog keyed by their normalized SQL. When Dash issues a query equal to a
+validated one, `CachedSQLTools` reads the precomputed result instead.
+Views are refreshed by the data loader or `scripts/refresh_views.py`.
+DuckDB has no materialized views, so there the results are stored as tables
+and refreshing re-runs the query.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from pathlib import Path
+
+from agno.utils.log import logger
+from db import get_engine
+from sql_guard import is_read_only, normalize_sql
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DatabaseError
+
+from ..paths import QUERIES_DIR
+
+# Schema for Dash's bookkeeping tables; outside the public schema Dash queries
+META_SCHEMA = "dash_meta"
+CATALOG_TABLE = f"{META_SCHEMA}.validated_queries"
+
+# Column added to every view to keep the validated query's row order
+ORDER_COLUMN = "_dash_ord"
+
+# Seconds between catalog reloads (picks up views created by other processes)
+CATALOG_RELOAD_INTERVAL = 30.0
+
+_QUERY_BLOCK_RE = re.compile(
+    r"<query name>(?P<name>.*?)</query name>.*?-- <query>\s*\n(?P<sql>.*?)-- </query>",
+    re.DOTALL,
+)
+
+
+def parse_query_file(path: Path) -> list[tuple[str, str]]:
+    """Parse (name, sql) pairs from a validated-queries .sql file."""
+    content = path.read_text()
+    return [(m.group("name").strip(), m.group("sql").strip()) for m in _QUERY_BLOCK_RE.finditer(content)]
+
+
+def query_hash(sql: str) -> str:
+    return hashlib.sha256(normalize_sql(sql).encode()).hexdigest()
+
+
+def view_name(name: str) -> str:
+    """Postgres-safe view name for a validated query.
+
+    The slug is lossy ("Driver Wins (2019)" and "driver-wins-2019" share one),
+    so a hash of the exact name keeps each query's view distinct.
+    """
+    slug = re.sub(r"[^a-z0-9_]+", "_", name.lower()).strip("_")[:40]
+    return f"mv_{slug}_{hashlib.sha1(name.encode()).hexdigest()[:12]}"
+
+
+class ValidatedQueryCatalog:
+    """Materializes validated queries and matches agent queries against them."""
+
+    def __init__(self, db_url: str | None = None, engine: Engine | None = None):
+        if engine is None:
+            if db_url is None:
+                raise ValueError("db_url or engine is required")
+            engine = get_engine(db_url)
+        self.engine = engine
+        self._materialized_views = engine.dialect.name == "postgresql"
+        self._views: dict[str, str] = {}
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def ensure_catalog(self) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {META_SCHEMA}"))
+            conn.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {CATALOG_TABLE} ("
+                    "name TEXT PRIMARY KEY, query_hash TEXT NOT NULL, query TEXT NOT NULL, "
+                    "view_name TEXT NOT NULL, columns TEXT NOT NULL, "
+                    "refreshed_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+                )
+            )
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS validated_queries_hash_idx ON {CATALOG_TABLE} (query_hash)"))
+
+    def materialize(self, name: str, sql: str) -> str:
+        """Create (or replace) the materialized view for a validated query. Returns its select SQL."""
+        if not is_read_only(sql):
+            raise ValueError(f"Validated query '{name}' is not read-only")
+
+        self.ensure_catalog()
+        view = f'{META_SCHEMA}."{view_name(name)}"'
+        body = sql.strip().rstrip(";")
+
+        with self.engine.begin() as conn:
+            previous = conn.execute(
+                text(f"SELECT view_name FROM {CATALOG_TABLE} WHERE name = :name"), {"name": name}
+            ).scalar()
+            for stale in {view, previous} - {None}:
+                conn.execute(text(self._drop_sql(stale)))
+            conn.execute(text(self._create_sql(view, body)))
+            columns = [c for c in conn.execute(text(f"SELECT * FROM {view} LIMIT 0")).keys() if c != ORDER_COLUMN]
+            conn.execute(
+                text(
+                    f"INSERT INTO {CATALOG_TABLE} (name, query_hash, query, view_name, columns) "
+                    "VALUES (:name, :hash, :query, :view, :columns) "
+                    "ON CONFLICT (name) DO UPDATE SET query_hash = EXCLUDED.query_hash, query = EXCLUDED.query, "
+                    "view_name = EXCLUDED.view_name, columns = EXCLUDED.columns, refreshed_at = now()"
+                ),
+                {"name": name, "hash": query_hash(sql), "query": sql, "view": view, "columns": json.dumps(columns)},
+            )
+
+        select_sql = _select_sql(view, columns)
+        with self._lock:
+            self._views[query_hash(sql)] = select_sql
+        return select_sql
+
+    def materialize_files(self, queries_dir: Path | None = None) -> int:
+        """Materialize every query in the validated-queries .sql files. Returns the count."""
+        queries_dir = queries_dir or QUERIES_DIR
+        count = 0
+        for path in sorted(queries_dir.glob("*.sql")):
+            for name, sql in parse_query_file(path):
+                try:
+                    self.materialize(name, sql)
+                    count += 1
+                except (DatabaseError, ValueError) as e:
+                    logger.warning(f"Could not materialize validated query '{name}': {e}")
+        return count
+
+    def refresh(self) -> int:
+        """Refresh every cataloged view, recreating any that were dropped. Returns the number refreshed."""
+        self.ensure_catalog()
+        with self.engine.connect() as conn:
+            rows = conn.execute(text(f"SELECT name, view_name, query FROM {CATALOG_TABLE}")).fetchall()
+
+        refreshed = 0
+        for row in rows:
+            try:
+                if self._materialized_views and not self._view_exists(row.view_name):
+                    # Dropped when a table it reads was recreated by load_data
+                    self.materialize(row.name, row.query)
+                    refreshed += 1
+                    continue
+                with self.engine.begin() as conn:
+                    if self._materialized_views:
+                        conn.execute(text(f"REFRESH MATERIALIZED VIEW {row.view_name}"))
+                    else:
+                        conn.execute(text(self._create_sql(row.view_name, row.query.strip().rstrip(";"))))
+                    conn.execute(
+                        text(f"UPDATE {CATALOG_TABLE} SET refreshed_at = now() WHERE name = :name"),
+                        {"name": row.name},
+                    )
+                refreshed += 1
+            except (DatabaseError, ValueError) as e:
+                logger.warning(f"Could not refresh validated query '{row.name}': {e}")
+        return refreshed
+
+    def _view_exists(self, view: str) -> bool:
+        with self.engine.connect() as conn:
+            return conn.execute(text("SELECT to_regclass(:view)"), {"view": view}).scalar() is not None
+
+    def _drop_sql(self, view: str) -> str:
+        if self._materialized_views:
+            return f"DROP MATERIALIZED VIEW IF EXISTS {view}"
+        return f"DROP TABLE IF EXISTS {view}"
+
+    def _create_sql(self, view: str, body: str) -> str:
+        select = f"SELECT q.*, row_number() OVER () AS {ORDER_COLUMN} FROM (\n{body}\n) q"
+        if self._materialized_views:
+            return f"CREATE MATERIALIZED VIEW {view} AS {select} WITH DATA"
+        return f"CREATE OR REPLACE TABLE {view} AS {select}"
+
+    def match(self, sql: str) -> str | None:
+        """Return SQL that reads the precomputed result if ``sql`` equals a validated query."""
+        self._maybe_reload()
+        return self._views.get(query_hash(sql))
+
+    def _maybe_reload(self) -> None:
+        with self._lock:
+            if time.monotonic() - self._loaded_at < CATALOG_RELOAD_INTERVAL:
+                return
+            self._loaded_at = time.monotonic()
+            try:
+                with self.engine.connect() as conn:
+                    rows = conn.execute(text(f"SELECT query_hash, view_name, columns FROM {CATALOG_TABLE}")).fetchall()
+            except DatabaseError:
+                # Catalog not created yet
+                return
+            self._views = {row.query_hash: _select_sql(row.view_name, json.loads(row.columns)) for row in rows}
+
+
+def _select_sql(view: str, columns: list[str]) -> str:
+    column_sql = ", ".join('"' + c.replace('"', '""') + '"' for c in columns)
+    return f"SELECT {column_sql} FROM {view} ORDER BY {ORDER_COLUMN}"
@@ -6,10 +6,13 @@ from agno.knowledge import Knowledge
 from agno.knowledge.reader.text_reader import TextReader
 from agno.tools import tool
 from agno.utils.log import logger
+from sqlalchemy.exc import DatabaseError
 
+from .materialized import ValidatedQueryCatalog
 
-def create_save_validated_query_tool(knowledge: Knowledge):
-    """Create save_validated_query tool with knowledge injected."""
+
+def create_save_validated_query_tool(knowledge: Knowledge, catalog: ValidatedQueryCatalog | None = None):
+    """Create save_validated_query tool with knowledge (and optionally a view catalog) injected."""
 
     @tool
     def save_validated_query(
@@ -74,9 +77,17 @@ def create_save_validated_query_tool(knowledge: Knowledge):
                 reader=TextReader(),
                 skip_if_exists=True,
             )
-            return f"Saved query '{name}' to knowledge base."
         except (AttributeError, TypeError, ValueError, OSError) as e:
             logger.error(f"Failed to save query: {e}")
             return f"Error: {e}"
 
+        if catalog is not None:
+            try:
+                catalog.materialize(name.strip(), query)
+            except (DatabaseError, ValueError) as e:
+                # The query is still saved; it just won't be precomputed
+                logger.warning(f"Failed to materialize query '{name}': {e}")
+
+        return f"Saved query '{name}' to knowledge base."
+
     return save_validated_query
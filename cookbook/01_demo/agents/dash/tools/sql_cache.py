@@ -0,0 +1,160 @@
+"""Result cache for Dash's SQL tools.
+
+Read-only queries are cached by their normalized SQL plus the current data
+version, so repeated questions (validated queries, quick prompts) skip the
+database. Queries matching a materialized validated query read its view.
+Entries expire after a TTL, are evicted LRU-first past a byte budget, and are
+dropped by `invalidate_query_cache` when data is reloaded.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from agno.utils.log import logger
+from sql_guard import GuardedSQLTools, is_read_only, normalize_sql
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DatabaseError, OperationalError
+
+from .materialized import ValidatedQueryCatalog
+
+# Changes when tables are created/dropped/analyzed or rows are written
+PG_DATA_VERSION_QUERY = text(
+    """
+    SELECT md5(
+        coalesce(string_agg(c.oid::text || ':' || c.xmin::text, ',' ORDER BY c.oid), '')
+        || ':' || coalesce((SELECT sum(n_tup_ins + n_tup_upd + n_tup_del) FROM pg_stat_user_tables), 0)::text
+    )
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = current_schema() AND c.relkind IN ('r', 'p', 'm')
+    """
+)
+
+
+@dataclass
+class _Entry:
+    value: str
+    size: int
+    expires_at: float
+
+
+class QueryResultCache:
+    """Thread-safe LRU of query results with a TTL and a byte budget."""
+
+    def __init__(self, ttl: float = 3600.0, max_bytes: int = 16 * 1024 * 1024):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at < time.monotonic():
+                if entry is not None:
+                    self._pop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(self, key: str, value: str) -> None:
+        size = len(value.encode())
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = _Entry(value=value, size=size, expires_at=time.monotonic() + self.ttl)
+            self._size += size
+            while self._size > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _pop(self, key: str) -> None:
+        self._size -= self._entries.pop(key).size
+
+
+# Shared by every CachedSQLTools in the process
+query_cache = QueryResultCache()
+
+
+def invalidate_query_cache() -> None:
+    """Drop all cached query results (call after loading or changing data)."""
+    query_cache.clear()
+
+
+def data_version(engine: Engine) -> str:
+    """Return a tag that changes whenever the data behind cached results may have changed."""
+    if engine.dialect.name == "duckdb" and engine.url.database not in (None, "", ":memory:"):
+        # Reloads rewrite the database file (or its write-ahead log until checkpoint)
+        files = (engine.url.database, f"{engine.url.database}.wal")
+        return str(max((os.stat(f).st_mtime_ns for f in files if os.path.exists(f)), default=0))
+    if engine.dialect.name != "postgresql":
+        # No cheap change detection; rely on the TTL and explicit invalidation
+        return "static"
+    with engine.connect() as conn:
+        return conn.execute(PG_DATA_VERSION_QUERY).scalar() or ""
+
+
+class CachedSQLTools(GuardedSQLTools):
+    """Guarded SQLTools whose `run_sql_query` serves repeated read-only queries from `query_cache`."""
+
+    def __init__(
+        self,
+        *args: Any,
+        cache: QueryResultCache | None = None,
+        catalog: ValidatedQueryCatalog | None = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.cache = cache if cache is not None else query_cache
+        self.catalog = catalog
+
+    def run_sql_query(self, query: str, limit: int | None = 10) -> str:
+        """Use this function to run a SQL query and return the result.
+
+        Args:
+            query (str): The query to run.
+            limit (int, optional): The number of rows to return. Defaults to 10. Use `None` to show all results.
+        Returns:
+            str: Result of the SQL query.
+        Notes:
+            - The result may be empty if the query does not return any data.
+        """
+        if not is_read_only(query):
+            return super().run_sql_query(query, limit=limit)
+
+        if self.catalog is not None:
+            # Read the precomputed result when this is a validated query
+            query = self.catalog.match(query) or query
+
+        try:
+            version = data_version(self.db_engine)
+        except (OperationalError, DatabaseError) as e:
+            logger.warning(f"Could not read data version, bypassing query cache: {e}")
+            return super().run_sql_query(query, limit=limit)
+
+        key = hashlib.sha256(f"{version}\x00{limit}\x00{normalize_sql(query)}".encode()).hexdigest()
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = super().run_sql_query(query, limit=limit)
+        if not result.startswith("Error"):
+            self.cache.put(key, result)
+        return result
@@ -23,6 +23,7 @@ from agno.learn import (
 from agno.tools.coding import CodingTools
 from agno.tools.reasoning import ReasoningTools
 from db import create_knowledge, get_postgres_db
+from recall import create_recall_tool
 
 from cookbook_config import model
 
@@ -37,6 +38,8 @@ WORKSPACE.mkdir(exist_ok=True)
 gcode_knowledge = create_knowledge("Gcode Knowledge", "gcode_knowledge")
 gcode_learnings = create_knowledge("Gcode Learnings", "gcode_learnings")
 
+recall = create_recall_tool(gcode_knowledge, gcode_learnings)
+
 # ---------------------------------------------------------------------------
 # Instructions
 # ---------------------------------------------------------------------------
@@ -55,7 +58,7 @@ and edit live there. Use relative paths (e.g. "app.py", "src/main.py").
 ## Coding Workflow
 
 ### 0. Recall
-- Run `search_knowledge_base` and `search_learnings` FIRST -- you may already know
+- Run `recall` FIRST (searches knowledge and learnings together) -- you may already know
   this project's conventions, gotchas, test setup, or past fixes.
 - Check what projects already exist in the workspace with `ls`.
 
@@ -160,7 +163,7 @@ gcode = Agent(
         knowledge=gcode_learnings,
         learned_knowledge=LearnedKnowledgeConfig(mode=LearningMode.AGENTIC),
     ),
-    tools=[CodingTools(base_dir=WORKSPACE, all=True), ReasoningTools()],
+    tools=[recall, CodingTools(base_dir=WORKSPACE, all=True), ReasoningTools()],
     enable_agentic_memory=True,
     add_datetime_to_context=True,
     add_history_to_context=True,
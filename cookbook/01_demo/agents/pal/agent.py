@@ -23,8 +23,9 @@ from agno.learn import (
     LearningMode,
 )
 from agno.tools.mcp import MCPTools
-from agno.tools.sql import SQLTools
 from db import create_knowledge, db_url, get_postgres_db
+from recall import create_recall_tool
+from sql_guard import GuardedSQLTools
 
 from cookbook_config import model
 
@@ -41,6 +42,8 @@ EXA_MCP_URL = f"https://mcp.exa.ai/mcp?exaApiKey={EXA_API_KEY}&tools=web_search_
 pal_knowledge = create_knowledge("Pal Knowledge", "pal_knowledge")
 pal_learnings = create_knowledge("Pal Learnings", "pal_learnings")
 
+recall = create_recall_tool(pal_knowledge, pal_learnings)
+
 # ---------------------------------------------------------------------------
 # Instructions
 # ---------------------------------------------------------------------------
@@ -79,7 +82,7 @@ of the user and how to serve them better.
 ## Workflow
 
 ### 0. Recall
-- Run `search_learnings` FIRST -- you may already know the user's preferences,
+- Run `recall` FIRST (searches knowledge and learnings together) -- you may already know the user's preferences,
   what tables exist, and what schemas you've created.
 - This is critical. Without it, you'll recreate tables that already exist
   or miss context that changes your answer entirely.
@@ -254,7 +257,8 @@ pal = Agent(
     ),
     # Tools
     tools=[
-        SQLTools(db_url=db_url),
+        recall,
+        GuardedSQLTools(db_url=db_url),
         MCPTools(url=EXA_MCP_URL),
     ],
     enable_agentic_memory=True,
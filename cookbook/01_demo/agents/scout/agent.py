@@ -16,13 +16,16 @@ from agno.learn import (
 )
 from agno.tools.mcp import MCPTools
 from db import create_knowledge, get_postgres_db
+from recall import create_recall_tool
 
 from cookbook_config import model
 
+from .connectors import ContentCache
 from .context.intent_routing import INTENT_ROUTING_CONTEXT
 from .context.source_registry import SOURCE_REGISTRY_STR
 from .tools import (
     S3Tools,
+    create_federated_search_tool,
     create_get_metadata_tool,
     create_list_sources_tool,
     create_save_intent_discovery_tool,
@@ -44,16 +47,24 @@ scout_learnings = create_knowledge("Scout Learnings", "scout_learnings")
 # Tools
 # ---------------------------------------------------------------------------
 
+# Shared across S3Tools and get_metadata, so repeated reads skip the source
+content_cache = ContentCache(max_bytes=32 * 1024 * 1024)
+
 list_sources = create_list_sources_tool()
-get_metadata = create_get_metadata_tool()
+get_metadata = create_get_metadata_tool(cache=content_cache)
+federated_search = create_federated_search_tool(cache=content_cache)
 save_intent_discovery = create_save_intent_discovery_tool(scout_knowledge)
+recall = create_recall_tool(scout_knowledge, scout_learnings)
 
 base_tools: list = [
     # Primary connector (S3)
-    S3Tools(),
+    S3Tools(cache=content_cache),
     # Awareness tools
     list_sources,
     get_metadata,
+    # Search across every source at once
+    federated_search,
+    recall,
     # Learning tools
     save_intent_discovery,
     # External search
@@ -91,9 +102,10 @@ Your goal: make the user feel like they have someone who's worked at this compan
 
 ## Workflow
 
-1. Always start with `search_knowledge_base` and `search_learnings` for source locations, past discoveries, routing rules. Context that will help you navigate straight to the answer.
+1. Always start with `recall` (knowledge and learnings in one call) for source locations, past discoveries,
+   routing rules. Context that will help you navigate straight to the answer.
 2. Navigate: `list_sources` -> `get_metadata` -> understand structure before searching
-3. Search with context: grep-like search returns matches with surrounding lines
+3. Search with context: grep-like search returns matches with surrounding lines (`federated_search` if source unknown)
 4. Read full documents: never answer from snippets alone
 5. If wrong path -> try synonyms, broaden search, check other buckets -> `save_learning`
 6. Provide **answers**, not just file paths, with the source location included.
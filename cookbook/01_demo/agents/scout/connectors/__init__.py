@@ -1,9 +1,11 @@
 """Scout Connectors for enterprise knowledge sources."""
 
-from .base import BaseConnector
+from .base import BaseConnector, CachedConnector, ContentCache
 from .s3 import S3Connector
 
 __all__ = [
     "BaseConnector",
+    "CachedConnector",
+    "ContentCache",
     "S3Connector",
 ]
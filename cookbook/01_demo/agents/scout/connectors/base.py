@@ -1,7 +1,12 @@
 """Base connector interface for all knowledge sources."""
 
+import asyncio
+import json
+import threading
 from abc import ABC, abstractmethod
-from typing import Any
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
 
 
 class BaseConnector(ABC):
@@ -26,6 +31,19 @@ class BaseConnector(ABC):
             True if authentication successful, False otherwise.
         """
 
+    def get_version(self, item_id: str | None = None) -> str | None:
+        """
+        Return a cheap version tag (ETag, modified time) for an item or container.
+
+        Used by `CachedConnector` to validate cached entries without refetching
+        content. Connectors that can't provide one return None, and cached
+        entries are then trusted until evicted or invalidated by a write.
+
+        Args:
+            item_id: Item or container ID. None means the whole source.
+        """
+        return None
+
     @abstractmethod
     def list_items(
         self,
@@ -120,3 +138,332 @@ class BaseConnector(ABC):
         Returns:
             Dictionary with updated item info.
         """
+
+    # -----------------------------------------------------------------------
+    # Async counterparts
+    #
+    # Default implementations run the sync method in a worker thread so every
+    # connector is usable from async agents. Connectors with a native async
+    # client should override these.
+    # -----------------------------------------------------------------------
+
+    async def aget_version(self, item_id: str | None = None) -> str | None:
+        """Async version of `get_version`."""
+        return await asyncio.to_thread(self.get_version, item_id)
+
+    async def alist_items(
+        self,
+        parent_id: str | None = None,
+        item_type: str | None = None,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        """Async version of `list_items`."""
+        return await asyncio.to_thread(self.list_items, parent_id, item_type, limit)
+
+    async def asearch(
+        self,
+        query: str,
+        filters: dict[str, Any] | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """Async version of `search`."""
+        return await asyncio.to_thread(self.search, query, filters, limit)
+
+    async def aread(
+        self,
+        item_id: str,
+        options: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Async version of `read`."""
+        return await asyncio.to_thread(self.read, item_id, options)
+
+    async def awrite(
+        self,
+        parent_id: str,
+        title: str,
+        content: str,
+        options: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Async version of `write`."""
+        return await asyncio.to_thread(self.write, parent_id, title, content, options)
+
+    async def aupdate(
+        self,
+        item_id: str,
+        content: str | None = None,
+        properties: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Async version of `update`."""
+        return await asyncio.to_thread(self.update, item_id, content, properties)
+
+
+# ---------------------------------------------------------------------------
+# Content cache
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    version: str | None
+    size: int
+
+
+class ContentCache:
+    """Thread-safe LRU cache bounded by an approximate byte budget.
+
+    Share one instance between connectors (and agents) so that repeated reads
+    of the same document are served from memory.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, ...], _CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Approximate number of bytes currently cached."""
+        return self._size
+
+    def get(self, key: tuple[str, ...], version: str | None = None) -> Any | None:
+        """Return the cached value if present and still at ``version``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.version != version:
+                if entry is not None:
+                    self._pop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(self, key: tuple[str, ...], value: Any, version: str | None = None) -> None:
+        """Cache ``value``, evicting least recently used entries to stay in budget."""
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = _CacheEntry(value=value, version=version, size=size)
+            self._size += size
+            while self._size > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def invalidate(self, predicate: Callable[[tuple[str, ...]], bool]) -> int:
+        """Drop every entry whose key matches ``predicate``. Returns the count dropped."""
+        with self._lock:
+            keys = [k for k in self._entries if predicate(k)]
+            for k in keys:
+                self._pop(k)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _pop(self, key: tuple[str, ...]) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+
+class CachedConnector(BaseConnector):
+    """Wrap any connector with a shared, validated `ContentCache`.
+
+    `list_items`, `search` and `read` results are cached per source and validated
+    with the wrapped connector's `get_version`. `write` and `update` invalidate
+    the affected item and every cached listing or search for that source.
+    Source-specific methods (e.g. `list_buckets`) pass through to the wrapped connector.
+    """
+
+    def __init__(self, connector: BaseConnector, cache: ContentCache | None = None):
+        self.connector = connector
+        self.cache = cache if cache is not None else ContentCache()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.connector, name)
+
+    @property
+    def source_type(self) -> str:
+        return self.connector.source_type
+
+    @property
+    def source_name(self) -> str:
+        return self.connector.source_name
+
+    def authenticate(self) -> bool:
+        return self.connector.authenticate()
+
+    def get_version(self, item_id: str | None = None) -> str | None:
+        return self.connector.get_version(item_id)
+
+    async def aget_version(self, item_id: str | None = None) -> str | None:
+        return await self.connector.aget_version(item_id)
+
+    def list_items(
+        self,
+        parent_id: str | None = None,
+        item_type: str | None = None,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        key = ("list_items", self.source_type, parent_id or "", item_type or "", str(limit))
+        return self._cached(
+            key,
+            parent_id,
+            lambda: self.connector.list_items(parent_id=parent_id, item_type=item_type, limit=limit),
+        )
+
+    def search(
+        self,
+        query: str,
+        filters: dict[str, Any] | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        key = ("search", self.source_type, query, _freeze(filters), str(limit))
+        scope = filters.get("bucket") if filters else None
+        return self._cached(
+            key,
+            scope,
+            lambda: self.connector.search(query=query, filters=filters, limit=limit),
+        )
+
+    def read(
+        self,
+        item_id: str,
+        options: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        key = ("read", self.source_type, item_id, _freeze(options))
+        result = self._cached(key, item_id, lambda: self.connector.read(item_id, options=options))
+        if "error" in result:
+            # Don't keep negative results around; the item may appear later
+            self.cache.invalidate(lambda k: k == key)
+        return result
+
+    def write(
+        self,
+        parent_id: str,
+        title: str,
+        content: str,
+        options: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        result = self.connector.write(parent_id, title, content, options=options)
+        self._invalidate(result.get("id"))
+        return result
+
+    def update(
+        self,
+        item_id: str,
+        content: str | None = None,
+        properties: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        result = self.connector.update(item_id, content=content, properties=properties)
+        self._invalidate(item_id)
+        return result
+
+    async def alist_items(
+        self,
+        parent_id: str | None = None,
+        item_type: str | None = None,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        key = ("list_items", self.source_type, parent_id or "", item_type or "", str(limit))
+        return await self._acached(
+            key,
+            parent_id,
+            lambda: self.connector.alist_items(parent_id=parent_id, item_type=item_type, limit=limit),
+        )
+
+    async def asearch(
+        self,
+        query: str,
+        filters: dict[str, Any] | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        key = ("search", self.source_type, query, _freeze(filters), str(limit))
+        scope = filters.get("bucket") if filters else None
+        return await self._acached(
+            key,
+            scope,
+            lambda: self.connector.asearch(query=query, filters=filters, limit=limit),
+        )
+
+    async def aread(
+        self,
+        item_id: str,
+        options: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        key = ("read", self.source_type, item_id, _freeze(options))
+        result = await self._acached(key, item_id, lambda: self.connector.aread(item_id, options=options))
+        if "error" in result:
+            self.cache.invalidate(lambda k: k == key)
+        return result
+
+    async def awrite(
+        self,
+        parent_id: str,
+        title: str,
+        content: str,
+        options: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        result = await self.connector.awrite(parent_id, title, content, options=options)
+        self._invalidate(result.get("id"))
+        return result
+
+    async def aupdate(
+        self,
+        item_id: str,
+        content: str | None = None,
+        properties: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        result = await self.connector.aupdate(item_id, content=content, properties=properties)
+        self._invalidate(item_id)
+        return result
+
+    def _cached(self, key: tuple[str, ...], version_id: str | None, load: Callable[[], Any]) -> Any:
+        version = self.connector.get_version(version_id)
+        value = self.cache.get(key, version)
+        if value is None:
+            value = load()
+            self.cache.put(key, value, version)
+        return value
+
+    async def _acached(
+        self,
+        key: tuple[str, ...],
+        version_id: str | None,
+        load: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        version = await self.connector.aget_version(version_id)
+        value = self.cache.get(key, version)
+        if value is None:
+            value = await load()
+            self.cache.put(key, value, version)
+        return value
+
+    def _invalidate(self, item_id: str | None) -> None:
+        source_type = self.source_type
+        target = _strip_scheme(item_id or "")
+        self.cache.invalidate(
+            lambda k: k[1] == source_type and (k[0] in ("list_items", "search") or _strip_scheme(k[2]) == target)
+        )
+
+
+def _strip_scheme(item_id: str) -> str:
+    """Drop a URI scheme (e.g. 's3://') so equivalent item IDs compare equal."""
+    return item_id.split("://", 1)[-1]
+
+
+def _freeze(value: dict[str, Any] | None) -> str:
+    """Turn an options/filters dict into a stable cache key component."""
+    return json.dumps(value or {}, sort_keys=True, default=str)
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate the in-memory footprint of a connector result in bytes."""
+    return len(json.dumps(value, default=str))
@@ -3,6 +3,7 @@
 S3 is the primary connector for demos and most enterprise deployments.
 """
 
+import hashlib
 from typing import Any
 
 from .base import BaseConnector
@@ -1189,6 +1190,8 @@ class S3Connector(BaseConnector):
     def __init__(self, bucket: str | None = None):
         self._authenticated = False
         self._default_bucket = bucket
+        # Line-offset index per object, built once on first paginated read
+        self._line_index: dict[str, list[int]] = {}
 
     @property
     def source_type(self) -> str:
@@ -1203,6 +1206,22 @@ class S3Connector(BaseConnector):
         self._authenticated = True
         return True
 
+    def get_version(self, item_id: str | None = None) -> str | None:
+        """Return the modified date of a file, or a digest over a bucket/prefix listing."""
+        path = (item_id or "").removeprefix("s3://")
+        bucket, _, prefix = path.partition("/")
+        buckets = [bucket] if bucket else list(MOCK_FILES.keys())
+
+        stamps = [
+            f"{b}/{f['key']}@{f.get('modified', '')}"
+            for b in buckets
+            for f in MOCK_FILES.get(b, [])
+            if f["key"].startswith(prefix)
+        ]
+        if len(stamps) == 1 and prefix and stamps[0].startswith(f"{bucket}/{prefix}@"):
+            return stamps[0].rsplit("@", 1)[1]
+        return hashlib.md5("\n".join(stamps).encode()).hexdigest()
+
     def list_buckets(self) -> list[dict[str, Any]]:
         """List available S3 buckets."""
         return MOCK_BUCKETS
@@ -1342,25 +1361,82 @@ class S3Connector(BaseConnector):
             return {"error": f"File not found: s3://{content_key}"}
 
         content = MOCK_CONTENTS[content_key]
+        metadata: dict[str, Any] = {
+            "size": len(content),
+            "modified": _get_file_modified(bucket, key),
+        }
 
         # Handle pagination for large files
-        if options and options.get("offset"):
-            lines = content.split("\n")
-            offset = options.get("offset", 0)
-            limit = options.get("limit", 100)
-            content = "\n".join(lines[offset : offset + limit])
+        if options and (options.get("offset") or options.get("limit")):
+            line_index = self._get_line_index(content_key, content)
+            offset = max(options.get("offset") or 0, 0)
+            limit = max(options.get("limit") or 100, 0)
+            content = _slice_lines(content, line_index, offset, limit)
+            metadata["total_lines"] = len(line_index)
+            metadata["offset"] = offset
 
         return {
             "id": f"s3://{bucket}/{key}",
             "bucket": bucket,
             "key": key,
             "content": content,
-            "metadata": {
-                "size": len(content),
-                "modified": _get_file_modified(bucket, key),
-            },
+            "metadata": metadata,
         }
 
+    # Mock objects live in memory, so the async variants run inline instead of
+    # taking a worker thread. A boto-backed connector would use aioboto3 here.
+
+    async def aget_version(self, item_id: str | None = None) -> str | None:
+        return self.get_version(item_id)
+
+    async def alist_items(
+        self,
+        parent_id: str | None = None,
+        item_type: str | None = None,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        return self.list_items(parent_id=parent_id, item_type=item_type, limit=limit)
+
+    async def asearch(
+        self,
+        query: str,
+        filters: dict[str, Any] | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        return self.search(query=query, filters=filters, limit=limit)
+
+    async def aread(
+        self,
+        item_id: str,
+        options: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        return self.read(item_id, options=options)
+
+    async def awrite(
+        self,
+        parent_id: str,
+        title: str,
+        content: str,
+        options: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        return self.write(parent_id, title, content, options=options)
+
+    async def aupdate(
+        self,
+        item_id: str,
+        content: str | None = None,
+        properties: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        return self.update(item_id, content=content, properties=properties)
+
+    def _get_line_index(self, content_key: str, content: str) -> list[int]:
+        """Return the start offset of every line, building it on first use."""
+        line_index = self._line_index.get(content_key)
+        if line_index is None:
+            line_index = _build_line_index(content)
+            self._line_index[content_key] = line_index
+        return line_index
+
     def write(
         self,
         parent_id: str,
@@ -1405,6 +1481,27 @@ def _get_file_modified(bucket: str, key: str) -> str:
     return ""
 
 
+def _build_line_index(content: str) -> list[int]:
+    """Build the character offset at which each line starts."""
+    line_index = [0]
+    pos = content.find("\n")
+    while pos != -1:
+        line_index.append(pos + 1)
+        pos = content.find("\n", pos + 1)
+    return line_index
+
+
+def _slice_lines(content: str, line_index: list[int], offset: int, limit: int) -> str:
+    """Return ``limit`` lines starting at line ``offset`` using the line index."""
+    if offset >= len(line_index) or limit <= 0:
+        return ""
+    start = line_index[offset]
+    end_line = offset + limit
+    # Stop before the newline that terminates the last line in the page
+    end = line_index[end_line] - 1 if end_line < len(line_index) else len(content)
+    return content[start:end]
+
+
 def _extract_snippet_with_context(content: str, query: str, context_lines: int = 2) -> str:
     """Extract a snippet with surrounding context lines (grep-like)."""
     query_lower = query.lower()
@@ -1,12 +1,15 @@
 """Scout Tools."""
 
 from .awareness import create_get_metadata_tool, create_list_sources_tool
-from .s3 import S3Tools
+from .federated_search import create_federated_search_tool
+from .s3 import AsyncS3Tools, S3Tools
 from .save_discovery import create_save_intent_discovery_tool
 
 __all__ = [
     "create_list_sources_tool",
     "create_get_metadata_tool",
+    "create_federated_search_tool",
     "create_save_intent_discovery_tool",
     "S3Tools",
+    "AsyncS3Tools",
 ]
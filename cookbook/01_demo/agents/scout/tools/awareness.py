@@ -6,8 +6,12 @@ before diving into search.
 
 from agno.tools import tool
 
-from ..connectors import S3Connector
+from ..connectors import BaseConnector, CachedConnector, ContentCache, S3Connector
 from ..context.source_registry import SOURCE_REGISTRY
+from .budget import DEFAULT_MAX_TOKENS, decode_cursor, pack_blocks
+
+# Items listed per get_metadata page (before the token budget applies)
+METADATA_PAGE_SIZE = 30
 
 
 def create_list_sources_tool():
@@ -71,16 +75,26 @@ def create_list_sources_tool():
     return list_sources
 
 
-def create_get_metadata_tool():
-    """Create get_metadata tool."""
-    connectors = {
+def build_connectors(cache: ContentCache | None = None) -> dict[str, BaseConnector]:
+    """Build the connectors available to awareness and search tools, keyed by source type."""
+    connectors: dict[str, BaseConnector] = {
         "s3": S3Connector(),
     }
+    if cache is not None:
+        connectors = {name: CachedConnector(c, cache=cache) for name, c in connectors.items()}
+    return connectors
+
+
+def create_get_metadata_tool(cache: ContentCache | None = None):
+    """Create get_metadata tool, optionally backed by a shared content cache."""
+    connectors = build_connectors(cache)
 
     @tool
     def get_metadata(
         source: str,
         path: str | None = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        cursor: str | None = None,
     ) -> str:
         """Get metadata about a source or specific path without reading content.
 
@@ -91,23 +105,29 @@ def create_get_metadata_tool():
             source: Source type (s3).
             path: Optional path to inspect. Format depends on source:
                   - S3: "bucket-name" or "bucket-name/prefix"
+            max_tokens: Approximate token budget for the output.
+            cursor: Cursor from a previous call to get the next page.
         """
         if source not in connectors:
             return f"Unknown source: {source}. Available: {', '.join(connectors.keys())}"
 
+        scope = f"metadata:{source}:{path}"
+        offset = decode_cursor(cursor, scope)
+        if offset is None:
+            return "Error: Invalid or expired cursor. Repeat the call without a cursor."
+
         connector = connectors[source]
         connector.authenticate()
 
         if not path:
             # List top-level items
-            items = connector.list_items(limit=30)
+            items = connector.list_items(limit=offset + METADATA_PAGE_SIZE + 1)
 
             if not items:
                 return f"No items found in {source}."
 
-            lines = [f"## {connector.source_name} Structure", ""]
-
-            for item in items:
+            blocks: list[str] = []
+            for item in items[offset : offset + METADATA_PAGE_SIZE]:
                 icon = _get_icon(item.get("type", ""), source)
                 name = item.get("name", item.get("id", "Unknown"))
 
@@ -118,20 +138,23 @@ def create_get_metadata_tool():
                     "page",
                     "database",
                 ):
-                    lines.append(f"{icon} **{name}/**")
+                    block = f"{icon} **{name}/**"
                 else:
                     size_info = ""
                     if item.get("size"):
                         size_info = f" ({_format_size(item['size'])})"
-                    lines.append(f"{icon} {name}{size_info}")
+                    block = f"{icon} {name}{size_info}"
 
                 if item.get("id") and item["id"] != name:
-                    lines.append(f"   `{item['id']}`")
+                    block += f"\n   `{item['id']}`"
+                blocks.append(block)
 
-            return "\n".join(lines)
+            header = [f"## {connector.source_name} Structure", ""]
+            has_more = len(items) > offset + METADATA_PAGE_SIZE
+            return pack_blocks(header, blocks, scope, offset, max_tokens, has_more=has_more)
 
         # Get specific path metadata
-        items = connector.list_items(parent_id=path, limit=30)
+        items = connector.list_items(parent_id=path, limit=offset + METADATA_PAGE_SIZE + 1)
 
         if not items:
             # Try reading as a file
@@ -145,9 +168,8 @@ def create_get_metadata_tool():
                 return "\n".join(lines)
             return f"Path not found or empty: {path}"
 
-        lines = [f"## Contents of {path}", ""]
-
-        for item in items:
+        blocks = []
+        for item in items[offset : offset + METADATA_PAGE_SIZE]:
             icon = _get_icon(item.get("type", ""), source)
             name = item.get("name", item.get("id", "Unknown"))
 
@@ -158,7 +180,7 @@ def create_get_metadata_tool():
                 "page",
                 "database",
             ):
-                lines.append(f"{icon} **{name}/**")
+                blocks.append(f"{icon} **{name}/**")
             else:
                 size_info = ""
                 if item.get("size"):
@@ -166,9 +188,11 @@ def create_get_metadata_tool():
                 modified = item.get("modified", "")
                 if modified:
                     size_info += f" - {modified}"
-                lines.append(f"{icon} {name}{size_info}")
+                blocks.append(f"{icon} {name}{size_info}")
 
-        return "\n".join(lines)
+        header = [f"## Contents of {path}", ""]
+        has_more = len(items) > offset + METADATA_PAGE_SIZE
+        return pack_blocks(header, blocks, scope, offset, max_tokens, has_more=has_more)
 
     return get_metadata
 
@@ -0,0 +1,82 @@
+"""Token-budgeted, cursor-paginated tool output.
+
+Tool outputs are packed block by block until a token budget is reached. When
+more blocks remain, an opaque cursor is appended that the model passes back to
+get the next page.
+"""
+
+import base64
+import hashlib
+import json
+
+# Default budget per tool call, in estimated tokens
+DEFAULT_MAX_TOKENS = 1500
+
+# Rough chars-per-token ratio for English/Markdown with OpenAI tokenizers
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate; avoids loading a tokenizer on every tool call."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def encode_cursor(offset: int, scope: str) -> str:
+    """Encode a page offset bound to the request it came from."""
+    payload = json.dumps({"o": offset, "s": _fingerprint(scope)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None, scope: str) -> int | None:
+    """Return the offset stored in ``cursor``, 0 if there is none, or None if it is invalid for ``scope``."""
+    if not cursor:
+        return 0
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        offset = int(payload["o"])
+    except (ValueError, KeyError, TypeError):
+        return None
+    if payload.get("s") != _fingerprint(scope) or offset < 0:
+        return None
+    return offset
+
+
+def pack_blocks(
+    header: list[str],
+    blocks: list[str],
+    scope: str,
+    offset: int = 0,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    has_more: bool = False,
+) -> str:
+    """Join ``header`` and as many ``blocks`` as fit in ``max_tokens``.
+
+    Always includes at least one block so a single oversized item can't stall
+    pagination. Appends a cursor line when blocks were left out, or when the
+    caller knows the source has more (``has_more``).
+    """
+    lines = list(header)
+    used = estimate_tokens("\n".join(lines))
+    taken = 0
+
+    for block in blocks:
+        cost = estimate_tokens(block) + 1
+        if taken and used + cost > max_tokens:
+            break
+        lines.append(block)
+        used += cost
+        taken += 1
+
+    if taken < len(blocks) or has_more:
+        next_offset = offset + taken
+        lines.append("")
+        lines.append(
+            f'_Showing {offset + 1}-{next_offset}. More results: pass cursor="{encode_cursor(next_offset, scope)}"_'
+        )
+
+    return "\n".join(lines)
+
+
+def _fingerprint(scope: str) -> str:
+    return hashlib.sha1(scope.encode()).hexdigest()[:8]
@@ -0,0 +1,187 @@
+"""Federated search across every connected source.
+
+Fans a query out to all connectors concurrently, ranks the combined hits with
+BM25, and returns the top results. Sources that miss the deadline are reported
+and skipped, so one slow source never holds up the answer. Once ``limit`` hits
+match every query term, the remaining sources aren't waited for.
+"""
+
+import heapq
+import math
+import re
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from agno.tools import tool
+from agno.utils.log import logger
+
+from ..connectors import BaseConnector, ContentCache
+from .awareness import build_connectors
+
+# BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Max distinct query terms searched individually per source
+MAX_QUERY_TERMS = 5
+
+# Hit fields scored by BM25
+SCORED_FIELDS = ("name", "key", "snippet")
+
+
+def create_federated_search_tool(
+    connectors: dict[str, BaseConnector] | None = None,
+    cache: ContentCache | None = None,
+    timeout: float = 5.0,
+):
+    """Create federated_search tool over the given connectors (defaults to all awareness connectors)."""
+    if connectors is None:
+        connectors = build_connectors(cache)
+
+    @tool
+    def federated_search(query: str, limit: int = 10) -> str:
+        """Search every connected source at once and return the best-ranked matches.
+
+        Use this when you don't know which source or bucket holds the answer.
+        Results are ranked by relevance across all sources.
+
+        Args:
+            query: Search query (keywords work best).
+            limit: Maximum number of results.
+        """
+        if not query or not query.strip():
+            return "Error: Query required."
+
+        hits, timed_out = federated_search_hits(connectors, query, limit=limit, timeout=timeout)
+
+        if not hits:
+            suffix = f" ({', '.join(timed_out)} timed out)" if timed_out else ""
+            return f"No results found for '{query}'{suffix}."
+
+        lines = [f"## Results for '{query}' across {len(connectors)} sources", ""]
+        for score, hit in hits:
+            lines.append(f"**{hit.get('name', hit['id'])}** ({hit['source']}, score {score:.2f})")
+            if hit.get("snippet"):
+                lines.append("  ```")
+                for snippet_line in hit["snippet"].split("\n"):
+                    lines.append(f"  {snippet_line}")
+                lines.append("  ```")
+            lines.append(f"  Path: `{hit['id']}`")
+            lines.append("")
+
+        if timed_out:
+            lines.append(f"_Partial results: {', '.join(timed_out)} did not respond within {timeout:.0f}s._")
+
+        return "\n".join(lines)
+
+    return federated_search
+
+
+def federated_search_hits(
+    connectors: dict[str, BaseConnector],
+    query: str,
+    limit: int = 10,
+    timeout: float = 5.0,
+    per_source_limit: int = 20,
+) -> tuple[list[tuple[float, dict[str, Any]]], list[str]]:
+    """Search all connectors concurrently and merge hits into a BM25-ranked top-k.
+
+    Returns:
+        ``(hits, timed_out)`` where hits are ``(score, hit)`` pairs, best first,
+        and timed_out lists sources that missed the deadline. Sources still
+        running when ``limit`` hits match every query term are not waited for
+        and not reported as timed out.
+    """
+    # A pool per call: a hung connector keeps its thread after the deadline, and
+    # a shared pool would fill up with those and starve later searches
+    executor = ThreadPoolExecutor(max_workers=max(len(connectors), 1), thread_name_prefix="scout-search")
+    futures: dict[Future, str] = {
+        executor.submit(_search_source, connector, query, per_source_limit): name
+        for name, connector in connectors.items()
+    }
+    query_terms = set(_tokenize(query))
+    deadline = time.monotonic() + timeout
+    candidates: dict[str, dict[str, Any]] = {}
+    full_matches = 0
+    pending = set(futures)
+    try:
+        while pending and full_matches < limit:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                source = futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    logger.warning(f"Federated search failed for {source}: {e}")
+                    continue
+                for hit in results:
+                    if hit["id"] in candidates:
+                        continue
+                    candidates[hit["id"]] = {**hit, "source": source}
+                    if query_terms and query_terms <= set(_hit_terms(hit)):
+                        full_matches += 1
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if pending and full_matches >= limit:
+        logger.debug(f"Federated search stopped early without {', '.join(sorted(futures[f] for f in pending))}")
+        timed_out = []
+    else:
+        timed_out = sorted(futures[f] for f in pending)
+
+    return _rank_bm25(query, list(candidates.values()), limit), timed_out
+
+
+def _search_source(connector: BaseConnector, query: str, limit: int) -> list[dict[str, Any]]:
+    """Search one source for the full query and each of its terms."""
+    hits: dict[str, dict[str, Any]] = {}
+    terms = list(dict.fromkeys(_tokenize(query)))
+    searches = [query] + (terms[:MAX_QUERY_TERMS] if len(terms) > 1 else [])
+
+    for q in searches:
+        for hit in connector.search(query=q, limit=limit):
+            hits.setdefault(hit["id"], hit)
+    return list(hits.values())
+
+
+def _rank_bm25(query: str, hits: list[dict[str, Any]], k: int) -> list[tuple[float, dict[str, Any]]]:
+    """Score hits with BM25 over their name, path and snippet, keeping the top ``k``."""
+    if not hits or k <= 0:
+        return []
+
+    query_terms = set(_tokenize(query))
+    docs = [Counter(_hit_terms(h)) for h in hits]
+    avg_len = sum(sum(d.values()) for d in docs) / len(docs) or 1.0
+
+    doc_freq = Counter(term for d in docs for term in query_terms if term in d)
+    n = len(docs)
+    idf = {t: math.log(1 + (n - doc_freq[t] + 0.5) / (doc_freq[t] + 0.5)) for t in query_terms}
+
+    # Bounded min-heap: never holds more than k entries
+    heap: list[tuple[float, int, dict[str, Any]]] = []
+    for i, (hit, doc) in enumerate(zip(hits, docs)):
+        doc_len = sum(doc.values())
+        score = 0.0
+        for term in query_terms:
+            tf = doc.get(term, 0)
+            if tf:
+                score += idf[term] * tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * doc_len / avg_len))
+        if len(heap) < k:
+            heapq.heappush(heap, (score, -i, hit))
+        elif score > heap[0][0]:
+            heapq.heapreplace(heap, (score, -i, hit))
+
+    return [(score, hit) for score, _, hit in sorted(heap, key=lambda e: (e[0], e[1]), reverse=True)]
+
+
+def _hit_terms(hit: dict[str, Any]) -> list[str]:
+    return _tokenize(" ".join(str(hit.get(f, "")) for f in SCORED_FIELDS))
+
+
+def _tokenize(text: str) -> list[str]:
+    return re.findall(r"[a-z0-9]+", text.lower())
@@ -4,17 +4,28 @@ S3 is the primary connector for demos and most enterprise deployments.
 Tools mirror Claude Code's approach: list, search (grep-like), read (full docs), write.
 """
 
+from typing import Any
+
 from agno.tools import Toolkit, tool
 
+from ..connectors.base import CachedConnector, ContentCache
 from ..connectors.s3 import S3Connector
+from .budget import DEFAULT_MAX_TOKENS, decode_cursor, pack_blocks
+
+# Results fetched per search so ranking (and thus paging) is stable across pages
+SEARCH_CANDIDATES = 100
+
+INVALID_CURSOR = "Error: Invalid or expired cursor. Repeat the call without a cursor."
 
 
 class S3Tools(Toolkit):
     """Toolkit for interacting with S3."""
 
-    def __init__(self, default_bucket: str | None = None):
+    def __init__(self, default_bucket: str | None = None, cache: ContentCache | None = None):
         super().__init__(name="s3_tools")
-        self.connector = S3Connector(bucket=default_bucket)
+        self.connector: S3Connector | CachedConnector = S3Connector(bucket=default_bucket)
+        if cache is not None:
+            self.connector = CachedConnector(self.connector, cache=cache)
         self.connector.authenticate()
 
         # Register tools
@@ -52,34 +63,24 @@ class S3Tools(Toolkit):
         self,
         path: str | None = None,
         limit: int = 50,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        cursor: str | None = None,
     ) -> str:
         """List files and directories in S3.
 
         Args:
             path: Bucket or bucket/prefix to list (e.g., "company-docs" or "company-docs/policies").
                   If None, lists all buckets.
-            limit: Maximum number of items to return.
+            limit: Maximum number of items per page.
+            max_tokens: Approximate token budget for the output.
+            cursor: Cursor from a previous call to get the next page.
         """
-        items = self.connector.list_items(parent_id=path, limit=limit)
-
-        if not items:
-            return f"No files found in {path or 'S3'}."
-
-        lines = [f"## Contents of {path or 'S3'}", ""]
-
-        for item in items:
-            if item["type"] == "bucket":
-                lines.append(f"[bucket] **{item['name']}/**")
-            elif item["type"] == "directory":
-                lines.append(f"[dir] **{item['name']}/**")
-            else:
-                size = item.get("size", 0)
-                size_str = _format_size(size)
-                modified = item.get("modified", "")
-                lines.append(f"[file] {item['name']} ({size_str}, {modified})")
-                lines.append(f"   `{item['id']}`")
-
-        return "\n".join(lines)
+        scope = f"list:{path}"
+        offset = decode_cursor(cursor, scope)
+        if offset is None:
+            return INVALID_CURSOR
+        items = self.connector.list_items(parent_id=path, limit=offset + limit + 1)
+        return _format_listing(path, items, scope, offset, limit, max_tokens)
 
     @tool
     def search_files(
@@ -87,6 +88,8 @@ class S3Tools(Toolkit):
         query: str,
         bucket: str | None = None,
         limit: int = 10,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        cursor: str | None = None,
     ) -> str:
         """Search for files in S3 (grep-like search in filenames and content).
 
@@ -96,34 +99,124 @@ class S3Tools(Toolkit):
         Args:
             query: Search query. Searches filenames and file contents.
             bucket: Limit search to specific bucket. If None, searches all buckets.
-            limit: Maximum number of results.
+            limit: Maximum number of results per page.
+            max_tokens: Approximate token budget for the output.
+            cursor: Cursor from a previous call to get the next page.
         """
+        scope = f"search:{query}:{bucket}"
+        offset = decode_cursor(cursor, scope)
+        if offset is None:
+            return INVALID_CURSOR
         filters = {"bucket": bucket} if bucket else None
-        results = self.connector.search(query=query, filters=filters, limit=limit)
+        results = self.connector.search(query=query, filters=filters, limit=max(offset + limit + 1, SEARCH_CANDIDATES))
+        return _format_search_results(query, results, scope, offset, limit, max_tokens)
+
+    @tool
+    def read_file(
+        self,
+        path: str,
+        offset: int | None = None,
+        limit: int | None = None,
+    ) -> str:
+        """Read the full content of a file from S3.
+
+        Reads the entire file (not chunks). For large files, use offset/limit
+        to paginate through the content.
+
+        Args:
+            path: S3 path (e.g., "s3://company-docs/policies/employee-handbook.md"
+                  or "company-docs/policies/employee-handbook.md")
+            offset: Line number to start from (for pagination).
+            limit: Maximum number of lines to return (for pagination).
+        """
+        result = self.connector.read(path, options=_read_options(offset, limit))
+        return _format_file(result, limit)
 
-        if not results:
-            return f"No files found matching '{query}'."
+    @tool
+    def write_file(
+        self,
+        path: str,
+        content: str,
+    ) -> str:
+        """Write content to a file in S3.
 
-        lines = [f"## Search Results for '{query}'", ""]
+        Args:
+            path: S3 path for the new file (e.g., "s3://company-docs/policies/new-policy.md")
+            content: Content to write to the file.
+        """
+        target = _split_write_path(path)
+        if target is None:
+            return "Error: Invalid path format. Use bucket/path/filename.md"
 
-        for result in results:
-            lines.append(f"**{result['key']}**")
-            lines.append(f"  Bucket: {result['bucket']}")
-            lines.append(f"  Match: {result['match_type']}")
+        parent, filename = target
+        result = self.connector.write(parent_id=parent, title=filename, content=content)
+        return _format_write(result)
 
-            if result.get("snippet"):
-                lines.append("  ```")
-                for snippet_line in result["snippet"].split("\n"):
-                    lines.append(f"  {snippet_line}")
-                lines.append("  ```")
 
-            lines.append(f"  Path: `{result['id']}`")
-            lines.append("")
+class AsyncS3Tools(S3Tools):
+    """Async variant of S3Tools for agents run with `arun` (e.g. under AgentOS).
 
-        return "\n".join(lines)
+    Tool calls await the connector's async methods instead of blocking the
+    event loop, so concurrent lookups from a team or multiple sessions overlap.
+    """
 
     @tool
-    def read_file(
+    async def list_files(
+        self,
+        path: str | None = None,
+        limit: int = 50,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        cursor: str | None = None,
+    ) -> str:
+        """List files and directories in S3.
+
+        Args:
+            path: Bucket or bucket/prefix to list (e.g., "company-docs" or "company-docs/policies").
+                  If None, lists all buckets.
+            limit: Maximum number of items per page.
+            max_tokens: Approximate token budget for the output.
+            cursor: Cursor from a previous call to get the next page.
+        """
+        scope = f"list:{path}"
+        offset = decode_cursor(cursor, scope)
+        if offset is None:
+            return INVALID_CURSOR
+        items = await self.connector.alist_items(parent_id=path, limit=offset + limit + 1)
+        return _format_listing(path, items, scope, offset, limit, max_tokens)
+
+    @tool
+    async def search_files(
+        self,
+        query: str,
+        bucket: str | None = None,
+        limit: int = 10,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        cursor: str | None = None,
+    ) -> str:
+        """Search for files in S3 (grep-like search in filenames and content).
+
+        This searches both filenames and file contents, returning matching
+        files with context around the match (like grep -C).
+
+        Args:
+            query: Search query. Searches filenames and file contents.
+            bucket: Limit search to specific bucket. If None, searches all buckets.
+            limit: Maximum number of results per page.
+            max_tokens: Approximate token budget for the output.
+            cursor: Cursor from a previous call to get the next page.
+        """
+        scope = f"search:{query}:{bucket}"
+        offset = decode_cursor(cursor, scope)
+        if offset is None:
+            return INVALID_CURSOR
+        filters = {"bucket": bucket} if bucket else None
+        results = await self.connector.asearch(
+            query=query, filters=filters, limit=max(offset + limit + 1, SEARCH_CANDIDATES)
+        )
+        return _format_search_results(query, results, scope, offset, limit, max_tokens)
+
+    @tool
+    async def read_file(
         self,
         path: str,
         offset: int | None = None,
@@ -140,35 +233,11 @@ class S3Tools(Toolkit):
             offset: Line number to start from (for pagination).
             limit: Maximum number of lines to return (for pagination).
         """
-        options = {}
-        if offset is not None:
-            options["offset"] = offset
-        if limit is not None:
-            options["limit"] = limit
-
-        result = self.connector.read(path, options=options if options else None)
-
-        if "error" in result:
-            return f"Error: {result['error']}"
-
-        lines = [f"# {result['key'].split('/')[-1]}", ""]
-
-        if result.get("metadata"):
-            meta = result["metadata"]
-            lines.append("---")
-            if meta.get("modified"):
-                lines.append(f"Modified: {meta['modified']}")
-            if meta.get("size"):
-                lines.append(f"Size: {_format_size(meta['size'])}")
-            lines.append("---")
-            lines.append("")
-
-        lines.append(result.get("content", ""))
-
-        return "\n".join(lines)
+        result = await self.connector.aread(path, options=_read_options(offset, limit))
+        return _format_file(result, limit)
 
     @tool
-    def write_file(
+    async def write_file(
         self,
         path: str,
         content: str,
@@ -179,22 +248,134 @@ class S3Tools(Toolkit):
             path: S3 path for the new file (e.g., "s3://company-docs/policies/new-policy.md")
             content: Content to write to the file.
         """
-        # Parse path to get parent and filename
-        if path.startswith("s3://"):
-            path = path[5:]
-
-        parts = path.rsplit("/", 1)
-        if len(parts) == 2:
-            parent, filename = parts
-        else:
+        target = _split_write_path(path)
+        if target is None:
             return "Error: Invalid path format. Use bucket/path/filename.md"
 
-        result = self.connector.write(parent_id=parent, title=filename, content=content)
-
-        if "error" in result:
-            return f"Error: {result['error']}"
-
-        return f"Wrote file to `{result['id']}`"
+        parent, filename = target
+        result = await self.connector.awrite(parent_id=parent, title=filename, content=content)
+        return _format_write(result)
+
+
+def _format_listing(
+    path: str | None,
+    items: list[dict[str, Any]],
+    scope: str,
+    offset: int,
+    limit: int,
+    max_tokens: int,
+) -> str:
+    """Format one page of list_items results as Markdown within a token budget."""
+    if not items:
+        return f"No files found in {path or 'S3'}."
+
+    blocks: list[str] = []
+    for item in items[offset : offset + limit]:
+        if item["type"] == "bucket":
+            blocks.append(f"[bucket] **{item['name']}/**")
+        elif item["type"] == "directory":
+            blocks.append(f"[dir] **{item['name']}/**")
+        else:
+            size = item.get("size", 0)
+            size_str = _format_size(size)
+            modified = item.get("modified", "")
+            blocks.append(f"[file] {item['name']} ({size_str}, {modified})\n   `{item['id']}`")
+
+    header = [f"## Contents of {path or 'S3'}", ""]
+    return pack_blocks(header, blocks, scope, offset, max_tokens, has_more=len(items) > offset + limit)
+
+
+def _format_search_results(
+    query: str,
+    results: list[dict[str, Any]],
+    scope: str,
+    offset: int,
+    limit: int,
+    max_tokens: int,
+) -> str:
+    """Format one page of search results as Markdown within a token budget.
+
+    Filename matches are listed before content matches, so the most direct
+    hits survive a tight budget.
+    """
+    if not results:
+        return f"No files found matching '{query}'."
+
+    ranked = sorted(results, key=lambda r: r.get("match_type") != "filename")
+
+    blocks: list[str] = []
+    for result in ranked[offset : offset + limit]:
+        lines = [
+            f"**{result['key']}**",
+            f"  Bucket: {result['bucket']}",
+            f"  Match: {result['match_type']}",
+        ]
+
+        if result.get("snippet"):
+            lines.append("  ```")
+            for snippet_line in result["snippet"].split("\n"):
+                lines.append(f"  {snippet_line}")
+            lines.append("  ```")
+
+        lines.append(f"  Path: `{result['id']}`")
+        lines.append("")
+        blocks.append("\n".join(lines))
+
+    header = [f"## Search Results for '{query}'", ""]
+    return pack_blocks(header, blocks, scope, offset, max_tokens, has_more=len(results) > offset + limit)
+
+
+def _read_options(offset: int | None, limit: int | None) -> dict[str, Any] | None:
+    """Build connector read options from pagination arguments."""
+    options: dict[str, Any] = {}
+    if offset is not None:
+        options["offset"] = offset
+    if limit is not None:
+        options["limit"] = limit
+    return options if options else None
+
+
+def _format_file(result: dict[str, Any], limit: int | None) -> str:
+    """Format a read result as Markdown with a metadata header."""
+    if "error" in result:
+        return f"Error: {result['error']}"
+
+    lines = [f"# {result['key'].split('/')[-1]}", ""]
+
+    if result.get("metadata"):
+        meta = result["metadata"]
+        lines.append("---")
+        if meta.get("modified"):
+            lines.append(f"Modified: {meta['modified']}")
+        if meta.get("size"):
+            lines.append(f"Size: {_format_size(meta['size'])}")
+        if meta.get("total_lines"):
+            start = meta.get("offset", 0)
+            end = min(start + (limit or 100), meta["total_lines"])
+            lines.append(f"Lines: {start}-{end} of {meta['total_lines']}")
+        lines.append("---")
+        lines.append("")
+
+    lines.append(result.get("content", ""))
+
+    return "\n".join(lines)
+
+
+def _split_write_path(path: str) -> tuple[str, str] | None:
+    """Split an S3 path into (parent, filename), or None if it has no parent."""
+    if path.startswith("s3://"):
+        path = path[5:]
+
+    parts = path.rsplit("/", 1)
+    if len(parts) != 2:
+        return None
+    return parts[0], parts[1]
+
+
+def _format_write(result: dict[str, Any]) -> str:
+    if "error" in result:
+        return f"Error: {result['error']}"
+    return f"Wrote file to `{result['id']}`"
 
 
 def _format_size(size: int) -> str:
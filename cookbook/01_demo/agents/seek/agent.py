@@ -21,6 +21,7 @@ from agno.learn import (
 from agno.tools.mcp import MCPTools
 from agno.tools.parallel import ParallelTools
 from db import create_knowledge, get_postgres_db
+from recall import create_recall_tool
 
 from cookbook_config import model
 
@@ -46,7 +47,10 @@ EXA_MCP_URL = (
     "get_code_context_exa"
 )
 
+recall = create_recall_tool(seek_knowledge, seek_learnings)
+
 seek_tools: list = [
+    recall,
     MCPTools(url=EXA_MCP_URL),
     ParallelTools(enable_extract=False),
 ]
@@ -65,7 +69,7 @@ You learn what sources are reliable, what research patterns work, and what the u
 ## Research Methodology
 
 ### Phase 1: Scope & Recall
-- Run `search_knowledge_base` and `search_learnings` FIRST -- you may already know
+- Run `recall` FIRST (searches knowledge and learnings together) -- you may already know
   the best sources, patterns, or domain knowledge for this type of query.
 - Clarify what the user actually needs (overview vs. deep dive vs. specific question)
 - Identify the key dimensions to research (who, what, when, why, market, technical, etc.)
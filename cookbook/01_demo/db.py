@@ -1,29 +1,180 @@
-"""Database configuration."""
+"""Database configuration.
 
+Every component draws connections from a process-wide engine registry, so
+the demo keeps a few sized pools against Postgres instead of one per agent,
+tool, and knowledge base.
+"""
+
+import threading
+from functools import cache
 from os import getenv
+from typing import Any
 
 from agno.db.postgres import PostgresDb
 from agno.knowledge import Knowledge
 from agno.knowledge.embedder.openai import OpenAIEmbedder
-from agno.vectordb.pgvector import PgVector, SearchType
+from agno.vectordb.pgvector import HNSW, Ivfflat, SearchType
+from embedding_cache import CachedEmbedder
+from search_cache import CachedPgVector
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
 
 db_url = getenv("DATABASE_URL", "postgresql+psycopg://ai:ai@localhost:5532/ai")
 
+# Pool sizing per engine; total connections <= engines * (size + overflow)
+POOL_SIZE = int(getenv("DB_POOL_SIZE", "10"))
+POOL_MAX_OVERFLOW = int(getenv("DB_POOL_MAX_OVERFLOW", "10"))
+POOL_TIMEOUT = float(getenv("DB_POOL_TIMEOUT", "30"))
+POOL_RECYCLE = int(getenv("DB_POOL_RECYCLE", "1800"))
+
+# Chunks per embeddings API call
+EMBED_BATCH_SIZE = int(getenv("EMBED_BATCH_SIZE", "100"))
+
+# Approximate nearest neighbour index on knowledge vectors: hnsw, ivfflat, or none (exact scan).
+# Build parameters apply when the index is created (load_knowledge); ef_search/probes on every search.
+VECTOR_INDEX = getenv("VECTOR_INDEX", "hnsw").lower()
+HNSW_M = int(getenv("HNSW_M", "16"))
+HNSW_EF_CONSTRUCTION = int(getenv("HNSW_EF_CONSTRUCTION", "64"))
+# Must be >= the number of results requested, or HNSW returns fewer rows
+HNSW_EF_SEARCH = int(getenv("HNSW_EF_SEARCH", "40"))
+# Unset: sized from the row count when the index is built (rows / 1000, sqrt(rows) past 1M)
+IVFFLAT_LISTS = getenv("IVFFLAT_LISTS")
+IVFFLAT_PROBES = int(getenv("IVFFLAT_PROBES", "10"))
+VECTOR_INDEXES = ("hnsw", "ivfflat", "none")
+
+_engines: dict[tuple[str, int | None], Engine] = {}
+_pool_events: dict[tuple[str, int | None], dict[str, int]] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(url: str | None = None, statement_timeout_ms: int | None = None) -> Engine:
+    """Return the shared engine for ``url``, creating its pool on first use.
+
+    Args:
+        url: Database URL. Defaults to ``db_url``.
+        statement_timeout_ms: Postgres statement timeout for every connection in
+            the pool. Engines with different timeouts get separate pools.
+    """
+    url = url or db_url
+    key = (url, statement_timeout_ms)
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            connect_args: dict[str, Any] = {}
+            if statement_timeout_ms is not None and url.startswith("postgresql"):
+                connect_args["options"] = f"-c statement_timeout={statement_timeout_ms}"
+            pool_args: dict[str, Any] = {}
+            if make_url(url).database not in (None, "", ":memory:"):
+                # In-memory databases use a per-thread singleton pool instead
+                pool_args = {
+                    "poolclass": QueuePool,
+                    "pool_size": POOL_SIZE,
+                    "max_overflow": POOL_MAX_OVERFLOW,
+                    "pool_timeout": POOL_TIMEOUT,
+                }
+            engine = create_engine(
+                url,
+                connect_args=connect_args,
+                pool_recycle=POOL_RECYCLE,
+                pool_pre_ping=True,
+                **pool_args,
+            )
+            _track_pool(key, engine)
+            _engines[key] = engine
+        return engine
+
+
+def pool_stats() -> list[dict[str, Any]]:
+    """Health metrics for every shared pool (for logs or a /health endpoint)."""
+    stats: list[dict[str, Any]] = []
+    for key, engine in list(_engines.items()):
+        entry: dict[str, Any] = {
+            "url": engine.url.render_as_string(hide_password=True),
+            "statement_timeout_ms": key[1],
+        }
+        pool = engine.pool
+        if isinstance(pool, QueuePool):
+            entry.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=pool.overflow(),
+            )
+        stats.append({**entry, **_pool_events[key]})
+    return stats
+
+
+def _track_pool(key: tuple[str, int | None], engine: Engine) -> None:
+    counters = _pool_events[key] = {"connects": 0, "checkouts": 0, "invalidations": 0}
 
+    @event.listens_for(engine, "connect")
+    def _on_connect(*_: Any) -> None:
+        counters["connects"] += 1
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(*_: Any) -> None:
+        counters["checkouts"] += 1
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(*_: Any) -> None:
+        counters["invalidations"] += 1
+
+
+@cache
 def get_postgres_db(contents_table: str | None = None) -> PostgresDb:
     if contents_table is not None:
-        return PostgresDb(id="demo-db", db_url=db_url, knowledge_table=contents_table)
-    return PostgresDb(id="demo-db", db_url=db_url)
+        return PostgresDb(id="demo-db", db_engine=get_engine(), knowledge_table=contents_table)
+    return PostgresDb(id="demo-db", db_engine=get_engine())
+
+
+def vector_index(
+    kind: str = VECTOR_INDEX,
+    m: int = HNSW_M,
+    ef_construction: int = HNSW_EF_CONSTRUCTION,
+    ef_search: int = HNSW_EF_SEARCH,
+    lists: int | None = int(IVFFLAT_LISTS) if IVFFLAT_LISTS else None,
+    probes: int = IVFFLAT_PROBES,
+) -> HNSW | Ivfflat | None:
+    """Build the vector index config for a knowledge table.
+
+    Args:
+        kind: ``hnsw``, ``ivfflat``, or ``none`` for exact search.
+        m: HNSW graph degree; higher improves recall at the cost of build time and memory.
+        ef_construction: HNSW build-time candidate list size.
+        ef_search: HNSW query-time candidate list size.
+        lists: IVFFlat cluster count. ``None`` sizes it from the row count at build time.
+        probes: IVFFlat clusters scanned per query.
+    """
+    if kind == "hnsw":
+        return HNSW(m=m, ef_construction=ef_construction, ef_search=ef_search)
+    if kind == "ivfflat":
+        if lists is None:
+            return Ivfflat(probes=probes, dynamic_lists=True)
+        return Ivfflat(lists=lists, probes=probes, dynamic_lists=False)
+    if kind == "none":
+        return None
+    raise ValueError(f"Unknown vector index {kind!r}, expected one of {', '.join(VECTOR_INDEXES)}")
+
+
+def create_embedder() -> CachedEmbedder:
+    # Identical texts (repeated queries, re-ingested chunks) are embedded once
+    return CachedEmbedder(
+        embedder=OpenAIEmbedder(id="text-embedding-3-small", enable_batch=True, batch_size=EMBED_BATCH_SIZE)
+    )
 
 
 def create_knowledge(name: str, table_name: str) -> Knowledge:
     return Knowledge(
         name=name,
-        vector_db=PgVector(
-            db_url=db_url,
+        # Near-identical searches are served from a per-knowledge-base semantic cache
+        vector_db=CachedPgVector(
+            db_engine=get_engine(),
             table_name=table_name,
             search_type=SearchType.hybrid,
-            embedder=OpenAIEmbedder(id="text-embedding-3-small"),
+            # Created by `vector_db.optimize()` in load_knowledge; searches set ef_search/probes from it
+            vector_index=vector_index(),
+            embedder=create_embedder(),
         ),
         contents_db=get_postgres_db(contents_table=f"{table_name}_contents"),
         max_results=10,
@@ -0,0 +1,167 @@
+"""
+Persistent embedding cache.
+
+Wraps any embedder so identical texts are embedded once: vectors are stored
+on disk (SQLite, packed float32) keyed by embedder ID and text hash, looked up
+in batches, and evicted least-recently-used past a size limit. Shared by every
+knowledge base built with `create_knowledge`.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from functools import cache
+from os import getenv
+from pathlib import Path
+
+from agno.knowledge.embedder.base import Embedder
+
+EMBEDDING_CACHE_PATH = Path(getenv("EMBEDDING_CACHE_PATH", str(Path(__file__).parent / "embedding_cache.db")))
+EMBEDDING_CACHE_MAX_ENTRIES = int(getenv("EMBEDDING_CACHE_MAX_ENTRIES", "200000"))
+
+# SQLite caps bound parameters per statement
+_LOOKUP_CHUNK = 500
+
+
+class EmbeddingStore:
+    """SQLite-backed LRU of float32 vectors."""
+
+    def __init__(self, path: Path = EMBEDDING_CACHE_PATH, max_entries: int = EMBEDDING_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings "
+            "(key TEXT PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+        self._count = self._conn.execute("SELECT count(*) FROM embeddings").fetchone()[0]
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(namespace: str, text: str) -> str:
+        return hashlib.sha256(f"{namespace}\x00{text}".encode()).hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Return the cached vectors for ``keys`` (missing keys are absent)."""
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for i in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[i : i + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                for key, blob in self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ):
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[key] = vector.tolist()
+            if found:
+                now = time.time()
+                self._conn.executemany("UPDATE embeddings SET last_used = ? WHERE key = ?", [(now, k) for k in found])
+                self._conn.commit()
+            self.hits += len(found)
+            self.misses += len(set(keys)) - len(found)
+        return found
+
+    def put_many(self, items: dict[str, list[float]]) -> None:
+        now = time.time()
+        rows = [(key, array("f", vector).tobytes(), now) for key, vector in items.items() if vector]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)", rows)
+            self._count += len(rows)
+            if self._count > self.max_entries:
+                self._count = self._conn.execute("SELECT count(*) FROM embeddings").fetchone()[0]
+                # Evict down to 90% so we don't evict on every insert
+                excess = self._count - int(self.max_entries * 0.9)
+                if excess > 0:
+                    self._conn.execute(
+                        "DELETE FROM embeddings WHERE key IN (SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+                        (excess,),
+                    )
+                    self._count -= excess
+            self._conn.commit()
+
+
+@cache
+def get_embedding_store() -> EmbeddingStore:
+    """Process-wide embedding store."""
+    return EmbeddingStore()
+
+
+@dataclass
+class CachedEmbedder(Embedder):
+    """Embedder that serves repeated texts from an `EmbeddingStore`."""
+
+    embedder: Embedder | None = None
+    store: EmbeddingStore | None = None
+
+    def __post_init__(self) -> None:
+        if self.embedder is None:
+            raise ValueError("CachedEmbedder requires an embedder")
+        self.dimensions = self.embedder.dimensions
+        self.enable_batch = self.embedder.enable_batch
+        self.batch_size = self.embedder.batch_size
+        self.id = getattr(self.embedder, "id", type(self.embedder).__name__)
+        # Vectors differ by model and output size, so both are part of the key
+        self.namespace = f"{type(self.embedder).__name__}:{self.id}:{self.dimensions}"
+        if self.store is None:
+            self.store = get_embedding_store()
+
+    def _lookup(self, text: str) -> tuple[str, list[float] | None]:
+        key = EmbeddingStore.key(self.namespace, text)
+        return key, self.store.get_many([key]).get(key)
+
+    def get_embedding(self, text: str) -> list[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> tuple[list[float], dict | None]:
+        key, vector = self._lookup(text)
+        if vector is not None:
+            return vector, None
+        vector, usage = self.embedder.get_embedding_and_usage(text)
+        self.store.put_many({key: vector})
+        return vector, usage
+
+    async def async_get_embedding(self, text: str) -> list[float]:
+        return (await self.async_get_embedding_and_usage(text))[0]
+
+    async def async_get_embedding_and_usage(self, text: str) -> tuple[list[float], dict | None]:
+        key, vector = self._lookup(text)
+        if vector is not None:
+            return vector, None
+        vector, usage = await self.embedder.async_get_embedding_and_usage(text)
+        self.store.put_many({key: vector})
+        return vector, usage
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: list[str]
+    ) -> tuple[list[list[float]], list[dict | None]]:
+        keys = [EmbeddingStore.key(self.namespace, text) for text in texts]
+        cached = self.store.get_many(keys)
+
+        # Embed each distinct missing text once, in the wrapped embedder's batches
+        missing = list(dict.fromkeys(key for key in keys if key not in cached))
+        usage_by_key: dict[str, dict | None] = {}
+        if missing:
+            text_by_key = dict(zip(keys, texts))
+            missing_texts = [text_by_key[key] for key in missing]
+            if hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
+                vectors, usages = await self.embedder.async_get_embeddings_batch_and_usage(missing_texts)
+            else:
+                results = [await self.embedder.async_get_embedding_and_usage(text) for text in missing_texts]
+                vectors, usages = [r[0] for r in results], [r[1] for r in results]
+            fresh = dict(zip(missing, vectors))
+            usage_by_key = dict(zip(missing, usages))
+            self.store.put_many(fresh)
+            cached.update(fresh)
+
+        return [cached.get(key, []) for key in keys], [usage_by_key.get(key) for key in keys]
@@ -6,11 +6,24 @@ Usage:
     python -m evals.run_evals --agent dash
     python -m evals.run_evals --agent seek --verbose
     python -m evals.run_evals --category dash_basic
+    python -m evals.run_evals --concurrency 8 --agent-concurrency gcode=1
+    python -m evals.run_evals --save-baseline evals/baseline.json
+    python -m evals.run_evals --concurrency 8 --baseline evals/baseline.json
+
+Cases run through each component's async streaming run. Each result records
+time to first token, tokens, output tokens/sec, and tool calls. Latency
+percentiles are reported per agent and per category.
 """
 
 import argparse
+import asyncio
+import inspect
+import json
+import math
 import time
-from typing import TypedDict
+import uuid
+from pathlib import Path
+from typing import Any, TypedDict
 
 from rich.console import Console
 from rich.panel import Panel
@@ -18,13 +31,34 @@ from rich.progress import (
     BarColumn,
     Progress,
     SpinnerColumn,
+    TaskID,
     TaskProgressColumn,
     TextColumn,
 )
 from rich.table import Table
 from rich.text import Text
 
-from evals.test_cases import AGENT_TESTS, ALL_TEST_CASES, CATEGORIES
+from evals.test_cases import AGENT_TESTS, ALL_TEST_CASES, CATEGORIES, TestCase
+
+# Default per-agent caps under --concurrency (gcode edits files in a shared workspace)
+AGENT_CONCURRENCY: dict[str, int] = {"gcode": 1}
+
+# Stream events, across agents, teams, and workflows
+CONTENT_EVENTS = {"RunContent", "TeamRunContent"}
+TOOL_CALL_EVENTS = {"ToolCallCompleted", "TeamToolCallCompleted"}
+COMPLETED_EVENTS = {"RunCompleted", "TeamRunCompleted", "WorkflowCompleted"}
+ERROR_EVENTS = {"RunError", "TeamRunError", "WorkflowError"}
+
+# Metrics compared against a baseline, with their display labels
+BASELINE_METRICS = {
+    "p50": "p50 s",
+    "p95": "p95 s",
+    "p99": "p99 s",
+    "ttft_p50": "TTFT p50 s",
+    "tokens_mean": "Tokens",
+    "tokens_per_sec": "Out tok/s",
+    "tool_calls_mean": "Tool calls",
+}
 
 
 class EvalResult(TypedDict, total=False):
@@ -34,6 +68,12 @@ class EvalResult(TypedDict, total=False):
     category: str
     missing: list[str] | None
     duration: float
+    ttft: float | None
+    input_tokens: int
+    output_tokens: int
+    total_tokens: int
+    tokens_per_sec: float | None
+    tool_calls: int
     response: str | None
     error: str
 
@@ -86,10 +126,121 @@ def check_strings(response: str, expected: list[str], mode: str = "all") -> list
     return missing
 
 
+async def run_case(test_case: TestCase, verbose: bool) -> EvalResult:
+    """Run one test case, streaming so time to first token can be measured."""
+    test_start = time.perf_counter()
+    ttft: float | None = None
+    tool_calls = 0
+    content_parts: list[str] = []
+    completed: list[Any] = []
+    try:
+        component = get_component(test_case.agent)
+        stream = component.arun(
+            test_case.question, stream=True, stream_events=True, session_id=f"eval-{uuid.uuid4().hex}"
+        )
+        if inspect.isawaitable(stream):
+            stream = await stream
+        async for event in stream:
+            name = getattr(event, "event", "")
+            if name in CONTENT_EVENTS and isinstance(event.content, str) and event.content:
+                if ttft is None:
+                    ttft = time.perf_counter() - test_start
+                content_parts.append(event.content)
+            elif name in TOOL_CALL_EVENTS:
+                tool_calls += 1
+            elif name in COMPLETED_EVENTS:
+                completed.append(event)
+            elif name in ERROR_EVENTS:
+                raise RuntimeError(getattr(event, "error", None) or getattr(event, "content", None) or name)
+    except Exception as e:
+        return {
+            "status": "ERROR",
+            "agent": test_case.agent,
+            "question": test_case.question,
+            "category": test_case.category,
+            "missing": None,
+            "duration": time.perf_counter() - test_start,
+            "ttft": ttft,
+            "tool_calls": tool_calls,
+            "error": str(e),
+            "response": None,
+        }
+
+    duration = time.perf_counter() - test_start
+    # The last completion is the top-level run; member and step runs complete before it
+    final = completed[-1] if completed else None
+    response = final.content if final is not None and isinstance(final.content, str) else "".join(content_parts)
+    tokens = run_tokens(completed)
+    missing = check_strings(response, test_case.expected_strings, test_case.match_mode)
+    return {
+        "status": "PASS" if not missing else "FAIL",
+        "agent": test_case.agent,
+        "question": test_case.question,
+        "category": test_case.category,
+        "missing": missing if missing else None,
+        "duration": duration,
+        "ttft": ttft,
+        **tokens,
+        "tokens_per_sec": tokens["output_tokens"] / duration if duration > 0 and tokens["output_tokens"] else None,
+        "tool_calls": tool_calls,
+        "response": response if verbose else None,
+    }
+
+
+def run_tokens(completed: list[Any]) -> dict[str, int]:
+    """Token usage of a run from its completion events.
+
+    Uses the top-level run's metrics when present (agents and teams); otherwise
+    sums the member and step runs (workflows).
+    """
+    totals = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
+    if not completed:
+        return totals
+    final_metrics = getattr(completed[-1], "metrics", None)
+    sources = (
+        [final_metrics]
+        if getattr(final_metrics, "total_tokens", 0)
+        else [getattr(event, "metrics", None) for event in completed[:-1]]
+    )
+    for metrics in sources:
+        for key in totals:
+            totals[key] += getattr(metrics, key, 0) or 0
+    return totals
+
+
+async def run_all(
+    tests: list[TestCase],
+    concurrency: int,
+    agent_concurrency: dict[str, int],
+    verbose: bool,
+    progress: Progress,
+    task: TaskID,
+) -> list[EvalResult]:
+    """Run tests with at most ``concurrency`` in flight, and per-agent caps."""
+    overall = asyncio.Semaphore(concurrency)
+    per_agent = {
+        agent: asyncio.Semaphore(min(agent_concurrency.get(agent, concurrency), concurrency))
+        for agent in {tc.agent for tc in tests}
+    }
+
+    async def run_one(test_case: TestCase) -> EvalResult:
+        async with per_agent[test_case.agent], overall:
+            progress.update(task, description=f"[cyan]{test_case.agent}: {test_case.question[:35]}...[/cyan]")
+            result = await run_case(test_case, verbose)
+        progress.advance(task)
+        return result
+
+    return list(await asyncio.gather(*(run_one(tc) for tc in tests)))
+
+
 def run_evals(
     agent: str | None = None,
     category: str | None = None,
     verbose: bool = False,
+    concurrency: int = 1,
+    agent_concurrency: dict[str, int] | None = None,
+    baseline: Path | None = None,
+    save_baseline: Path | None = None,
 ) -> tuple[int, int, int]:
     """Run evaluation suite."""
     # Select tests
@@ -110,12 +261,11 @@ def run_evals(
 
     console.print(
         Panel(
-            f"[bold]Running {len(tests)} tests[/bold]\nMode: String matching",
+            f"[bold]Running {len(tests)} tests[/bold]\nMode: String matching, concurrency {concurrency}",
             style="blue",
         )
     )
 
-    results: list[EvalResult] = []
     start = time.time()
 
     with Progress(
@@ -126,55 +276,22 @@ def run_evals(
         console=console,
     ) as progress:
         task = progress.add_task("Evaluating...", total=len(tests))
-
-        for test_case in tests:
-            progress.update(
-                task,
-                description=f"[cyan]{test_case.agent}: {test_case.question[:35]}...[/cyan]",
-            )
-            test_start = time.time()
-
-            try:
-                component = get_component(test_case.agent)
-                result = component.run(test_case.question)
-                response = result.content or ""
-                duration = time.time() - test_start
-
-                missing = check_strings(response, test_case.expected_strings, test_case.match_mode)
-                status = "PASS" if not missing else "FAIL"
-
-                results.append(
-                    {
-                        "status": status,
-                        "agent": test_case.agent,
-                        "question": test_case.question,
-                        "category": test_case.category,
-                        "missing": missing if missing else None,
-                        "duration": duration,
-                        "response": response if verbose else None,
-                    }
-                )
-
-            except Exception as e:
-                duration = time.time() - test_start
-                results.append(
-                    {
-                        "status": "ERROR",
-                        "agent": test_case.agent,
-                        "question": test_case.question,
-                        "category": test_case.category,
-                        "missing": None,
-                        "duration": duration,
-                        "error": str(e),
-                        "response": None,
-                    }
-                )
-
-            progress.advance(task)
+        results = asyncio.run(
+            run_all(tests, concurrency, {**AGENT_CONCURRENCY, **(agent_concurrency or {})}, verbose, progress, task)
+        )
 
     total_duration = time.time() - start
     display_results(results, verbose)
     display_summary(results, total_duration)
+
+    groups = latency_groups(results)
+    display_latency(groups)
+    if baseline:
+        display_baseline_diff(groups, json.loads(baseline.read_text()))
+    if save_baseline:
+        save_baseline.write_text(json.dumps({"groups": groups, "results": results}, indent=2, default=str))
+        console.print(f"[dim]Baseline saved to {save_baseline}[/dim]")
+
     passed = sum(1 for r in results if r["status"] == "PASS")
     failed = sum(1 for r in results if r["status"] == "FAIL")
     errors = sum(1 for r in results if r["status"] == "ERROR")
@@ -244,7 +361,7 @@ def display_summary(results: list[EvalResult], total_duration: float):
     summary.add_row("Passed:", Text(f"{passed} ({rate:.0f}%)", style="green"))
     summary.add_row("Failed:", Text(str(failed), style="red" if failed else "dim"))
     summary.add_row("Errors:", Text(str(errors), style="yellow" if errors else "dim"))
-    summary.add_row("Avg time:", f"{total_duration / total:.1f}s per test" if total else "N/A")
+    summary.add_row("Avg time:", f"{sum(r['duration'] for r in results) / total:.1f}s per test" if total else "N/A")
 
     console.print(
         Panel(
@@ -280,6 +397,94 @@ def display_summary(results: list[EvalResult], total_duration: float):
         console.print(agent_table)
 
 
+def percentile(values: list[float], q: float) -> float | None:
+    """Linear-interpolated percentile (``q`` in 0-100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def latency_groups(results: list[EvalResult]) -> dict[str, dict[str, Any]]:
+    """Latency, token, and tool-call stats per ``agent:<id>`` and ``category:<name>``."""
+    keyed: dict[str, list[EvalResult]] = {}
+    for r in results:
+        keyed.setdefault(f"agent:{r['agent']}", []).append(r)
+        keyed.setdefault(f"category:{r['category']}", []).append(r)
+
+    groups: dict[str, dict[str, Any]] = {}
+    for key in sorted(keyed):
+        # Errored runs would skew latency, so stats cover completed runs only
+        done = [r for r in keyed[key] if r["status"] != "ERROR"]
+        durations = [r["duration"] for r in done]
+        ttfts = [r["ttft"] for r in done if r.get("ttft") is not None]
+        rates = [r["tokens_per_sec"] for r in done if r.get("tokens_per_sec")]
+        groups[key] = {
+            "n": len(done),
+            "p50": percentile(durations, 50),
+            "p95": percentile(durations, 95),
+            "p99": percentile(durations, 99),
+            "ttft_p50": percentile(ttfts, 50),
+            "tokens_mean": sum(r.get("total_tokens", 0) for r in done) / len(done) if done else None,
+            "tokens_per_sec": sum(rates) / len(rates) if rates else None,
+            "tool_calls_mean": sum(r.get("tool_calls", 0) for r in done) / len(done) if done else None,
+        }
+    return groups
+
+
+def _fmt(value: float | None, digits: int = 2) -> str:
+    return "-" if value is None else f"{value:.{digits}f}"
+
+
+def display_latency(groups: dict[str, dict[str, Any]]):
+    """Display latency percentiles per agent and per category."""
+    for prefix, title in (("agent:", "Latency by Agent"), ("category:", "Latency by Category")):
+        table = Table(title=title, show_header=True)
+        table.add_column(prefix.rstrip(":").title())
+        table.add_column("N", justify="right")
+        for label in BASELINE_METRICS.values():
+            table.add_column(label, justify="right")
+        for key, stats in groups.items():
+            if key.startswith(prefix):
+                table.add_row(
+                    key[len(prefix) :], str(stats["n"]), *(_fmt(stats[metric]) for metric in BASELINE_METRICS)
+                )
+        console.print(table)
+
+
+def display_baseline_diff(groups: dict[str, dict[str, Any]], baseline: dict[str, Any]):
+    """Display current stats against a saved baseline (red = slower or more tokens)."""
+    previous = baseline.get("groups", {})
+    table = Table(title="Against Baseline", show_header=True)
+    table.add_column("Group")
+    table.add_column("Metric")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Change", justify="right")
+    for key, stats in groups.items():
+        if key not in previous:
+            continue
+        for metric, label in BASELINE_METRICS.items():
+            before, after = previous[key].get(metric), stats.get(metric)
+            if before is None or after is None:
+                continue
+            change = (after - before) / before * 100 if before else 0.0
+            # Throughput is better when higher; everything else when lower
+            worse = change < 0 if metric == "tokens_per_sec" else change > 0
+            style = "red" if worse and abs(change) >= 10 else "green" if abs(change) >= 10 else "dim"
+            table.add_row(key, label, _fmt(before, 2), _fmt(after, 2), Text(f"{change:+.0f}%", style=style))
+    console.print(table)
+
+
+def _agent_limit(value: str) -> tuple[str, int]:
+    agent, _, limit = value.partition("=")
+    if agent not in AGENT_TESTS or not limit.isdigit() or int(limit) < 1:
+        raise argparse.ArgumentTypeError(f"expected <agent>=<n> with agent in {', '.join(AGENT_TESTS)}")
+    return agent, int(limit)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run demo evaluations")
     parser.add_argument(
@@ -290,7 +495,26 @@ if __name__ == "__main__":
     )
     parser.add_argument("--category", "-c", choices=CATEGORIES, help="Filter by category")
     parser.add_argument("--verbose", "-v", action="store_true", help="Show full responses on failure")
+    parser.add_argument("--concurrency", "-j", type=int, default=1, help="Test cases run at once")
+    parser.add_argument(
+        "--agent-concurrency",
+        type=_agent_limit,
+        action="append",
+        default=[],
+        metavar="AGENT=N",
+        help="Cap concurrent runs of one agent (repeatable)",
+    )
+    parser.add_argument("--baseline", type=Path, help="Compare latency and tokens against this baseline file")
+    parser.add_argument("--save-baseline", type=Path, help="Save this run's latency and tokens as a baseline")
     args = parser.parse_args()
 
-    passed_count, failed_count, error_count = run_evals(agent=args.agent, category=args.category, verbose=args.verbose)
+    passed_count, failed_count, error_count = run_evals(
+        agent=args.agent,
+        category=args.category,
+        verbose=args.verbose,
+        concurrency=max(args.concurrency, 1),
+        agent_concurrency=dict(args.agent_concurrency),
+        baseline=args.baseline,
+        save_baseline=args.save_baseline,
+    )
     raise SystemExit(1 if failed_count > 0 or error_count > 0 else 0)
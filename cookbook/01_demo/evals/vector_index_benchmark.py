@@ -0,0 +1,293 @@
+"""
+Benchmark vector index recall and latency against exact search.
+
+Embeds the demo knowledge corpora (every agent's knowledge files, split into
+paragraphs), grows them to several scales with jittered copies, and for each
+index configuration measures recall@k against exact nearest neighbours and
+p50/p99 query latency. Tables live in a scratch schema that is dropped at the end.
+
+Usage:
+    python -m evals.vector_index_benchmark
+    python -m evals.vector_index_benchmark --scales 1000,10000,50000 --k 10
+    python -m evals.vector_index_benchmark --ef-search 10,40,100 --probes 1,10,40
+    python -m evals.vector_index_benchmark --synthetic --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+from db import HNSW_EF_CONSTRUCTION, HNSW_EF_SEARCH, HNSW_M, IVFFLAT_PROBES, create_embedder, get_engine
+from rich.console import Console
+from rich.table import Table
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from evals.test_cases import ALL_TEST_CASES
+
+SCHEMA = "ai_bench"
+AGENTS_DIR = Path(__file__).parent.parent / "agents"
+SYNTHETIC_DIMENSIONS = 1536
+MIN_CHUNK_CHARS = 40
+
+console = Console()
+
+
+@dataclass
+class BenchResult:
+    rows: int
+    index: str
+    params: str
+    build_seconds: float
+    index_mb: float
+    recall: float
+    p50_ms: float
+    p99_ms: float
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+
+
+def load_chunks() -> list[str]:
+    """Paragraph chunks from every agent's knowledge directory."""
+    chunks: list[str] = []
+    for path in sorted(AGENTS_DIR.glob("*/knowledge/**/*")):
+        if not path.is_file() or path.name.startswith("."):
+            continue
+        for paragraph in path.read_text(errors="ignore").split("\n\n"):
+            paragraph = paragraph.strip()
+            if len(paragraph) >= MIN_CHUNK_CHARS:
+                chunks.append(paragraph)
+    return chunks
+
+
+def embed(texts: list[str]) -> np.ndarray:
+    embeddings, _ = asyncio.run(create_embedder().async_get_embeddings_batch_and_usage(texts))
+    return normalize(np.asarray(embeddings, dtype=np.float32))
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def scale_corpus(base: np.ndarray, rows: int, jitter: float, rng: np.random.Generator) -> np.ndarray:
+    """``rows`` vectors: the base corpus, then jittered copies of it."""
+    repeats = base[np.arange(rows) % len(base)]
+    noise = rng.standard_normal(repeats.shape).astype(np.float32) * (jitter / math.sqrt(base.shape[1]))
+    noise[: len(base)] = 0
+    return normalize(repeats + noise)
+
+
+def exact_top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> list[set[int]]:
+    """Ground-truth neighbour IDs by cosine similarity (vectors are unit length)."""
+    similarities = queries @ corpus.T
+    top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+    return [set(int(i) for i in row) for row in top]
+
+
+# ---------------------------------------------------------------------------
+# Postgres
+# ---------------------------------------------------------------------------
+
+
+def vector_literal(vector: np.ndarray) -> str:
+    return "[" + ",".join(f"{x:.7g}" for x in vector) + "]"
+
+
+def load_table(conn: Connection, table: str, corpus: np.ndarray) -> None:
+    conn.execute(text(f"DROP TABLE IF EXISTS {SCHEMA}.{table}"))
+    conn.execute(text(f"CREATE TABLE {SCHEMA}.{table} (id INTEGER PRIMARY KEY, embedding vector({corpus.shape[1]}))"))
+    cursor = conn.connection.cursor()
+    with cursor.copy(f"COPY {SCHEMA}.{table} (id, embedding) FROM STDIN") as copy:
+        for i, vector in enumerate(corpus):
+            copy.write_row((i, vector_literal(vector)))
+    conn.execute(text(f"ANALYZE {SCHEMA}.{table}"))
+    conn.commit()
+
+
+def build_index(conn: Connection, table: str, method: str, options: str) -> tuple[float, float]:
+    """Create the index, returning (build seconds, size in MB)."""
+    conn.execute(text(f"DROP INDEX IF EXISTS {SCHEMA}.{table}_ann"))
+    start = time.perf_counter()
+    columns = "(embedding vector_cosine_ops)"
+    conn.execute(text(f"CREATE INDEX {table}_ann ON {SCHEMA}.{table} USING {method} {columns} WITH ({options})"))
+    seconds = time.perf_counter() - start
+    size = conn.execute(text(f"SELECT pg_relation_size('{SCHEMA}.{table}_ann')")).scalar() or 0
+    conn.commit()
+    return seconds, size / 1e6
+
+
+def run_queries(
+    conn: Connection, table: str, queries: np.ndarray, k: int, setting: str | None = None
+) -> tuple[list[set[int]], list[float]]:
+    """Run every query in its own transaction, returning the IDs found and latency in ms."""
+    sql = text(f"SELECT id FROM {SCHEMA}.{table} ORDER BY embedding <=> CAST(:q AS vector) LIMIT :k")
+    found: list[set[int]] = []
+    latencies: list[float] = []
+    for literal in [vector_literal(q) for q in queries]:
+        if setting:
+            conn.execute(text(f"SET LOCAL {setting}"))
+        start = time.perf_counter()
+        ids = conn.execute(sql, {"q": literal, "k": k}).scalars().all()
+        latencies.append((time.perf_counter() - start) * 1000)
+        # Ends the transaction, so the SET LOCAL doesn't leak into the next configuration
+        conn.rollback()
+        found.append(set(ids))
+    return found, latencies
+
+
+def recall_at_k(found: list[set[int]], truth: list[set[int]]) -> float:
+    return float(np.mean([len(f & t) / len(t) for f, t in zip(found, truth)]))
+
+
+def summarize(
+    rows: int,
+    index: str,
+    params: str,
+    build: tuple[float, float],
+    found: list[set[int]],
+    truth: list[set[int]],
+    latencies: list[float],
+) -> BenchResult:
+    return BenchResult(
+        rows=rows,
+        index=index,
+        params=params,
+        build_seconds=round(build[0], 3),
+        index_mb=round(build[1], 2),
+        recall=round(recall_at_k(found, truth), 4),
+        p50_ms=round(float(np.percentile(latencies, 50)), 3),
+        p99_ms=round(float(np.percentile(latencies, 99)), 3),
+    )
+
+
+def benchmark_scale(
+    conn: Connection, corpus: np.ndarray, queries: np.ndarray, args: argparse.Namespace
+) -> list[BenchResult]:
+    rows = len(corpus)
+    table = f"vectors_{rows}"
+    truth = exact_top_k(corpus, queries, args.k)
+    results: list[BenchResult] = []
+
+    load_table(conn, table, corpus)
+    # Exact scan, forced even if the planner would pick an index
+    found, latencies = run_queries(conn, table, queries, args.k, "enable_indexscan = off")
+    results.append(summarize(rows, "exact", "-", (0.0, 0.0), found, truth, latencies))
+
+    for m, ef_construction in args.hnsw:
+        build = build_index(conn, table, "hnsw", f"m = {m}, ef_construction = {ef_construction}")
+        for ef_search in args.ef_search:
+            found, latencies = run_queries(conn, table, queries, args.k, f"hnsw.ef_search = {ef_search}")
+            params = f"m={m} ef_construction={ef_construction} ef_search={ef_search}"
+            results.append(summarize(rows, "hnsw", params, build, found, truth, latencies))
+
+    # Default lists follow pgvector's guidance (rows / 1000), plus sqrt(rows) for comparison
+    for lists in args.lists or sorted({max(rows // 1000, 1), max(int(math.sqrt(rows)), 1)}):
+        build = build_index(conn, table, "ivfflat", f"lists = {lists}")
+        for probes in args.probes:
+            if probes > lists:
+                continue
+            found, latencies = run_queries(conn, table, queries, args.k, f"ivfflat.probes = {probes}")
+            results.append(summarize(rows, "ivfflat", f"lists={lists} probes={probes}", build, found, truth, latencies))
+
+    conn.execute(text(f"DROP TABLE {SCHEMA}.{table}"))
+    conn.commit()
+    return results
+
+
+def display(results: list[BenchResult], k: int) -> None:
+    table = Table(title=f"Vector index benchmark (recall@{k})")
+    table.add_column("Rows", justify="right")
+    table.add_column("Index")
+    table.add_column("Params")
+    table.add_column("Build s", justify="right")
+    table.add_column("Size MB", justify="right")
+    table.add_column("Recall", justify="right")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p99 ms", justify="right")
+    for r in results:
+        recall_style = "green" if r.recall >= 0.95 else "yellow" if r.recall >= 0.8 else "red"
+        table.add_row(
+            str(r.rows),
+            r.index,
+            r.params,
+            f"{r.build_seconds:.2f}" if r.index != "exact" else "-",
+            f"{r.index_mb:.1f}" if r.index != "exact" else "-",
+            f"[{recall_style}]{r.recall:.3f}[/{recall_style}]",
+            f"{r.p50_ms:.2f}",
+            f"{r.p99_ms:.2f}",
+        )
+    console.print(table)
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def _hnsw_list(value: str) -> list[tuple[int, int]]:
+    pairs = [v.split(":") for v in value.split(",") if v]
+    return [(int(m), int(ef)) for m, ef in pairs]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark HNSW and IVFFlat recall/latency against exact search")
+    parser.add_argument("--scales", type=_int_list, default=[1_000, 10_000, 50_000], help="Corpus sizes (rows)")
+    parser.add_argument("--k", type=int, default=10, help="Neighbours per query (recall@k)")
+    parser.add_argument("--queries", type=int, default=200, help="Number of queries per scale")
+    parser.add_argument(
+        "--hnsw",
+        type=_hnsw_list,
+        default=[(HNSW_M, HNSW_EF_CONSTRUCTION), (32, 128)],
+        help="HNSW builds as m:ef_construction pairs",
+    )
+    parser.add_argument("--ef-search", type=_int_list, default=sorted({10, HNSW_EF_SEARCH, 100}))
+    parser.add_argument("--lists", type=_int_list, default=None, help="IVFFlat list counts (default: from rows)")
+    parser.add_argument("--probes", type=_int_list, default=sorted({1, IVFFLAT_PROBES, 40}))
+    parser.add_argument("--jitter", type=float, default=0.5, help="Noise added to scaled-up copies")
+    parser.add_argument("--synthetic", action="store_true", help="Random base vectors; no embedding API calls")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", type=Path, default=None, help="Write results to this file")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    if args.synthetic:
+        base = normalize(rng.standard_normal((1_000, SYNTHETIC_DIMENSIONS)).astype(np.float32))
+        question_vectors = np.empty((0, SYNTHETIC_DIMENSIONS), dtype=np.float32)
+    else:
+        chunks = load_chunks()
+        console.print(f"Embedding {len(chunks)} knowledge chunks and {len(ALL_TEST_CASES)} eval questions...")
+        base = embed(chunks)
+        question_vectors = embed([tc.question for tc in ALL_TEST_CASES])
+
+    # Eval questions, topped up with perturbed corpus vectors
+    extra = max(args.queries - len(question_vectors), 0)
+    perturbed = scale_corpus(base, len(base) + extra, args.jitter, rng)[len(base) :]
+    queries = np.vstack([question_vectors, perturbed])[: args.queries]
+
+    results: list[BenchResult] = []
+    with get_engine().connect() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+        conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}"))
+        conn.execute(text("SET maintenance_work_mem = '1GB'"))
+        conn.commit()
+        try:
+            for rows in args.scales:
+                console.print(f"[cyan]Benchmarking {rows} rows...[/cyan]")
+                results.extend(benchmark_scale(conn, scale_corpus(base, rows, args.jitter, rng), queries, args))
+        finally:
+            conn.rollback()
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            conn.commit()
+
+    display(results, args.k)
+    if args.json:
+        args.json.write_text(json.dumps([asdict(r) for r in results], indent=2))
+        console.print(f"Results written to {args.json}")
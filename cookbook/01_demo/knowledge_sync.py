@@ -0,0 +1,154 @@
+"""
+Incremental knowledge sync.
+
+Keeps a knowledge base in step with its source directories by content hash:
+only new or changed files are chunked and embedded, and only removed files are
+deleted. The manifest (file -> hash -> content IDs) lives in Postgres next to
+the vectors, so it is reset whenever the knowledge base is.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from agno.knowledge import Knowledge
+from agno.utils.log import logger
+from db import get_engine
+from sqlalchemy import text
+
+MANIFEST_TABLE = "ai.knowledge_manifest"
+
+
+@dataclass
+class SyncResult:
+    added: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+
+
+def file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def collect_files(directories: dict[str, Path]) -> dict[str, Path]:
+    """Map ``<subdir>/<file>`` keys to the files under each directory."""
+    files: dict[str, Path] = {}
+    for subdir, path in directories.items():
+        if not path.exists():
+            continue
+        for f in sorted(path.iterdir()):
+            if f.is_file() and not f.name.startswith("."):
+                files[f"{subdir}/{f.name}"] = f
+    return files
+
+
+def sync_knowledge(
+    knowledge: Knowledge,
+    directories: dict[str, Path],
+    legacy_names: list[str] | None = None,
+) -> SyncResult:
+    """Embed new and changed files, delete removed ones.
+
+    Args:
+        knowledge: Knowledge base to sync.
+        directories: ``{subdir: path}`` of source directories.
+        legacy_names: Content names from whole-directory loads, removed on the first sync.
+    """
+    engine = get_engine()
+    kb = knowledge.name or "knowledge"
+    with engine.begin() as conn:
+        conn.execute(text("CREATE SCHEMA IF NOT EXISTS ai"))
+        conn.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {MANIFEST_TABLE} ("
+                "knowledge TEXT NOT NULL, path TEXT NOT NULL, content_hash TEXT NOT NULL, "
+                "content_ids TEXT[] NOT NULL DEFAULT '{}', synced_at TIMESTAMPTZ NOT NULL DEFAULT now(), "
+                "PRIMARY KEY (knowledge, path))"
+            )
+        )
+        rows = conn.execute(
+            text(f"SELECT path, content_hash, content_ids FROM {MANIFEST_TABLE} WHERE knowledge = :kb"),
+            {"kb": kb},
+        ).fetchall()
+    previous = {row.path: (row.content_hash, list(row.content_ids)) for row in rows}
+
+    if not previous and legacy_names:
+        for name in legacy_names:
+            knowledge.remove_vectors_by_name(name)
+
+    current = {key: (path, file_hash(path)) for key, path in collect_files(directories).items()}
+    result = SyncResult()
+    for key, (_, digest) in current.items():
+        if key not in previous:
+            result.added.append(key)
+        elif previous[key][0] != digest:
+            result.updated.append(key)
+        else:
+            result.unchanged.append(key)
+    result.removed = [key for key in previous if key not in current]
+
+    for key in result.updated + result.removed:
+        _remove(knowledge, key, previous[key][1])
+
+    changed = result.added + result.updated
+    if changed:
+        # One call for all changed files; chunks are embedded in batches by the embedder
+        knowledge.insert_many(
+            [
+                {
+                    "name": key,
+                    "path": str(current[key][0]),
+                    "metadata": {"source_file": key, "content_hash": current[key][1]},
+                }
+                for key in changed
+            ]
+        )
+
+    content_ids = _content_ids_by_name(knowledge, set(changed))
+    with engine.begin() as conn:
+        for key in changed:
+            conn.execute(
+                text(
+                    f"INSERT INTO {MANIFEST_TABLE} (knowledge, path, content_hash, content_ids) "
+                    "VALUES (:kb, :path, :hash, :ids) ON CONFLICT (knowledge, path) DO UPDATE SET "
+                    "content_hash = EXCLUDED.content_hash, content_ids = EXCLUDED.content_ids, synced_at = now()"
+                ),
+                {"kb": kb, "path": key, "hash": current[key][1], "ids": content_ids.get(key, [])},
+            )
+        if result.removed:
+            conn.execute(
+                text(f"DELETE FROM {MANIFEST_TABLE} WHERE knowledge = :kb AND path = ANY(:paths)"),
+                {"kb": kb, "paths": result.removed},
+            )
+    return result
+
+
+def reset_manifest(knowledge: Knowledge) -> None:
+    """Forget what was synced (call after dropping the knowledge base)."""
+    with get_engine().begin() as conn:
+        if conn.execute(text("SELECT to_regclass(:t)"), {"t": MANIFEST_TABLE}).scalar() is not None:
+            conn.execute(
+                text(f"DELETE FROM {MANIFEST_TABLE} WHERE knowledge = :kb"), {"kb": knowledge.name or "knowledge"}
+            )
+
+
+def _remove(knowledge: Knowledge, key: str, content_ids: list[str]) -> None:
+    if not content_ids:
+        # No recorded IDs (e.g. no contents DB): fall back to the content name
+        logger.debug(f"No content IDs recorded for {key}, removing vectors by name")
+        knowledge.remove_vectors_by_name(key)
+        return
+    for content_id in content_ids:
+        knowledge.remove_content_by_id(content_id)
+
+
+def _content_ids_by_name(knowledge: Knowledge, names: set[str]) -> dict[str, list[str]]:
+    if not names:
+        return {}
+    contents, _ = knowledge.get_content()
+    ids: dict[str, list[str]] = {}
+    for content in contents:
+        if content.name in names and content.id:
+            ids.setdefault(content.name, []).append(content.id)
+    return ids
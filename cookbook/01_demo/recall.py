@@ -0,0 +1,95 @@
+"""
+Combined recall over an agent's knowledge and learnings.
+
+One `recall` tool call searches both stores concurrently, removes duplicates,
+fuses the two rankings with reciprocal rank fusion (RRF), and returns a single
+compact context block -- instead of two sequential search tool calls.
+"""
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from agno.knowledge import Knowledge
+from agno.knowledge.document import Document
+from agno.tools import tool
+from agno.utils.log import logger
+
+# RRF constant; larger values flatten the difference between top ranks
+RRF_K = 60
+
+# Characters kept per result in the context block
+MAX_RESULT_CHARS = 600
+
+# Shared across agents; each recall uses two workers
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="recall")
+
+
+def fuse_rankings(rankings: dict[str, list[Document]], k: int = RRF_K) -> list[tuple[str, Document, float]]:
+    """Reciprocal rank fusion of per-source rankings.
+
+    Documents with the same content are merged (scores summed) and attributed
+    to the source where they ranked highest.
+
+    Returns:
+        ``(source, document, score)`` tuples, best first.
+    """
+    fused: dict[str, tuple[str, Document, float, int]] = {}
+    for source, documents in rankings.items():
+        for rank, doc in enumerate(documents, start=1):
+            key = hashlib.sha1(" ".join(doc.content.split()).lower().encode()).hexdigest()
+            score = 1.0 / (k + rank)
+            if key in fused:
+                best_source, best_doc, total, best_rank = fused[key]
+                if rank < best_rank:
+                    best_source, best_doc, best_rank = source, doc, rank
+                fused[key] = (best_source, best_doc, total + score, best_rank)
+            else:
+                fused[key] = (source, doc, score, rank)
+    ranked = sorted(fused.values(), key=lambda item: -item[2])
+    return [(source, doc, score) for source, doc, score, _ in ranked]
+
+
+def create_recall_tool(knowledge: Knowledge, learnings: Knowledge):
+    """Create the recall tool over an agent's knowledge and learnings.
+
+    Knowledge + learnings in one concurrent search, so agents call ``recall``
+    instead of ``search_knowledge_base`` then ``search_learnings``.
+    """
+
+    def _search(store: Knowledge, query: str, limit: int) -> list[Document]:
+        try:
+            return store.search(query=query, max_results=limit)
+        except Exception as e:
+            logger.warning(f"recall: search failed for {store.name}: {e}")
+            return []
+
+    @tool
+    def recall(query: str, limit: int = 8) -> str:
+        """Search your knowledge base and your learnings together, in one call.
+
+        Use this first for any question: it returns curated knowledge and past
+        learnings (gotchas, patterns, preferences) ranked together.
+
+        Args:
+            query: What to look for.
+            limit: Maximum number of results (default 8).
+        """
+        futures = {
+            "knowledge": _executor.submit(_search, knowledge, query, limit),
+            "learning": _executor.submit(_search, learnings, query, limit),
+        }
+        rankings = {source: future.result() for source, future in futures.items()}
+        results = fuse_rankings(rankings)[:limit]
+        if not results:
+            return f"No knowledge or learnings found for: {query}"
+
+        lines = [f"Recall for: {query}", ""]
+        for i, (source, doc, _) in enumerate(results, start=1):
+            content = " ".join(doc.content.split())
+            if len(content) > MAX_RESULT_CHARS:
+                content = content[:MAX_RESULT_CHARS].rstrip() + "..."
+            label = f"{source}: {doc.name}" if doc.name else source
+            lines.append(f"[{i}] ({label}) {content}")
+        return "\n".join(lines)
+
+    return recall
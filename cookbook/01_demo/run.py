@@ -13,7 +13,7 @@ from agents.pal import pal
 from agents.scout import scout
 from agents.seek import seek
 from agno.os import AgentOS
-from db import get_postgres_db
+from db import get_postgres_db, pool_stats
 from registry import registry
 from teams.research import research_team
 from workflows.daily_brief import daily_brief_workflow
@@ -33,5 +33,12 @@ agent_os = AgentOS(
 
 app = agent_os.get_app()
 
+
+@app.get("/health/db")
+def db_health() -> dict:
+    """Connection pool metrics for the shared database engines."""
+    return {"pools": pool_stats()}
+
+
 if __name__ == "__main__":
     agent_os.serve(app="run:app", reload=True)
@@ -0,0 +1,185 @@
+"""
+Semantic search cache for the demo knowledge bases.
+
+`search_knowledge_base` and `search_learnings` are called at the start of
+nearly every run, often with near-identical queries. `CachedPgVector` keeps
+recent results per knowledge base: a query whose embedding is within a cosine
+similarity threshold of a cached query (same limit and filters) returns the
+cached documents without a database round trip. Any write to the knowledge
+base clears its cache; entries also expire after a TTL so writes from other
+processes (e.g. load_knowledge) show up.
+"""
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from os import getenv
+from typing import Any
+
+import numpy as np
+from agno.knowledge.document import Document
+from agno.utils.log import logger
+from agno.vectordb.pgvector import PgVector
+
+SIMILARITY_THRESHOLD = float(getenv("KNOWLEDGE_CACHE_SIMILARITY", "0.95"))
+MAX_ENTRIES = int(getenv("KNOWLEDGE_CACHE_MAX_ENTRIES", "256"))
+TTL_SECONDS = float(getenv("KNOWLEDGE_CACHE_TTL", "300"))
+
+
+@dataclass
+class _Entry:
+    scope: str
+    embedding: np.ndarray
+    documents: list[Document]
+    expires_at: float
+
+
+class SemanticSearchCache:
+    """LRU of (query embedding -> documents), matched by cosine similarity within a scope."""
+
+    def __init__(
+        self,
+        threshold: float = SIMILARITY_THRESHOLD,
+        max_entries: int = MAX_ENTRIES,
+        ttl: float = TTL_SECONDS,
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, scope: str, query: str, embedding: list[float] | None) -> list[Document] | None:
+        now = time.monotonic()
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if e.expires_at < now]:
+                del self._entries[key]
+
+            # Exact query first, then the most similar query in the same scope
+            key = _key(scope, query)
+            if key not in self._entries and embedding is not None:
+                key = self._nearest(scope, _normalize(embedding))
+            if key is None or key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return [copy.copy(doc) for doc in self._entries[key].documents]
+
+    def put(self, scope: str, query: str, embedding: list[float] | None, documents: list[Document]) -> None:
+        if embedding is None:
+            return
+        with self._lock:
+            key = _key(scope, query)
+            self._entries[key] = _Entry(
+                scope=scope,
+                embedding=_normalize(embedding),
+                documents=[copy.copy(doc) for doc in documents],
+                expires_at=time.monotonic() + self.ttl,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __deepcopy__(self, memo: dict) -> "SemanticSearchCache":
+        # Copies of a vector DB (e.g. per-request agent copies) share its cache
+        return self
+
+    def _nearest(self, scope: str, embedding: np.ndarray) -> str | None:
+        keys = [k for k, e in self._entries.items() if e.scope == scope and e.embedding.shape == embedding.shape]
+        if not keys:
+            return None
+        similarities = np.stack([self._entries[k].embedding for k in keys]) @ embedding
+        best = int(np.argmax(similarities))
+        return keys[best] if similarities[best] >= self.threshold else None
+
+
+def _key(scope: str, query: str) -> str:
+    return hashlib.sha256(f"{scope}\x00{query.strip().lower()}".encode()).hexdigest()
+
+
+def _normalize(embedding: list[float]) -> np.ndarray:
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class CachedPgVector(PgVector):
+    """PgVector with a semantic search cache, cleared on every write."""
+
+    def __init__(self, *args: Any, search_cache: SemanticSearchCache | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.search_cache = search_cache if search_cache is not None else SemanticSearchCache()
+
+    def search(self, query: str, limit: int = 5, filters: Any = None, *args: Any, **kwargs: Any) -> list[Document]:
+        scope = f"{limit}:{filters!r}:{args!r}:{sorted(kwargs.items())!r}"
+        embedding = self._query_embedding(query)
+        cached = self.search_cache.get(scope, query, embedding)
+        if cached is not None:
+            return cached
+        documents = super().search(query, limit, filters, *args, **kwargs)
+        self.search_cache.put(scope, query, embedding, documents)
+        return documents
+
+    def _query_embedding(self, query: str) -> list[float] | None:
+        # With the embedding cache this is also the embedding PgVector's search reuses
+        try:
+            return self.embedder.get_embedding(query) or None
+        except Exception as e:
+            logger.warning(f"Could not embed query for search cache: {e}")
+            return None
+
+    # Writes: clear cached results, then delegate
+
+    def insert(self, *args: Any, **kwargs: Any) -> None:
+        self.search_cache.clear()
+        return super().insert(*args, **kwargs)
+
+    async def async_insert(self, *args: Any, **kwargs: Any) -> None:
+        self.search_cache.clear()
+        return await super().async_insert(*args, **kwargs)
+
+    def upsert(self, *args: Any, **kwargs: Any) -> None:
+        self.search_cache.clear()
+        return super().upsert(*args, **kwargs)
+
+    async def async_upsert(self, *args: Any, **kwargs: Any) -> None:
+        self.search_cache.clear()
+        return await super().async_upsert(*args, **kwargs)
+
+    def update_metadata(self, *args: Any, **kwargs: Any) -> None:
+        self.search_cache.clear()
+        return super().update_metadata(*args, **kwargs)
+
+    def delete(self, *args: Any, **kwargs: Any) -> bool:
+        self.search_cache.clear()
+        return super().delete(*args, **kwargs)
+
+    def delete_by_id(self, *args: Any, **kwargs: Any) -> bool:
+        self.search_cache.clear()
+        return super().delete_by_id(*args, **kwargs)
+
+    def delete_by_name(self, *args: Any, **kwargs: Any) -> bool:
+        self.search_cache.clear()
+        return super().delete_by_name(*args, **kwargs)
+
+    def delete_by_metadata(self, *args: Any, **kwargs: Any) -> bool:
+        self.search_cache.clear()
+        return super().delete_by_metadata(*args, **kwargs)
+
+    def delete_by_content_id(self, *args: Any, **kwargs: Any) -> bool:
+        self.search_cache.clear()
+        return super().delete_by_content_id(*args, **kwargs)
+
+    def drop(self) -> None:
+        self.search_cache.clear()
+        return super().drop()
@@ -0,0 +1,182 @@
+"""
+SQL guard for agent-generated queries.
+
+Read-only queries are checked before they run:
+- A LIMIT is added when the query has none
+- EXPLAIN estimates cost and row count, and queries over budget are rejected
+  with a short explanation the model can act on
+- Every statement runs under a statement timeout
+"""
+
+import json
+import re
+from typing import Any
+
+from agno.tools.sql import SQLTools
+from agno.utils.log import logger
+from db import get_engine
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DatabaseError, OperationalError
+
+# Defaults, overridable per toolkit
+DEFAULT_LIMIT = 50
+MAX_PLAN_COST = 100_000.0
+MAX_PLAN_ROWS = 10_000
+STATEMENT_TIMEOUT_MS = 30_000
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<string>'(?:[^']|'')*')        # string literal, kept verbatim
+    | (?P<ident>"(?:[^"]|"")*")       # quoted identifier, kept verbatim
+    | (?P<comment>--[^\n]*|/\*.*?\*/) # comments, dropped
+    | (?P<space>\s+)                  # whitespace, collapsed
+    | (?P<other>[^'"\s-]+|-)          # everything else, lowercased
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+_WRITE_KEYWORDS = {"insert", "update", "delete", "drop", "alter", "create", "truncate", "grant", "into"}
+
+_TRAILING_LIMIT_RE = re.compile(r"\blimit\s+(\d+|all)(\s+offset\s+\d+)?$|\bfetch\s+(first|next)\b[^()]*$")
+
+
+def normalize_sql(sql: str) -> str:
+    """Canonicalize SQL: collapse whitespace, drop comments and trailing semicolons.
+
+    Keywords and unquoted identifiers are lowercased. String literals and
+    quoted identifiers are kept verbatim since they change the result.
+    """
+    parts: list[str] = []
+    for m in _TOKEN_RE.finditer(sql):
+        kind = m.lastgroup
+        if kind in ("string", "ident"):
+            parts.append(m.group())
+        elif kind in ("space", "comment"):
+            if parts and parts[-1] != " ":
+                parts.append(" ")
+        else:
+            parts.append(m.group().lower())
+    return "".join(parts).strip().rstrip(";").strip()
+
+
+def is_read_only(sql: str) -> bool:
+    """True for statements that only read (SELECT / WITH ... SELECT)."""
+    normalized = normalize_sql(sql)
+    if not normalized.startswith(("select", "with")):
+        return False
+    words = set(re.findall(r"[a-z_]+", re.sub(r"'(?:[^']|'')*'", "", normalized)))
+    return not words & _WRITE_KEYWORDS
+
+
+def ensure_limit(sql: str, limit: int = DEFAULT_LIMIT) -> tuple[str, bool]:
+    """Append ``LIMIT limit`` to a read-only query without a top-level limit.
+
+    Returns:
+        ``(sql, added)`` where added is True if the query was rewritten.
+    """
+    normalized = normalize_sql(sql)
+    if _TRAILING_LIMIT_RE.search(normalized):
+        return sql, False
+    stripped = sql.strip().rstrip(";").rstrip()
+    # On its own line so a trailing line comment can't swallow it
+    return f"{stripped}\nLIMIT {limit}", True
+
+
+class GuardedSQLTools(SQLTools):
+    """SQLTools that EXPLAINs read-only queries first and enforces limits.
+
+    Args:
+        default_limit: LIMIT added to read-only queries that have none.
+        max_cost: Reject queries whose estimated plan cost is higher.
+        max_rows: Reject queries estimated to return more rows.
+        statement_timeout_ms: Per-statement timeout applied to every query.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        db_url: str | None = None,
+        db_engine: Engine | None = None,
+        default_limit: int = DEFAULT_LIMIT,
+        max_cost: float = MAX_PLAN_COST,
+        max_rows: int = MAX_PLAN_ROWS,
+        statement_timeout_ms: int = STATEMENT_TIMEOUT_MS,
+        **kwargs: Any,
+    ):
+        if db_engine is None and db_url is not None:
+            # Shared pool for every guarded toolkit with this URL and timeout
+            db_engine = get_engine(db_url, statement_timeout_ms=statement_timeout_ms)
+        super().__init__(*args, db_engine=db_engine, **kwargs)
+        self.default_limit = default_limit
+        self.max_cost = max_cost
+        self.max_rows = max_rows
+
+    def run_sql_query(self, query: str, limit: int | None = 10) -> str:
+        """Use this function to run a SQL query and return the result.
+
+        Args:
+            query (str): The query to run.
+            limit (int, optional): The number of rows to return. Defaults to 10. Use `None` to show all results.
+        Returns:
+            str: Result of the SQL query.
+        Notes:
+            - The result may be empty if the query does not return any data.
+        """
+        if not is_read_only(query):
+            return super().run_sql_query(query, limit=limit)
+
+        query, limit_added = ensure_limit(query, self.default_limit)
+        rejection = self.check_plan(query)
+        if rejection:
+            return rejection
+
+        result = super().run_sql_query(query, limit=limit)
+        if limit_added and not result.startswith("Error"):
+            return f"Note: no LIMIT given, added LIMIT {self.default_limit}.\n{result}"
+        return result
+
+    def check_plan(self, query: str) -> str | None:
+        """EXPLAIN ``query`` and return an error message if it is over budget, else None."""
+        if self.db_engine.dialect.name != "postgresql":
+            return None
+
+        try:
+            with self.db_engine.connect() as conn:
+                raw = conn.execute(text(f"EXPLAIN (FORMAT JSON) {query}")).scalar()
+        except (OperationalError, DatabaseError) as e:
+            # Let the real execution surface syntax errors with full context
+            logger.debug(f"EXPLAIN failed, skipping cost check: {e}")
+            return None
+
+        plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+        cost = float(plan.get("Total Cost", 0))
+        rows = int(plan.get("Plan Rows", 0))
+
+        if cost <= self.max_cost and rows <= self.max_rows:
+            return None
+
+        scans = _scan_nodes(plan)
+        scan_desc = ", ".join(f"{node} on {relation}" for node, relation in scans[:3]) or plan.get("Node Type", "")
+        reasons = []
+        if cost > self.max_cost:
+            reasons.append(f"estimated cost {cost:,.0f} exceeds {self.max_cost:,.0f}")
+        if rows > self.max_rows:
+            reasons.append(f"estimated {rows:,} rows exceeds {self.max_rows:,}")
+        return (
+            f"Error: Query rejected before running: {'; '.join(reasons)}. "
+            f"Plan: {scan_desc}. "
+            "Narrow it with WHERE filters, aggregate with GROUP BY, select fewer columns, or use a smaller LIMIT."
+        )
+
+
+def _scan_nodes(plan: dict[str, Any]) -> list[tuple[str, str]]:
+    """Collect (node type, relation) for every table scan in a plan, most expensive first."""
+    nodes: list[tuple[float, str, str]] = []
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        if "Relation Name" in node:
+            nodes.append((float(node.get("Total Cost", 0)), node["Node Type"], node["Relation Name"]))
+        stack.extend(node.get("Plans", []))
+    return [(node_type, relation) for _, node_type, relation in sorted(nodes, reverse=True)]
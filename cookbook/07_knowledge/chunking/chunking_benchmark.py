@@ -0,0 +1,474 @@
+"""
+Chunking Strategy Benchmark
+===========================
+
+Runs each chunking strategy over the same corpora and reports:
+- throughput in documents per second
+- the number of chunks produced
+- the chunk-size distribution
+- peak memory while chunking
+- the retrieval hit rate on a fixed question set
+
+Key concepts:
+- The corpora are `07_knowledge/testing_resources`, read with the matching
+  agno readers, and the chunking examples in this directory as code. Larger
+  synthetic corpora are generated with `--synthetic`.
+- Retrieval is scored offline. The default embedder hashes words into a fixed
+  vector, so results are deterministic and free. `--embedder openai` uses real
+  embeddings, and each distinct text is embedded once.
+- A question counts as a hit when one of the top-k chunks contains its
+  expected answer. Synthetic documents plant one fact per section, with a
+  question that names only the fact's key. An answer split across chunk
+  boundaries counts as a miss.
+- CSV row chunking only runs on spreadsheets and code chunking only on code.
+  Every other strategy runs on the whole corpus. Agentic chunking calls a
+  model, so it only runs when `--agentic-model` is given.
+
+Usage:
+    python cookbook/07_knowledge/chunking/chunking_benchmark.py
+    python cookbook/07_knowledge/chunking/chunking_benchmark.py --synthetic 200 --chunk-size 800 --overlap 100
+    python cookbook/07_knowledge/chunking/chunking_benchmark.py --strategy fixed --strategy markdown --json out.json
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from agno.knowledge.chunking.strategy import ChunkingStrategy
+from agno.knowledge.document.base import Document
+from agno.knowledge.embedder.base import Embedder
+from rich.console import Console
+from rich.table import Table
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+CHUNKING_DIR = Path(__file__).resolve().parent
+RESOURCES_DIR = CHUNKING_DIR.parent / "testing_resources"
+
+# Questions on testing_resources, each with a phrase its answer chunk must contain
+QUESTIONS = [
+    ("How long is cold brew steeped?", "12-24 hours"),
+    ("What is a cappuccino made of?", "Equal parts espresso, steamed milk, and milk foam"),
+    ("Which African countries are notable coffee producers?", "Ethiopia and Kenya"),
+    ("Who revived the personal State of the Union address?", "Woodrow Wilson revived"),
+    ("Which State of the Union address was first streamed on the web?", "2002 address by George W. Bush"),
+    ("When did the ratification of the Twentieth Amendment happen?", "Twentieth Amendment in 1933"),
+    ("Where did Jordan Mitchell do a software engineering internship?", "SnapTech Solutions"),
+    ("Which company does Taylor Brooks work at as a software engineer?", "NeoCode Labs"),
+    ("What is the price of the mechanical keyboard?", "Mechanical Keyboard, Electronics, 89.99"),
+    ("How many Widget A were sold?", "Widget A, 10"),
+    ("Which reader does the fixed size chunking example use?", "FixedSizeChunking()"),
+    ("What similarity threshold does semantic chunking with an agno embedder use?", "similarity_threshold=0.5"),
+]
+
+# Left out of hashed embeddings so questions match on their content words
+STOPWORDS = set(
+    "a an and are as at by did do does for from how i in is it of on or the to was what when where which who".split()
+)
+
+WORDS = (
+    "system data model service request latency cache storage index query report budget team release "
+    "customer region policy review metric signal network cluster schedule contract invoice quarter"
+).split()
+
+SYLLABLES = "ka lo mi nu pe ri so ta ve zo bar dun fel gim hok jas".split()
+
+console = Console()
+
+
+# ---------------------------------------------------------------------------
+# Create Embedders
+# ---------------------------------------------------------------------------
+@dataclass
+class HashingEmbedder(Embedder):
+    """Deterministic bag-of-words embedder: each content word adds +/-1 to a hashed dimension."""
+
+    dimensions: int | None = 2048
+
+    def get_embedding(self, text: str) -> list[float]:
+        vector = [0.0] * self.dimensions
+        for word in re.findall(r"[a-z0-9]+", text.lower()):
+            if word in STOPWORDS:
+                continue
+            digest = hashlib.blake2b(word.encode(), digest_size=8).digest()
+            vector[int.from_bytes(digest[:4], "little") % self.dimensions] += 1.0 if digest[4] & 1 else -1.0
+        norm = math.sqrt(sum(v * v for v in vector))
+        if not norm:
+            # Stopword-only text still needs a unit vector for cosine similarity
+            vector[0], norm = 1.0, 1.0
+        return [v / norm for v in vector]
+
+    def get_embedding_and_usage(self, text: str) -> tuple[list[float], dict | None]:
+        return self.get_embedding(text), None
+
+    async def async_get_embedding(self, text: str) -> list[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> tuple[list[float], dict | None]:
+        return self.get_embedding(text), None
+
+
+@dataclass
+class MemoizedEmbedder(Embedder):
+    """Embeds each distinct text once, so strategies that share chunks share the cost."""
+
+    embedder: Embedder = field(default_factory=HashingEmbedder)
+    calls: int = 0
+
+    def __post_init__(self) -> None:
+        self.dimensions = self.embedder.dimensions
+        self._cache: dict[str, list[float]] = {}
+
+    def get_embedding(self, text: str) -> list[float]:
+        if text not in self._cache:
+            self.calls += 1
+            self._cache[text] = self.embedder.get_embedding(text)
+        return self._cache[text]
+
+    def get_embedding_and_usage(self, text: str) -> tuple[list[float], dict | None]:
+        return self.get_embedding(text), None
+
+    async def async_get_embedding(self, text: str) -> list[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> tuple[list[float], dict | None]:
+        return self.get_embedding(text), None
+
+
+def create_embedder(name: str) -> Embedder:
+    if name == "openai":
+        from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+        return MemoizedEmbedder(embedder=OpenAIEmbedder())
+    # Hashing is cheaper than a cache lookup
+    return HashingEmbedder()
+
+
+# ---------------------------------------------------------------------------
+# Create Corpora
+# ---------------------------------------------------------------------------
+@dataclass
+class CorpusDocument:
+    kind: str  # "text", "table", or "code"
+    document: Document
+
+
+def load_resources() -> list[CorpusDocument]:
+    """testing_resources read with agno's readers, unchunked, plus this directory's examples as code."""
+    from agno.knowledge.reader.markdown_reader import MarkdownReader
+    from agno.knowledge.reader.text_reader import TextReader
+
+    readers: dict[str, tuple[str, type]] = {
+        ".md": ("text", MarkdownReader),
+        ".txt": ("text", TextReader),
+    }
+    try:
+        from agno.knowledge.reader.pdf_reader import PDFReader
+
+        readers[".pdf"] = ("text", PDFReader)
+    except ImportError as e:
+        console.print(f"[dim]Skipping PDFs: {e}[/dim]")
+    try:
+        from agno.knowledge.reader.excel_reader import ExcelReader
+
+        readers[".xlsx"] = ("table", ExcelReader)
+        readers[".xls"] = ("table", ExcelReader)
+    except ImportError as e:
+        console.print(f"[dim]Skipping spreadsheets: {e}[/dim]")
+
+    corpus: list[CorpusDocument] = []
+    for path in sorted(RESOURCES_DIR.iterdir()):
+        if path.suffix not in readers or path.name == "README.md":
+            continue
+        kind, reader_class = readers[path.suffix]
+        try:
+            # Readers don't all take `chunk` in __init__, but every one honours the attribute
+            reader = reader_class()
+            reader.chunk = False
+            corpus += [CorpusDocument(kind, doc) for doc in reader.read(path)]
+        except ImportError as e:
+            console.print(f"[dim]Skipping {path.name}: {e}[/dim]")
+    for path in sorted(CHUNKING_DIR.glob("*.py")):
+        if path.name != Path(__file__).name:
+            corpus.append(CorpusDocument("code", Document(name=path.stem, content=path.read_text())))
+    return corpus
+
+
+def pseudo_word(rng: random.Random, used: set[str]) -> str:
+    while True:
+        word = "".join(rng.choice(SYLLABLES) for _ in range(3))
+        if word not in used:
+            used.add(word)
+            return word
+
+
+def synthetic_corpus(num_docs: int, sections: int, seed: int) -> tuple[list[CorpusDocument], list[tuple[str, str]]]:
+    """Markdown documents with one planted fact per section, and a question for each fact."""
+    rng = random.Random(seed)
+    used: set[str] = set()
+    corpus: list[CorpusDocument] = []
+    questions: list[tuple[str, str]] = []
+    for d in range(num_docs):
+        parts = [f"# Report {d}\n"]
+        for s in range(sections):
+            # Two made-up words name each vault, so a hash collision alone can't match it
+            vault = pseudo_word(rng, used) + " " + pseudo_word(rng, used)
+            code = f"{rng.randrange(16**6):06x}"
+            paragraphs = [" ".join(rng.choices(WORDS, k=rng.randint(40, 120))) + "." for _ in range(rng.randint(2, 5))]
+            paragraphs.insert(rng.randrange(len(paragraphs) + 1), f"The {vault} vault access code is {code}.")
+            parts.append(f"## Section {s}\n\n" + "\n\n".join(paragraphs) + "\n")
+            questions.append((f"What opens {vault}?", f"{vault} vault access code is {code}"))
+        corpus.append(CorpusDocument("text", Document(name=f"report_{d}", content="\n".join(parts))))
+    sample = rng.sample(questions, min(len(questions), 200))
+    return corpus, sample
+
+
+# ---------------------------------------------------------------------------
+# Create Strategies
+# ---------------------------------------------------------------------------
+def create_strategies(
+    chunk_size: int, overlap: int, embedder: Embedder, agentic_model: str | None
+) -> dict[str, tuple[Callable[[], ChunkingStrategy] | None, set | None, str]]:
+    """name -> (factory or None if unavailable, document kinds it applies to or None for all, skip reason)."""
+
+    def fixed() -> ChunkingStrategy:
+        from agno.knowledge.chunking.fixed import FixedSizeChunking
+
+        return FixedSizeChunking(chunk_size=chunk_size, overlap=overlap)
+
+    def recursive() -> ChunkingStrategy:
+        from agno.knowledge.chunking.recursive import RecursiveChunking
+
+        return RecursiveChunking(chunk_size=chunk_size, overlap=overlap)
+
+    def document() -> ChunkingStrategy:
+        from agno.knowledge.chunking.document import DocumentChunking
+
+        return DocumentChunking(chunk_size=chunk_size, overlap=overlap)
+
+    def markdown() -> ChunkingStrategy:
+        from agno.knowledge.chunking.markdown import MarkdownChunking
+
+        return MarkdownChunking(chunk_size=chunk_size, overlap=overlap)
+
+    def code() -> ChunkingStrategy:
+        from agno.knowledge.chunking.code import CodeChunking
+
+        return CodeChunking(chunk_size=chunk_size, language="python")
+
+    def csv_row() -> ChunkingStrategy:
+        from agno.knowledge.chunking.row import RowChunking
+
+        return RowChunking(skip_header=True)
+
+    def semantic() -> ChunkingStrategy:
+        from agno.knowledge.chunking.semantic import SemanticChunking
+
+        # chunk_size is in tokens here; ~4 characters per token keeps chunks comparable
+        return SemanticChunking(embedder=embedder, chunk_size=max(chunk_size // 4, 32))
+
+    def agentic() -> ChunkingStrategy:
+        from agno.knowledge.chunking.agentic import AgenticChunking
+
+        return AgenticChunking(model=agentic_model, max_chunk_size=chunk_size)
+
+    return {
+        "fixed": (fixed, None, ""),
+        "recursive": (recursive, None, ""),
+        "document": (document, None, ""),
+        "markdown": (markdown, None, ""),
+        "code": (code, {"code"}, ""),
+        "csv_row": (csv_row, {"table"}, ""),
+        "semantic": (semantic, None, ""),
+        "agentic": (agentic if agentic_model else None, None, "needs --agentic-model"),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Create Measurements
+# ---------------------------------------------------------------------------
+def chunk_all(strategy: ChunkingStrategy, documents: list[Document]) -> list[Document]:
+    chunks: list[Document] = []
+    for doc in documents:
+        chunks += strategy.chunk(doc)
+    return chunks
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.split()).lower()
+
+
+def hit_rate(
+    sources: list[Document],
+    chunks: list[Document],
+    questions: list[tuple[str, str]],
+    embedder: Embedder,
+    top_k: int,
+) -> tuple[float, int]:
+    """Share of questions whose answer is in the top-k chunks by cosine similarity.
+
+    Questions are scored when their answer is in one of the source documents, so
+    an answer split across two chunks counts as a miss.
+    """
+    source_texts = [normalize(d.content) for d in sources]
+    answerable = [(q, normalize(a)) for q, a in questions if any(normalize(a) in t for t in source_texts)]
+    if not answerable or not chunks:
+        return 0.0, len(answerable)
+    texts = [normalize(c.content) for c in chunks]
+    # Sparse, so hashed vectors stay small and cheap to score
+    vectors = [{i: v for i, v in enumerate(embedder.get_embedding(c.content)) if v} for c in chunks]
+    hits = 0
+    for question, answer in answerable:
+        query = [(i, q) for i, q in enumerate(embedder.get_embedding(question)) if q]
+        scores = [sum(q * vector.get(i, 0.0) for i, q in query) for vector in vectors]
+        ranked = sorted(range(len(chunks)), key=lambda i: -scores[i])[:top_k]
+        hits += any(answer in texts[i] for i in ranked)
+    return hits / len(answerable), len(answerable)
+
+
+def measure(
+    make_strategy: Callable[[], ChunkingStrategy],
+    corpus: list[CorpusDocument],
+    questions: list[tuple[str, str]],
+    embedder: Embedder,
+    top_k: int,
+    trace_memory: bool,
+) -> dict[str, Any]:
+    documents = [c.document for c in corpus]
+    strategy = make_strategy()
+    start = time.perf_counter()
+    chunks = chunk_all(strategy, documents)
+    seconds = time.perf_counter() - start
+
+    # Peak memory in a separate pass, since tracing slows every allocation
+    peak_kib = None
+    if trace_memory:
+        tracemalloc.start()
+        chunk_all(make_strategy(), documents)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_kib = peak / 1024
+
+    sizes = sorted(len(c.content) for c in chunks) or [0]
+    rate, scored = hit_rate(documents, chunks, questions, embedder, top_k)
+    return {
+        "status": "ok",
+        "docs": len(documents),
+        "docs_per_sec": len(documents) / seconds if seconds else 0.0,
+        "chunks": len(chunks),
+        "size_min": sizes[0],
+        "size_p50": statistics.median(sizes),
+        "size_p95": sizes[min(len(sizes) - 1, int(len(sizes) * 0.95))],
+        "size_max": sizes[-1],
+        "peak_kib": peak_kib,
+        "hit_rate": rate,
+        "questions": scored,
+    }
+
+
+def display(title: str, results: dict[str, dict[str, Any]], top_k: int) -> None:
+    table = Table(title=title)
+    table.add_column("Strategy")
+    for column in ("Docs", "Docs/s", "Chunks", "Size p50", "Size p95", "Size max", "Peak KiB", f"Hit@{top_k}"):
+        table.add_column(column, justify="right")
+    for name, r in results.items():
+        if r["status"] != "ok":
+            table.add_row(name, f"[dim]{r['status']}[/dim]")
+            continue
+        table.add_row(
+            name,
+            str(r["docs"]),
+            f"{r['docs_per_sec']:.1f}",
+            str(r["chunks"]),
+            f"{r['size_p50']:.0f}",
+            str(r["size_p95"]),
+            str(r["size_max"]),
+            f"{r['peak_kib']:.0f}" if r["peak_kib"] is not None else "-",
+            f"{r['hit_rate']:.0%} of {r['questions']}" if r["questions"] else "-",
+        )
+    console.print(table)
+    for name, r in results.items():
+        if r["status"] != "ok":
+            console.print(f"[dim]{name} {r['status']}: {r.get('error', '')}[/dim]")
+
+
+# ---------------------------------------------------------------------------
+# Run Benchmark
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare chunking strategies on throughput and retrieval")
+    parser.add_argument("--strategy", action="append", help="Strategies to run (default: all)")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Characters per chunk")
+    parser.add_argument("--overlap", type=int, default=0)
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument("--synthetic", type=int, action="append", default=[], help="Also run N synthetic documents")
+    parser.add_argument("--sections", type=int, default=8, help="Sections per synthetic document")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--embedder", choices=["hashing", "openai"], default="hashing")
+    parser.add_argument("--agentic-model", help="Model for agentic chunking, e.g. openai:gpt-5.4-mini")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--json", type=Path, help="Write results to this file")
+    args = parser.parse_args()
+
+    embedder = create_embedder(args.embedder)
+    strategies = create_strategies(args.chunk_size, args.overlap, embedder, args.agentic_model)
+    selected = args.strategy or list(strategies)
+    unknown = set(selected) - set(strategies)
+    if unknown:
+        parser.error(f"Unknown strategies: {', '.join(sorted(unknown))}. Choose from {', '.join(strategies)}")
+
+    corpora: dict[str, tuple[list[CorpusDocument], list[tuple[str, str]]]] = {
+        "testing_resources": (load_resources(), QUESTIONS)
+    }
+    for num_docs in args.synthetic:
+        corpora[f"synthetic_{num_docs}"] = synthetic_corpus(num_docs, args.sections, args.seed)
+
+    all_results: dict[str, dict[str, dict[str, Any]]] = {}
+    for corpus_name, (corpus, questions) in corpora.items():
+        all_results[corpus_name] = {}
+        for name in selected:
+            make_strategy, kinds, reason = strategies[name]
+            if make_strategy is None:
+                all_results[corpus_name][name] = {"status": "skipped", "error": reason}
+                continue
+            subset = [c for c in corpus if kinds is None or c.kind in kinds]
+            if not subset:
+                all_results[corpus_name][name] = {"status": "skipped", "error": f"no {'/'.join(kinds)} documents"}
+                continue
+            console.print(f"[cyan]{corpus_name}: {name}...[/cyan]")
+            try:
+                # Agentic chunking would pay for its model calls twice
+                trace = not args.no_memory and name != "agentic"
+                result = measure(make_strategy, subset, questions, embedder, args.top_k, trace)
+            except ImportError as e:
+                result = {"status": "skipped", "error": str(e)}
+            except Exception as e:
+                result = {"status": "error", "error": str(e).splitlines()[0] if str(e) else type(e).__name__}
+            all_results[corpus_name][name] = result
+        display(
+            f"{corpus_name} (chunk size {args.chunk_size}, overlap {args.overlap})",
+            all_results[corpus_name],
+            args.top_k,
+        )
+
+    if isinstance(embedder, MemoizedEmbedder):
+        console.print(f"Embedded {embedder.calls} distinct texts with the {args.embedder} embedder")
+    if args.json:
+        settings = {
+            "chunk_size": args.chunk_size,
+            "overlap": args.overlap,
+            "top_k": args.top_k,
+            "embedder": args.embedder,
+        }
+        args.json.write_text(json.dumps({"settings": settings, "corpora": all_results}, indent=2))
+        console.print(f"Results written to {args.json}")
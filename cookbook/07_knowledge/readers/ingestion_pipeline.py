@@ -0,0 +1,521 @@
+"""
+Streaming Ingestion Pipeline
+============================
+
+Ingests large document drops with bounded memory on every core. The stages:
+- stream CSV rows, Excel rows, PDF pages and PPTX slides as page-sized documents
+- chunk the pages in a process pool
+- embed the chunks in batches
+- write the chunks to the vector DB in bulk
+
+Key concepts:
+- Each source yields pages in the same format as the matching agno reader
+  (`CSVReader`, `ExcelReader`, `PDFReader` with `split_on_pages`,
+  `PPTXReader`), so chunking strategies behave the same. CSV, Excel and text
+  files are read incrementally. pypdf and python-pptx open the whole file, but
+  only one page of text is held at a time.
+- Back-pressure: bounded queues sit between the stages. A byte budget covers
+  every page from when it is read until its last chunk is written. The reader
+  waits while the budget is full, so memory stays under `max_buffer_mb`
+  however large the input is.
+- Chunking runs in worker processes and is the only CPU-bound stage. The
+  vector DB embeds each batch as it inserts it, with the embedder's batch API
+  when `enable_batch` is set.
+- A file version is identified by its content hash (path, size and
+  modification time). An unchanged file is skipped unless `replace=True`. A
+  changed file replaces the chunks of its previous version. A file that fails
+  partway has its chunks removed again, so the next run retries it.
+
+Usage:
+    python cookbook/07_knowledge/readers/ingestion_pipeline.py cookbook/07_knowledge/testing_resources
+    python cookbook/07_knowledge/readers/ingestion_pipeline.py /data/drop --workers 8 --max-buffer-mb 256
+    python cookbook/07_knowledge/readers/ingestion_pipeline.py /data/drop --dry-run
+"""
+
+import argparse
+import asyncio
+import csv
+import hashlib
+import multiprocessing
+import os
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+from agno.knowledge.chunking.fixed import FixedSizeChunking
+from agno.knowledge.chunking.strategy import ChunkingStrategy
+from agno.knowledge.document.base import Document
+from agno.knowledge.reader.utils.spreadsheet import convert_xls_cell_value, row_to_csv_line, stringify_cell_value
+from agno.utils.log import log_error, log_info, log_warning
+from agno.vectordb.base import VectorDb
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+SUPPORTED_SUFFIXES = (".csv", ".xlsx", ".xls", ".pdf", ".pptx", ".txt", ".md")
+
+# Seconds a partial batch waits for more chunks before it is flushed
+FLUSH_INTERVAL = 0.5
+
+
+# ---------------------------------------------------------------------------
+# Create Sources
+# ---------------------------------------------------------------------------
+def _page(path: Path, number: int, content: str, **meta_data: Any) -> Document:
+    # A stable per-page ID keeps chunk IDs unique across the pages of one file
+    return Document(
+        name=path.stem,
+        id=f"{path.stem}_{number}",
+        content=content,
+        meta_data={"source": str(path.resolve()), "page": number, **meta_data},
+    )
+
+
+def _row_pages(path: Path, rows: Iterator[str], rows_per_page: int, **meta_data: Any) -> Iterator[Document]:
+    lines: list[str] = []
+    number, start_row, row = 0, 1, 0
+    for row, line in enumerate(rows, start=1):
+        if line:
+            lines.append(line)
+        if len(lines) >= rows_per_page:
+            number += 1
+            yield _page(path, number, "\n".join(lines), start_row=start_row, rows=len(lines), **meta_data)
+            lines, start_row = [], row + 1
+    if lines:
+        yield _page(path, number + 1, "\n".join(lines), start_row=start_row, rows=len(lines), **meta_data)
+
+
+def stream_csv(path: Path, rows_per_page: int, encoding: str = "utf-8") -> Iterator[Document]:
+    """Pages of ``rows_per_page`` rows, formatted like ``CSVReader``."""
+    with path.open(newline="", encoding=encoding) as f:
+        rows = (", ".join(stringify_cell_value(cell) for cell in row) for row in csv.reader(f))
+        yield from _row_pages(path, rows, rows_per_page)
+
+
+def stream_xlsx(path: Path, rows_per_page: int) -> Iterator[Document]:
+    """Pages of rows per sheet, formatted like ``ExcelReader``; openpyxl's read-only mode streams rows."""
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(filename=str(path), read_only=True, data_only=True)
+    try:
+        for index, sheet in enumerate(workbook.worksheets, start=1):
+            rows = (row_to_csv_line(row) for row in sheet.iter_rows(values_only=True))
+            for page in _row_pages(path, rows, rows_per_page, sheet_name=sheet.title, sheet_index=index):
+                page.id = f"{path.stem}_{index}_{page.meta_data['page']}"
+                yield page
+    finally:
+        workbook.close()
+
+
+def stream_xls(path: Path, rows_per_page: int) -> Iterator[Document]:
+    """Pages of rows per sheet; xlrd loads one sheet at a time with ``on_demand``."""
+    import xlrd
+
+    workbook = xlrd.open_workbook(filename=str(path), on_demand=True)
+    try:
+        for index in range(workbook.nsheets):
+            sheet = workbook.sheet_by_index(index)
+            rows = (
+                row_to_csv_line(
+                    [
+                        convert_xls_cell_value(sheet.cell_value(r, c), sheet.cell_type(r, c), workbook.datemode)
+                        for c in range(sheet.ncols)
+                    ]
+                )
+                for r in range(sheet.nrows)
+            )
+            for page in _row_pages(path, rows, rows_per_page, sheet_name=sheet.name, sheet_index=index + 1):
+                page.id = f"{path.stem}_{index + 1}_{page.meta_data['page']}"
+                yield page
+            workbook.unload_sheet(index)
+    finally:
+        workbook.release_resources()
+
+
+def stream_pdf(path: Path) -> Iterator[Document]:
+    """One document per page, like ``PDFReader(split_on_pages=True)``; pypdf parses pages lazily."""
+    from pypdf import PdfReader
+
+    for number, page in enumerate(PdfReader(str(path)).pages, start=1):
+        text = page.extract_text() or ""
+        if text.strip():
+            yield _page(path, number, text)
+
+
+def stream_pptx(path: Path) -> Iterator[Document]:
+    """One document per slide, formatted like ``PPTXReader``."""
+    from pptx import Presentation
+    from pptx.shapes.group import GroupShape
+
+    def shape_texts(shapes: Any) -> list[str]:
+        texts: list[str] = []
+        for shape in shapes:
+            if isinstance(shape, GroupShape):
+                texts.extend(shape_texts(shape.shapes))
+            elif getattr(shape, "text", "").strip():
+                texts.append(shape.text.strip())
+        return texts
+
+    for number, slide in enumerate(Presentation(str(path)).slides, start=1):
+        texts = shape_texts(slide.shapes)
+        if texts:
+            yield _page(path, number, f"Slide {number}:\n" + "\n".join(texts))
+
+
+def stream_text(path: Path, page_chars: int) -> Iterator[Document]:
+    """Pages of whole lines up to ``page_chars`` characters."""
+    with path.open(encoding="utf-8", errors="replace") as f:
+        lines: list[str] = []
+        size, number = 0, 0
+        for line in f:
+            lines.append(line)
+            size += len(line)
+            if size >= page_chars:
+                number += 1
+                yield _page(path, number, "".join(lines))
+                lines, size = [], 0
+        if lines:
+            yield _page(path, number + 1, "".join(lines))
+
+
+def stream_file(path: Path, rows_per_page: int, page_chars: int) -> Iterator[Document]:
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        return stream_csv(path, rows_per_page)
+    if suffix == ".xlsx":
+        return stream_xlsx(path, rows_per_page)
+    if suffix == ".xls":
+        return stream_xls(path, rows_per_page)
+    if suffix == ".pdf":
+        return stream_pdf(path)
+    if suffix == ".pptx":
+        return stream_pptx(path)
+    return stream_text(path, page_chars)
+
+
+def discover(paths: list[Path]) -> list[Path]:
+    files: list[Path] = []
+    for path in paths:
+        candidates = sorted(path.rglob("*")) if path.is_dir() else [path]
+        files += [p for p in candidates if p.is_file() and p.suffix.lower() in SUPPORTED_SUFFIXES]
+    return files
+
+
+def content_hash(path: Path) -> str:
+    """Identifies a file version without reading it."""
+    stat = path.stat()
+    return hashlib.sha256(f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Create Chunking Workers
+# ---------------------------------------------------------------------------
+_worker_strategy: ChunkingStrategy | None = None
+
+
+def _init_worker(strategy: ChunkingStrategy) -> None:
+    # Sent once per worker instead of with every page
+    global _worker_strategy
+    _worker_strategy = strategy
+
+
+def _chunk_page(page: Document) -> list[Document]:
+    return _worker_strategy.chunk(page) if _worker_strategy else [page]
+
+
+# ---------------------------------------------------------------------------
+# Create Pipeline
+# ---------------------------------------------------------------------------
+class ByteBudget:
+    """Caps the bytes in flight; a single item larger than the cap is admitted alone."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+        self.peak = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self, size: int) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.used == 0 or self.used + size <= self.limit)
+            self.used += size
+            self.peak = max(self.peak, self.used)
+
+    async def release(self, size: int) -> None:
+        async with self._condition:
+            self.used -= size
+            self._condition.notify_all()
+
+
+@dataclass
+class IngestionStats:
+    files: int = 0
+    skipped_files: int = 0
+    failed_files: int = 0
+    pages: int = 0
+    chunks: int = 0
+    written: int = 0
+    failed_chunks: int = 0
+    bytes_read: int = 0
+    seconds: float = 0.0
+    peak_buffer_bytes: int = 0
+    peak_rss_mib: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _FileTicket:
+    """Tracks a file until its last chunk is written; a file that fails anywhere is removed again."""
+
+    path: Path
+    content_hash: str
+    written: int = 0
+    failed: bool = False
+
+
+@dataclass
+class _PageTicket:
+    """Holds a page's budget until its last chunk is written."""
+
+    size: int
+    remaining: int = 0
+
+
+@dataclass
+class IngestionPipeline:
+    """Read -> chunk (process pool) -> embed (batched) -> write (bulk), under a fixed memory budget."""
+
+    vector_db: VectorDb | None
+    chunking_strategy: ChunkingStrategy = field(default_factory=lambda: FixedSizeChunking(chunk_size=2000))
+    workers: int = max((os.cpu_count() or 2) - 1, 1)
+    embed_batch_size: int = 100
+    writers: int = 2
+    max_buffer_mb: int = 64
+    rows_per_page: int = 1000
+    page_chars: int = 20_000
+    replace: bool = False
+
+    async def aingest(self, paths: list[Path]) -> IngestionStats:
+        stats = IngestionStats()
+        budget = ByteBudget(self.max_buffer_mb * 1024 * 1024)
+        pages: asyncio.Queue = asyncio.Queue(maxsize=self.workers * 2)
+        chunks: asyncio.Queue = asyncio.Queue(maxsize=self.embed_batch_size * self.writers * 2)
+        start = time.perf_counter()
+
+        # spawn: worker processes don't inherit the event loop's threads
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.chunking_strategy,),
+        ) as pool:
+            chunkers = [
+                asyncio.create_task(self._chunk(pool, pages, chunks, budget, stats)) for _ in range(self.workers)
+            ]
+            writers = [asyncio.create_task(self._write(chunks, budget, stats)) for _ in range(self.writers)]
+            files = await self._read(discover(paths), pages, budget, stats)
+            for _ in chunkers:
+                await pages.put(None)
+            await asyncio.gather(*chunkers)
+            for _ in writers:
+                await chunks.put(None)
+            await asyncio.gather(*writers)
+
+        # Every write has finished, so nothing of a failed file can land after this
+        for file in files:
+            if file.failed:
+                await self._remove(file, stats)
+
+        stats.seconds = time.perf_counter() - start
+        stats.peak_buffer_bytes = budget.peak
+        stats.peak_rss_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        return stats
+
+    def ingest(self, paths: list[Path]) -> IngestionStats:
+        return asyncio.run(self.aingest(paths))
+
+    async def _read(
+        self, files: list[Path], pages: asyncio.Queue, budget: ByteBudget, stats: IngestionStats
+    ) -> list[_FileTicket]:
+        tickets: list[_FileTicket] = []
+        for path in files:
+            file = _FileTicket(path, content_hash(path))
+            try:
+                if self.vector_db is not None and not await self._prepare(file):
+                    stats.skipped_files += 1
+                    continue
+            except Exception as e:
+                stats.failed_files += 1
+                stats.errors.append(f"{path}: {e}")
+                log_error(f"Error preparing {path}: {e}")
+                continue
+            stats.files += 1
+            tickets.append(file)
+            stream = stream_file(path, self.rows_per_page, self.page_chars)
+            try:
+                while True:
+                    # File reads and parsing stay off the event loop
+                    page = await asyncio.to_thread(next, stream, None)
+                    if page is None:
+                        break
+                    # Chunk IDs derive from the page ID; the hash keeps same-named files apart
+                    page.id = f"{file.content_hash[:16]}_{page.id}"
+                    size = len(page.content.encode())
+                    await budget.acquire(size)
+                    stats.pages += 1
+                    stats.bytes_read += size
+                    await pages.put((file, page, _PageTicket(size)))
+            except Exception as e:
+                # Pages already queued still drain; the file's chunks are removed after the last write
+                file.failed = True
+                stats.errors.append(f"{path}: {e}")
+                log_error(f"Error reading {path}: {e}")
+        return tickets
+
+    async def _prepare(self, file: _FileTicket) -> bool:
+        """Whether to ingest ``file``; the chunks of any other version of it are deleted first."""
+        if not self.replace and await asyncio.to_thread(self.vector_db.content_hash_exists, file.content_hash):
+            log_info(f"Skipping {file.path}: already ingested")
+            return False
+        if not await asyncio.to_thread(self.vector_db.delete_by_metadata, {"source": str(file.path.resolve())}):
+            raise RuntimeError("could not delete the chunks of its previous version")
+        return True
+
+    async def _remove(self, file: _FileTicket, stats: IngestionStats) -> None:
+        """Delete what was written of a failed file, so the next run ingests it again."""
+        stats.failed_files += 1
+        stats.written -= file.written
+        stats.failed_chunks += file.written
+        if self.vector_db is not None and file.written:
+            await asyncio.to_thread(self.vector_db.delete_by_metadata, {"source": str(file.path.resolve())})
+            log_warning(f"Removed {file.written} chunks of partially ingested {file.path}")
+
+    async def _chunk(
+        self,
+        pool: ProcessPoolExecutor,
+        pages: asyncio.Queue,
+        chunks: asyncio.Queue,
+        budget: ByteBudget,
+        stats: IngestionStats,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while (item := await pages.get()) is not None:
+            file, page, ticket = item
+            try:
+                page_chunks = [] if file.failed else await loop.run_in_executor(pool, _chunk_page, page)
+            except Exception as e:
+                file.failed = True
+                stats.errors.append(f"{file.path} page {page.meta_data.get('page')}: {e}")
+                log_error(f"Error chunking {page.id}: {e}")
+                page_chunks = []
+            if not page_chunks:
+                await budget.release(ticket.size)
+                continue
+            ticket.remaining = len(page_chunks)
+            stats.chunks += len(page_chunks)
+            for chunk in page_chunks:
+                await chunks.put((file, chunk, ticket))
+
+    async def _write(self, chunks: asyncio.Queue, budget: ByteBudget, stats: IngestionStats) -> None:
+        batch: list[tuple[_FileTicket, Document, _PageTicket]] = []
+        finished = False
+        while not finished:
+            try:
+                item = await asyncio.wait_for(chunks.get(), timeout=FLUSH_INTERVAL)
+                if item is None:
+                    finished = True
+                else:
+                    batch.append(item)
+                    if len(batch) < self.embed_batch_size:
+                        continue
+            except asyncio.TimeoutError:
+                # Flush the partial batch: the reader may be waiting on budget it holds
+                pass
+            if batch:
+                await self._flush(batch, stats)
+                for _, _, ticket in batch:
+                    ticket.remaining -= 1
+                    if ticket.remaining == 0:
+                        await budget.release(ticket.size)
+                batch = []
+
+    async def _flush(self, batch: list[tuple[_FileTicket, Document, _PageTicket]], stats: IngestionStats) -> None:
+        # Chunks of a file that already failed would only be deleted again
+        batch = [item for item in batch if not item[0].failed]
+        if self.vector_db is None or not batch:
+            return
+        by_file: dict[str, tuple[_FileTicket, list[Document]]] = {}
+        for file, chunk, _ in batch:
+            by_file.setdefault(file.content_hash, (file, []))[1].append(chunk)
+        for file, file_chunks in by_file.values():
+            # The vector DB embeds and writes; a batch no larger than embed_batch_size commits as a whole
+            try:
+                await self.vector_db.async_insert(file.content_hash, file_chunks, batch_size=self.embed_batch_size)
+            except Exception as e:
+                self._fail([(file, c, None) for c in file_chunks], stats, f"Error writing {file.path}: {e}")
+                continue
+            file.written += len(file_chunks)
+            stats.written += len(file_chunks)
+            # A chunk whose embedding failed is stored without one, so the file is removed and retried
+            unembedded = sum(1 for c in file_chunks if not c.embedding)
+            if unembedded:
+                file.failed = True
+                stats.errors.append(f"{file.path}: {unembedded} chunks failed to embed")
+                log_error(f"{unembedded} chunks of {file.path} failed to embed")
+
+    def _fail(self, batch: list[tuple[_FileTicket, Document, Any]], stats: IngestionStats, message: str) -> None:
+        for file, _, _ in batch:
+            file.failed = True
+        stats.failed_chunks += len(batch)
+        stats.errors.append(message)
+        log_error(message)
+
+
+# ---------------------------------------------------------------------------
+# Run Pipeline
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream files into a vector DB with bounded memory")
+    parser.add_argument("paths", nargs="*", type=Path, default=[Path("cookbook/07_knowledge/testing_resources")])
+    parser.add_argument("--table", default="ingestion_pipeline_demo")
+    parser.add_argument("--db-url", default="postgresql+psycopg://ai:ai@localhost:5532/ai")
+    parser.add_argument("--workers", type=int, default=IngestionPipeline.workers)
+    parser.add_argument("--embed-batch-size", type=int, default=100)
+    parser.add_argument("--max-buffer-mb", type=int, default=64)
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    parser.add_argument("--rows-per-page", type=int, default=1000)
+    parser.add_argument("--replace", action="store_true", help="Re-ingest files that are already stored")
+    parser.add_argument("--dry-run", action="store_true", help="Read and chunk only; no embedding or writes")
+    args = parser.parse_args()
+
+    vector_db = None
+    if not args.dry_run:
+        from agno.knowledge.embedder.openai import OpenAIEmbedder
+        from agno.vectordb.pgvector import PgVector
+
+        embedder = OpenAIEmbedder(enable_batch=True, batch_size=args.embed_batch_size)
+        vector_db = PgVector(table_name=args.table, db_url=args.db_url, embedder=embedder)
+        vector_db.create()
+
+    pipeline = IngestionPipeline(
+        vector_db=vector_db,
+        chunking_strategy=FixedSizeChunking(chunk_size=args.chunk_size),
+        workers=args.workers,
+        embed_batch_size=args.embed_batch_size,
+        max_buffer_mb=args.max_buffer_mb,
+        rows_per_page=args.rows_per_page,
+        replace=args.replace,
+    )
+    stats = pipeline.ingest(args.paths)
+
+    print(f"Files: {stats.files} ingested, {stats.skipped_files} skipped, {stats.failed_files} failed")
+    print(f"Pages: {stats.pages}  Chunks: {stats.chunks}  Written: {stats.written}  Failed: {stats.failed_chunks}")
+    print(f"Read {stats.bytes_read / 1e6:.1f} MB in {stats.seconds:.1f}s ({stats.pages / stats.seconds:.0f} pages/s)")
+    print(
+        f"Peak buffer: {stats.peak_buffer_bytes / 2**20:.1f} MiB  Peak RSS (main process): {stats.peak_rss_mib:.0f} MiB"
+    )
+    for error in stats.errors[:10]:
+        print(f"Error: {error}")
@@ -0,0 +1,333 @@
+"""
+Import-Time and Cold-Start Benchmark
+====================================
+
+Measures what a fresh process pays before it can answer. It covers:
+- importing `agno` and its core packages
+- importing each model provider module
+- importing each `01_demo` agent package
+- the time to a first response on a synthetic model
+
+Key concepts:
+- Every sample is a fresh interpreter, so nothing is already imported or cached.
+  Each target reports its in-process import time, the process wall time minus
+  a bare interpreter's, and peak RSS.
+- `-X importtime` gives a per-package breakdown of where import time goes.
+- Results are appended to a history file and compared with the last run from
+  the same environment, like `run_benchmarks.py`. A significant slowdown or a
+  target that fails to import exits non-zero. Only a provider whose optional
+  SDK isn't installed is skipped.
+
+Usage:
+    python cookbook/09_evals/performance/cold_start.py
+    python cookbook/09_evals/performance/cold_start.py --group core --group demo --repeats 10
+    python cookbook/09_evals/performance/cold_start.py --filter openai --breakdown 20
+"""
+
+import argparse
+import json
+import os
+import pkgutil
+import re
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+from rich.table import Table
+from run_benchmarks import MIN_GATE_SAMPLES, RESULTS_DIR, compare, environment, load_baseline, summarize
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+PERFORMANCE_DIR = Path(__file__).resolve().parent
+REPO_ROOT = PERFORMANCE_DIR.parents[2]
+DEMO_DIR = REPO_ROOT / "cookbook" / "01_demo"
+
+CORE_MODULES = ["agno", "agno.agent", "agno.team", "agno.workflow", "agno.knowledge", "agno.os"]
+DEMO_PACKAGES = ["agents.dash", "agents.gcode", "agents.pal", "agents.scout", "agents.seek"]
+FIRST_RESPONSE = "first_response"
+GROUPS = ("core", "providers", "demo", "first-response")
+
+# Provider SDKs that agno installs only on demand (module and distribution names,
+# normalized). A provider missing one of these is skipped; any other failed
+# import is an error.
+OPTIONAL_PROVIDER_SDKS = {
+    "aioboto3",
+    "anthropic",
+    "azure",
+    "azure_ai_inference",
+    "boto3",
+    "cerebras",
+    "cerebras_cloud_sdk",
+    "cohere",
+    "google",
+    "google_genai",
+    "groq",
+    "huggingface_hub",
+    "ibm_watsonx_ai",
+    "litellm",
+    "llama_api_client",
+    "mistralai",
+    "ollama",
+    "openai",
+    "portkey_ai",
+}
+# "No module named 'x.y'" from Python, "`x` not installed" from agno's provider modules
+MISSING_MODULE_RE = re.compile(r"No module named '([\w.]+)'|`([\w.-]+)` (?:is )?not installed")
+
+# Runs inside each fresh interpreter; prints one JSON line
+IMPORT_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "maxrss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}}))
+"""
+
+FIRST_RESPONSE_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+from agno.agent import Agent
+from synthetic_model import SyntheticModel
+imported = time.perf_counter()
+agent = Agent(model=SyntheticModel(), instructions="Be concise.", telemetry=False)
+agent.run("What is the capital of France?")
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "import_seconds": imported - start,
+                  "maxrss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}))
+"""
+
+console = Console()
+
+
+# ---------------------------------------------------------------------------
+# Create Targets
+# ---------------------------------------------------------------------------
+def provider_modules(python: str) -> list[str]:
+    """Model provider packages of the agno installed for ``python``."""
+    listing = subprocess.run(
+        [python, "-c", "import agno.models, json; print(json.dumps(list(agno.models.__path__)))"],
+        capture_output=True,
+        text=True,
+        env=child_env(),
+    )
+    if listing.returncode != 0:
+        return []
+    paths = json.loads(listing.stdout)
+    return sorted(f"agno.models.{m.name}" for m in pkgutil.iter_modules(paths) if m.ispkg)
+
+
+def targets(groups: list[str], python: str, filters: list[str]) -> list[tuple[str, str]]:
+    """(group, target) pairs to measure."""
+    selected: list[tuple[str, str]] = []
+    if "core" in groups:
+        selected += [("core", m) for m in CORE_MODULES]
+    if "providers" in groups:
+        selected += [("providers", m) for m in provider_modules(python)]
+    if "demo" in groups:
+        selected += [("demo", m) for m in DEMO_PACKAGES]
+    if "first-response" in groups:
+        selected.append(("first-response", FIRST_RESPONSE))
+    if filters:
+        selected = [(g, t) for g, t in selected if any(f in t for f in filters)]
+    return selected
+
+
+def child_env() -> dict[str, str]:
+    paths = [str(REPO_ROOT), str(PERFORMANCE_DIR), str(DEMO_DIR), os.getenv("PYTHONPATH")]
+    return {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, paths)), "AGNO_TELEMETRY": "false"}
+
+
+# ---------------------------------------------------------------------------
+# Create Measurements
+# ---------------------------------------------------------------------------
+def probe(python: str, target: str, extra_args: list[str] | None = None) -> subprocess.CompletedProcess:
+    code = FIRST_RESPONSE_PROBE if target == FIRST_RESPONSE else IMPORT_PROBE.format(module=target)
+    # Demo packages read paths relative to the demo directory
+    return subprocess.run(
+        [python, *(extra_args or []), "-c", code],
+        cwd=DEMO_DIR,
+        env=child_env(),
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+
+
+def bare_interpreter(python: str, repeats: int) -> dict[str, Any]:
+    """Wall time and RSS of an interpreter that imports nothing."""
+    walls: list[float] = []
+    rss: list[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [python, "-c", "import resource; print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)"],
+            capture_output=True,
+            text=True,
+            env=child_env(),
+        )
+        walls.append(time.perf_counter() - start)
+        rss.append(int(completed.stdout.strip()) / 1024)
+    return {"wall": summarize(walls), "rss_mib": summarize(rss)}
+
+
+def missing_module(stderr: str) -> str | None:
+    """Normalized name of the module a failed import was missing, if any."""
+    match = MISSING_MODULE_RE.search(stderr)
+    if match is None:
+        return None
+    return (match.group(1) or match.group(2)).split(".")[0].lower().replace("-", "_")
+
+
+def measure(python: str, group: str, target: str, repeats: int, bare: dict[str, Any]) -> dict[str, Any]:
+    seconds: list[float] = []
+    walls: list[float] = []
+    rss: list[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        completed = probe(python, target)
+        wall = time.perf_counter() - start
+        if completed.returncode != 0:
+            stderr = completed.stderr.strip()
+            # A provider whose SDK isn't installed can't be imported; that's a skip
+            optional = group == "providers" and missing_module(stderr) in OPTIONAL_PROVIDER_SDKS
+            return {"status": "skipped" if optional else "error", "error": stderr.splitlines()[-1] if stderr else ""}
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        seconds.append(result["seconds"])
+        walls.append(wall - bare["wall"]["median"])
+        rss.append(result["maxrss_kib"] / 1024)
+    return {
+        "status": "ok",
+        "import": summarize(seconds),
+        "net_wall": summarize(walls),
+        "rss_mib": summarize(rss),
+        "net_rss_mib": statistics.median(rss) - bare["rss_mib"]["median"],
+    }
+
+
+def import_breakdown(python: str, target: str, top: int) -> list[dict[str, Any]]:
+    """Self import time per top-level package, from ``-X importtime``."""
+    completed = probe(python, target, ["-X", "importtime"])
+    by_package: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        package = name.split(".")[0]
+        by_package[package] = by_package.get(package, 0) + int(self_us)
+    ranked = sorted(by_package.items(), key=lambda item: -item[1])[:top]
+    return [{"package": package, "self_ms": us / 1000} for package, us in ranked]
+
+
+def apply_gate(report: dict[str, Any], baseline: dict[str, Any] | None, alpha: float, threshold: float) -> list[str]:
+    regressions: list[str] = []
+    if baseline is None:
+        return regressions
+    for target, entry in report["targets"].items():
+        before = baseline.get("targets", {}).get(target, {}).get("import")
+        if entry.get("status") != "ok" or not before:
+            continue
+        entry["vs_baseline"] = comparison = compare(entry["import"], before, alpha, threshold)
+        if comparison["verdict"] == "regression":
+            regressions.append(f"{target} {comparison['change']:+.1%}")
+    return regressions
+
+
+def display(report: dict[str, Any]) -> None:
+    table = Table(title="Cold Start")
+    table.add_column("Group")
+    table.add_column("Target")
+    # For first_response this is the time from process start to the first answer
+    table.add_column("Import ms (95% CI)", justify="right")
+    table.add_column("Net process ms", justify="right")
+    table.add_column("Net RSS MiB", justify="right")
+    table.add_column("vs baseline", justify="right")
+    for target, entry in report["targets"].items():
+        if entry["status"] != "ok":
+            table.add_row(entry["group"], target, f"[dim]{entry['status']}[/dim]", "-", "-", "-")
+            continue
+        imported = entry["import"]
+        comparison = entry.get("vs_baseline")
+        if comparison:
+            style = {"regression": "red", "improvement": "green"}.get(comparison["verdict"], "dim")
+            versus = f"[{style}]{comparison['change']:+.1%}[/{style}]"
+        else:
+            versus = "-"
+        table.add_row(
+            entry["group"],
+            target,
+            f"{imported['median'] * 1000:.1f} ({imported['ci_low'] * 1000:.1f}-{imported['ci_high'] * 1000:.1f})",
+            f"{entry['net_wall']['median'] * 1000:.1f}",
+            f"{entry['net_rss_mib']:.1f}",
+            versus,
+        )
+    console.print(table)
+
+    for target, rows in report.get("breakdown", {}).items():
+        breakdown = Table(title=f"-X importtime: {target} (self time by top-level package)")
+        breakdown.add_column("Package")
+        breakdown.add_column("Self ms", justify="right")
+        for row in rows:
+            breakdown.add_row(row["package"], f"{row['self_ms']:.1f}")
+        console.print(breakdown)
+
+
+# ---------------------------------------------------------------------------
+# Run Benchmark
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure import time and cold start in fresh processes")
+    parser.add_argument("--group", action="append", choices=GROUPS, help="Target groups (default: all)")
+    parser.add_argument("--filter", "-f", action="append", default=[], help="Only targets containing this")
+    parser.add_argument(
+        "--repeats", type=int, default=MIN_GATE_SAMPLES, help="Fresh processes per target (the gate needs ~7+)"
+    )
+    parser.add_argument("--breakdown", type=int, default=10, help="Packages shown per -X importtime breakdown")
+    parser.add_argument("--breakdown-targets", type=int, default=3, help="Slowest targets to break down")
+    parser.add_argument("--python", default=sys.executable, help="Interpreter to measure")
+    parser.add_argument("--report", type=Path, default=RESULTS_DIR / "cold_start.json")
+    parser.add_argument("--history", type=Path, default=RESULTS_DIR / "cold_start_history.jsonl")
+    parser.add_argument("--alpha", type=float, default=0.01)
+    parser.add_argument("--threshold", type=float, default=0.10, help="Minimum relative change to flag")
+    parser.add_argument("--no-history", action="store_true")
+    args = parser.parse_args()
+
+    env = environment()
+    bare = bare_interpreter(args.python, args.repeats)
+    report: dict[str, Any] = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "environment": env,
+        "bare_interpreter": bare,
+        "targets": {},
+        "breakdown": {},
+    }
+    for group, target in targets(args.group or list(GROUPS), args.python, args.filter):
+        console.print(f"[cyan]{group}: {target}...[/cyan]")
+        report["targets"][target] = {"group": group, **measure(args.python, group, target, args.repeats, bare)}
+
+    measured = [(t, e) for t, e in report["targets"].items() if e["status"] == "ok"]
+    for target, _ in sorted(measured, key=lambda item: -item[1]["import"]["median"])[: args.breakdown_targets]:
+        report["breakdown"][target] = import_breakdown(args.python, target, args.breakdown)
+
+    regressions = apply_gate(report, load_baseline(args.history, env), args.alpha, args.threshold)
+    failures = [target for target, entry in report["targets"].items() if entry["status"] == "error"]
+    report["regressions"] = regressions
+    report["failures"] = failures
+    display(report)
+
+    args.report.parent.mkdir(parents=True, exist_ok=True)
+    args.report.write_text(json.dumps(report, indent=2))
+    if not args.no_history:
+        with args.history.open("a") as f:
+            f.write(json.dumps(report) + "\n")
+    console.print(f"Report written to {args.report}")
+    for regression in regressions:
+        console.print(f"[red]Regression: {regression}[/red]")
+    for target in failures:
+        console.print(f"[red]Failed: {target}: {report['targets'][target]['error']}[/red]")
+    raise SystemExit(1 if regressions or failures else 0)
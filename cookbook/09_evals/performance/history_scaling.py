@@ -0,0 +1,292 @@
+"""
+History Scaling Performance Evaluation
+======================================
+
+Demonstrates how per-run cost grows as sessions age. The sweep covers:
+- stored runs in the session
+- `num_history_runs`
+- the number of user memories
+- the share of turns that update agentic memory
+- session state size
+
+Key concepts:
+- Runs use `SyntheticModel`, so the timings are agno's own overhead: loading
+  and saving the session, building context from history and memories, and
+  serializing session state. Provider latency is excluded.
+- The sweep changes one factor at a time from a Dash-like base point
+  (100 stored runs, `num_history_runs=10`, agentic memory updated on 10% of
+  turns). On a memory turn the synthetic model calls `update_user_memory`,
+  so the memory manager's model call and database writes are measured too.
+- Each point reports run latency, database read/write time, prompt size, and
+  memory growth per run.
+
+Usage:
+    python cookbook/09_evals/performance/history_scaling.py
+    python cookbook/09_evals/performance/history_scaling.py --component team --samples 20
+    python cookbook/09_evals/performance/history_scaling.py --axis stored_runs --json history_scaling.json
+"""
+
+import argparse
+import functools
+import json
+import statistics
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+from typing import Any, Callable
+
+from agno.agent import Agent
+from agno.db.base import BaseDb
+from agno.db.schemas.memory import UserMemory
+from agno.db.sqlite import SqliteDb
+from agno.eval.performance import PerformanceEval
+from agno.team.team import Team
+from rich.console import Console
+from rich.table import Table
+from run_benchmarks import percentile
+from synthetic_model import SyntheticModel
+
+# ---------------------------------------------------------------------------
+# Sweep Configuration
+# ---------------------------------------------------------------------------
+# Dash-like base point; each sweep varies one factor from here
+BASE_POINT: dict[str, float] = {
+    "stored_runs": 100,
+    "num_history_runs": 10,
+    "memories": 0,
+    "memory_update_rate": 0.1,
+    "state_keys": 0,
+}
+
+SWEEPS: dict[str, list[float]] = {
+    "stored_runs": [0, 10, 50, 100, 250, 500],
+    "num_history_runs": [1, 3, 10, 25, 50],
+    "memories": [0, 10, 100, 500, 1000],
+    "memory_update_rate": [0.0, 0.1, 0.25, 0.5, 1.0],
+    "state_keys": [0, 10, 100, 1000, 5000],
+}
+
+STATE_VALUE_CHARS = 100
+# p50 at or above this multiple of the sweep's first point counts as degraded
+DEGRADATION_FACTOR = 1.5
+
+READ_PREFIXES = ("get_", "read_")
+WRITE_PREFIXES = ("upsert_", "insert_", "update_", "delete_", "create_")
+
+console = Console()
+
+
+# ---------------------------------------------------------------------------
+# Create Database Timing
+# ---------------------------------------------------------------------------
+class DbTimer:
+    """Times a database's read and write methods, counting only outermost calls."""
+
+    def __init__(self, db: BaseDb):
+        self.read_seconds = 0.0
+        self.write_seconds = 0.0
+        self._local = threading.local()
+        for name in dir(db):
+            if name.startswith(READ_PREFIXES + WRITE_PREFIXES) and callable(getattr(db, name, None)):
+                kind = "read" if name.startswith(READ_PREFIXES) else "write"
+                setattr(db, name, self._wrap(getattr(db, name), kind))
+
+    def _wrap(self, method: Callable, kind: str) -> Callable:
+        @functools.wraps(method)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            depth = getattr(self._local, "depth", 0)
+            self._local.depth = depth + 1
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._local.depth = depth
+                if depth == 0:
+                    elapsed = time.perf_counter() - start
+                    if kind == "read":
+                        self.read_seconds += elapsed
+                    else:
+                        self.write_seconds += elapsed
+
+        return timed
+
+    def reset(self) -> None:
+        self.read_seconds = 0.0
+        self.write_seconds = 0.0
+
+
+# ---------------------------------------------------------------------------
+# Create Components
+# ---------------------------------------------------------------------------
+def build_component(
+    kind: str, db: BaseDb, num_history_runs: int, memory_update_rate: float
+) -> tuple[Agent | Team, SyntheticModel]:
+    """An agent (or single-member team) configured like Dash's history and memory."""
+    model = SyntheticModel(memory_update_rate=memory_update_rate)
+    settings: dict[str, Any] = {
+        "db": db,
+        "add_history_to_context": True,
+        "num_history_runs": num_history_runs,
+        "enable_agentic_memory": True,
+        "telemetry": False,
+    }
+    if kind == "team":
+        member = Agent(name="Member", model=SyntheticModel(), telemetry=False)
+        return Team(name="Scaling Team", model=model, members=[member], **settings), model
+    return Agent(name="Scaling Agent", model=model, instructions="Be concise.", **settings), model
+
+
+def seed_memories(db: BaseDb, user_id: str, count: int) -> None:
+    for i in range(count):
+        db.upsert_user_memory(
+            UserMemory(
+                memory=f"The user prefers answer style {i} and follows team {i % 20} closely.",
+                topics=["preferences", f"topic_{i % 10}"],
+                user_id=user_id,
+            )
+        )
+
+
+def measure_point(kind: str, point: dict[str, float], samples: int, workdir: Path) -> dict[str, Any]:
+    """Age a fresh session to ``point``, then measure ``samples`` runs."""
+    db_file = workdir / f"{uuid.uuid4().hex}.db"
+    db = SqliteDb(db_file=str(db_file))
+    timer = DbTimer(db)
+    user_id = f"user-{uuid.uuid4().hex[:8]}"
+    session_id = f"session-{uuid.uuid4().hex[:8]}"
+    seed_memories(db, user_id, int(point["memories"]))
+    component, model = build_component(kind, db, int(point["num_history_runs"]), point["memory_update_rate"])
+    state = {f"key_{i}": "x" * STATE_VALUE_CHARS for i in range(int(point["state_keys"]))}
+
+    def run(i: int) -> None:
+        component.run(
+            f"Question {i}: how did the race go?",
+            session_id=session_id,
+            user_id=user_id,
+            session_state=state if i == 0 else None,
+        )
+
+    # Age the session (not measured)
+    aging_start = time.perf_counter()
+    stored_runs = int(point["stored_runs"])
+    for i in range(stored_runs):
+        run(i)
+    aging_seconds = time.perf_counter() - aging_start
+
+    latencies: list[float] = []
+    reads: list[float] = []
+    writes: list[float] = []
+    for i in range(samples):
+        timer.reset()
+        start = time.perf_counter()
+        run(stored_runs + i)
+        latencies.append((time.perf_counter() - start) * 1000)
+        reads.append(timer.read_seconds * 1000)
+        writes.append(timer.write_seconds * 1000)
+
+    # Memory growth in a separate pass, since tracing slows every allocation
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for i in range(samples):
+        run(stored_runs + samples + i)
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        **point,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": percentile(latencies, 95),
+        "db_read_ms": statistics.median(reads),
+        "db_write_ms": statistics.median(writes),
+        "prompt_messages": model.last_input_messages,
+        "prompt_chars": model.last_input_chars,
+        "memory_updates": model.memory_updates,
+        "memory_growth_kib_per_run": (after - before) / 1024 / samples,
+        "peak_memory_kib": peak / 1024,
+        "db_size_kib": sum(f.stat().st_size for f in workdir.glob(f"{db_file.name}*")) / 1024,
+        "aging_seconds": aging_seconds,
+    }
+
+
+def display(axis: str, results: list[dict[str, Any]]) -> None:
+    table = Table(title=f"Sweep: {axis}")
+    for column in (axis, "p50 ms", "p95 ms", "DB read ms", "DB write ms", "Prompt chars", "KiB/run", "DB KiB"):
+        table.add_column(column, justify="right")
+    first = results[0]["p50_ms"]
+    for r in results:
+        degraded = r["p50_ms"] >= first * DEGRADATION_FACTOR
+        style = "red" if degraded else ""
+        table.add_row(
+            str(r[axis]),
+            f"[{style}]{r['p50_ms']:.2f}[/{style}]" if style else f"{r['p50_ms']:.2f}",
+            f"{r['p95_ms']:.2f}",
+            f"{r['db_read_ms']:.2f}",
+            f"{r['db_write_ms']:.2f}",
+            str(r["prompt_chars"]),
+            f"{r['memory_growth_kib_per_run']:.1f}",
+            f"{r['db_size_kib']:.0f}",
+        )
+    console.print(table)
+    onset = next((r[axis] for r in results if r["p50_ms"] >= first * DEGRADATION_FACTOR), None)
+    if onset is not None:
+        console.print(f"[yellow]{axis}: p50 reaches {DEGRADATION_FACTOR}x the first point at {onset}[/yellow]")
+
+
+# ---------------------------------------------------------------------------
+# Create Evaluation
+# ---------------------------------------------------------------------------
+@functools.cache
+def _aged_session() -> tuple[Agent, str, str]:
+    workdir = Path(tempfile.mkdtemp(prefix="history_scaling_"))
+    agent, _ = build_component(
+        "agent",
+        SqliteDb(db_file=str(workdir / "perf.db")),
+        int(BASE_POINT["num_history_runs"]),
+        BASE_POINT["memory_update_rate"],
+    )
+    session_id, user_id = "perf-session", "perf-user"
+    for i in range(int(BASE_POINT["stored_runs"])):
+        agent.run(f"Question {i}", session_id=session_id, user_id=user_id)
+    return agent, session_id, user_id
+
+
+def dash_like_turn():
+    """One turn in a session that already holds 100 runs."""
+    agent, session_id, user_id = _aged_session()
+    return agent.run("How did the race go?", session_id=session_id, user_id=user_id)
+
+
+history_scaling_perf = PerformanceEval(
+    name="Turn at 100 Stored Runs",
+    func=dash_like_turn,
+    num_iterations=20,
+    warmup_runs=2,
+)
+
+# ---------------------------------------------------------------------------
+# Run Evaluation
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep history, memory, and state size")
+    parser.add_argument("--component", choices=["agent", "team"], default="agent")
+    parser.add_argument("--axis", action="append", choices=list(SWEEPS), help="Sweep only these factors")
+    parser.add_argument("--samples", type=int, default=10, help="Measured runs per point")
+    parser.add_argument("--json", type=Path, help="Write all points to this file")
+    args = parser.parse_args()
+
+    all_results: dict[str, list[dict[str, Any]]] = {}
+    with tempfile.TemporaryDirectory(prefix="history_scaling_") as tmp:
+        for axis in args.axis or list(SWEEPS):
+            all_results[axis] = []
+            for value in SWEEPS[axis]:
+                point = {**BASE_POINT, axis: value}
+                console.print(f"[cyan]{args.component}: {axis}={value}...[/cyan]")
+                all_results[axis].append(measure_point(args.component, point, args.samples, Path(tmp)))
+            display(axis, all_results[axis])
+
+    if args.json:
+        args.json.write_text(json.dumps({"component": args.component, "sweeps": all_results}, indent=2))
+        console.print(f"Results written to {args.json}")
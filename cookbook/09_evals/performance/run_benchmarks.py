@@ -0,0 +1,439 @@
+"""
+Performance Benchmark Harness
+=============================
+
+Discovers every `PerformanceEval` in this directory (and `comparison/`), runs
+each script in its own process, and collects time and memory samples into one
+JSON report.
+
+Key concepts:
+- Isolation: every script runs in a fresh interpreter, so imports, caches, and
+  memory from one benchmark never leak into the next.
+- Statistics: outliers are dropped with Tukey fences (1.5 x IQR). Medians get
+  bootstrap 95% confidence intervals.
+- Regression gate: results are appended to a history file and compared with the
+  last run from the same environment. A Mann-Whitney U test flags significant
+  slowdowns, and the harness then exits non-zero.
+
+Usage:
+    python cookbook/09_evals/performance/run_benchmarks.py
+    python cookbook/09_evals/performance/run_benchmarks.py --filter instantiate --iterations 200
+    python cookbook/09_evals/performance/run_benchmarks.py --no-comparison --update-test-log
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import math
+import os
+import platform
+import random
+import runpy
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+from rich.table import Table
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+PERFORMANCE_DIR = Path(__file__).resolve().parent
+REPO_ROOT = PERFORMANCE_DIR.parents[2]
+RESULTS_DIR = PERFORMANCE_DIR / "results"
+SKIP_FILE_NAMES = {"__init__.py", Path(__file__).name}
+
+OUTLIER_IQR_FACTOR = 1.5
+CONFIDENCE = 0.95
+BOOTSTRAP_RESAMPLES = 2000
+# Fewest iterations per eval when gating. With fewer than ~7 samples per side the
+# Mann-Whitney test can't reach p < 0.01 at all, so the eval could never regress;
+# the margin leaves room for dropped outliers.
+MIN_GATE_SAMPLES = 10
+
+console = Console()
+
+
+# ---------------------------------------------------------------------------
+# Create Statistics Helpers
+# ---------------------------------------------------------------------------
+def remove_outliers(samples: list[float]) -> tuple[list[float], int]:
+    """Drop samples outside the Tukey fences; returns (kept samples, outlier count)."""
+    if len(samples) < 4:
+        return list(samples), 0
+    q1, _, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+    spread = (q3 - q1) * OUTLIER_IQR_FACTOR
+    kept = [s for s in samples if q1 - spread <= s <= q3 + spread]
+    return kept, len(samples) - len(kept)
+
+
+def bootstrap_ci(samples: list[float], seed: int = 0) -> tuple[float, float]:
+    """Percentile bootstrap confidence interval for the median."""
+    if len(samples) < 2:
+        return samples[0], samples[0]
+    rng = random.Random(seed)
+    medians = sorted(statistics.median(rng.choices(samples, k=len(samples))) for _ in range(BOOTSTRAP_RESAMPLES))
+    tail = (1 - CONFIDENCE) / 2
+    return medians[int(tail * (len(medians) - 1))], medians[int((1 - tail) * (len(medians) - 1))]
+
+
+def summarize(samples: list[float]) -> dict[str, Any] | None:
+    """Robust summary of one metric; the kept samples are stored for later comparisons."""
+    if not samples:
+        return None
+    kept, outliers = remove_outliers(samples)
+    ci_low, ci_high = bootstrap_ci(kept)
+    return {
+        "n": len(kept),
+        "outliers": outliers,
+        "median": statistics.median(kept),
+        "mean": statistics.mean(kept),
+        "stdev": statistics.stdev(kept) if len(kept) > 1 else 0.0,
+        "min": min(kept),
+        "max": max(kept),
+        "ci_low": ci_low,
+        "ci_high": ci_high,
+        "samples": kept,
+    }
+
+
+def percentile(values: list[float], q: int) -> float:
+    """The ``q``-th percentile (1-99), interpolated between samples."""
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1] if len(values) > 1 else values[0]
+
+
+def mann_whitney_p(a: list[float], b: list[float]) -> float:
+    """Two-sided Mann-Whitney U p-value (normal approximation with tie correction)."""
+    n1, n2 = len(a), len(b)
+    if n1 < 2 or n2 < 2:
+        return 1.0
+    ranked = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    ranks = [0.0] * len(ranked)
+    tie_term = 0.0
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+    rank_sum_a = sum(r for r, (_, group) in zip(ranks, ranked) if group == 0)
+    u = rank_sum_a - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (abs(u - n1 * n2 / 2) - 0.5) / math.sqrt(variance)
+    return math.erfc(max(z, 0) / math.sqrt(2))
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], alpha: float, threshold: float) -> dict[str, Any]:
+    """Change in median, and whether it is a significant regression or improvement."""
+    change = (current["median"] - baseline["median"]) / baseline["median"] if baseline["median"] else 0.0
+    p_value = mann_whitney_p(current["samples"], baseline["samples"])
+    significant = p_value < alpha and abs(change) >= threshold
+    verdict = "regression" if significant and change > 0 else "improvement" if significant else "unchanged"
+    # Even completely separated samples this small wouldn't be significant
+    n1, n2 = len(current["samples"]), len(baseline["samples"])
+    if mann_whitney_p(list(range(n1)), list(range(n1, n1 + n2))) >= alpha:
+        verdict = "insufficient"
+    return {"change": change, "p_value": p_value, "verdict": verdict}
+
+
+# ---------------------------------------------------------------------------
+# Create Benchmark Runner
+# ---------------------------------------------------------------------------
+def discover(filters: list[str], include_comparison: bool) -> list[Path]:
+    scripts = sorted(PERFORMANCE_DIR.glob("*.py"))
+    if include_comparison:
+        scripts += sorted((PERFORMANCE_DIR / "comparison").glob("*.py"))
+    # Helper modules (e.g. synthetic_model.py) define no evals
+    scripts = [s for s in scripts if s.name not in SKIP_FILE_NAMES and "PerformanceEval(" in s.read_text()]
+    if filters:
+        scripts = [s for s in scripts if any(f in s.relative_to(PERFORMANCE_DIR).as_posix() for f in filters)]
+    return scripts
+
+
+def run_child(script: Path, result_file: Path, iterations: int | None, warmup: int | None, min_iterations: int) -> None:
+    """Child-process entry point: run every PerformanceEval defined by ``script``."""
+    from agno.eval.performance import PerformanceEval
+
+    # Scripts import sibling helpers, as when run directly
+    sys.path.insert(0, str(script.parent))
+    # A run_name other than __main__ skips the script's own demo block
+    namespace = runpy.run_path(str(script), run_name="__benchmark__")
+    results: dict[str, dict[str, list[float]]] = {}
+    for variable, evaluation in namespace.items():
+        if not isinstance(evaluation, PerformanceEval):
+            continue
+        evaluation.print_summary = False
+        evaluation.print_results = False
+        evaluation.show_spinner = False
+        evaluation.telemetry = False
+        if iterations is not None:
+            evaluation.num_iterations = iterations
+        else:
+            # Enough samples for the regression gate
+            evaluation.num_iterations = max(evaluation.num_iterations, min_iterations)
+        if warmup is not None:
+            evaluation.warmup_runs = warmup
+        if inspect.iscoroutinefunction(evaluation.func):
+            result = asyncio.run(evaluation.arun())
+        else:
+            result = evaluation.run()
+        results[evaluation.name or variable] = {
+            "run_times": list(result.run_times),
+            "memory_usages": list(result.memory_usages),
+        }
+    result_file.write_text(json.dumps(results))
+
+
+def run_script(script: Path, args: argparse.Namespace) -> dict[str, Any]:
+    """Run one script in a fresh interpreter and summarize its samples."""
+    with tempfile.TemporaryDirectory() as tmp:
+        result_file = Path(tmp) / "result.json"
+        command = [
+            args.python,
+            str(Path(__file__).resolve()),
+            "--child",
+            str(script),
+            "--result-file",
+            str(result_file),
+        ]
+        if args.iterations is not None:
+            command += ["--iterations", str(args.iterations)]
+        if args.warmup is not None:
+            command += ["--warmup", str(args.warmup)]
+        command += ["--min-iterations", str(args.min_iterations)]
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(REPO_ROOT), os.getenv("PYTHONPATH")]))}
+        start = time.perf_counter()
+        try:
+            completed = subprocess.run(
+                command, cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=args.timeout
+            )
+        except subprocess.TimeoutExpired:
+            return {"status": "timeout", "seconds": args.timeout, "evals": {}}
+        seconds = time.perf_counter() - start
+
+        if completed.returncode != 0 or not result_file.exists():
+            stderr = completed.stderr.strip()
+            # Comparison scripts need third-party frameworks; a missing one is a skip, not a failure.
+            # Anywhere else a failed import is a real breakage.
+            optional = script.parent.name == "comparison"
+            status = "skipped" if optional and "ModuleNotFoundError" in stderr else "error"
+            return {"status": status, "seconds": seconds, "error": stderr[-2000:], "evals": {}}
+        raw = json.loads(result_file.read_text())
+
+    evals = {
+        name: {"runtime": summarize(samples["run_times"]), "memory": summarize(samples["memory_usages"])}
+        for name, samples in raw.items()
+    }
+    return {"status": "ok" if evals else "empty", "seconds": seconds, "evals": evals}
+
+
+def environment() -> dict[str, Any]:
+    try:
+        from importlib.metadata import version
+
+        agno_version = version("agno")
+    except Exception:
+        agno_version = None
+    try:
+        git_sha = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        git_sha = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "agno": agno_version,
+        "git_sha": git_sha,
+    }
+
+
+def _fingerprint(env: dict[str, Any]) -> tuple:
+    # Results are only comparable on the same machine and interpreter
+    return env.get("python"), env.get("platform"), env.get("machine"), env.get("cpu_count")
+
+
+def load_baseline(history: Path, env: dict[str, Any]) -> dict[str, Any] | None:
+    if not history.exists():
+        return None
+    baseline = None
+    for line in history.read_text().splitlines():
+        if not line.strip():
+            continue
+        report = json.loads(line)
+        if _fingerprint(report.get("environment", {})) == _fingerprint(env):
+            baseline = report
+    return baseline
+
+
+def apply_gate(report: dict[str, Any], baseline: dict[str, Any] | None, alpha: float, threshold: float) -> list[str]:
+    """Annotate ``report`` with baseline comparisons and return the regressions found."""
+    regressions: list[str] = []
+    if baseline is None:
+        return regressions
+    for script, entry in report["scripts"].items():
+        previous = baseline.get("scripts", {}).get(script, {}).get("evals", {})
+        for name, metrics in entry["evals"].items():
+            for metric in ("runtime", "memory"):
+                current, before = metrics.get(metric), previous.get(name, {}).get(metric)
+                if not current or not before:
+                    continue
+                metrics[f"{metric}_vs_baseline"] = comparison = compare(current, before, alpha, threshold)
+                if comparison["verdict"] == "regression":
+                    regressions.append(f"{script}::{name} {metric} {comparison['change']:+.1%}")
+    return regressions
+
+
+def display(report: dict[str, Any]) -> None:
+    table = Table(title="Performance Benchmarks", show_lines=False)
+    table.add_column("Benchmark")
+    table.add_column("Status")
+    table.add_column("Time median (95% CI)", justify="right")
+    table.add_column("Memory MiB median", justify="right")
+    table.add_column("Outliers", justify="right")
+    table.add_column("vs baseline", justify="right")
+    for script, entry in report["scripts"].items():
+        if not entry["evals"]:
+            table.add_row(script, entry["status"], "-", "-", "-", "-")
+            continue
+        for name, metrics in entry["evals"].items():
+            runtime, memory = metrics.get("runtime"), metrics.get("memory")
+            time_cell = (
+                f"{runtime['median'] * 1000:.3f} ms ({runtime['ci_low'] * 1000:.3f}-{runtime['ci_high'] * 1000:.3f})"
+                if runtime
+                else "-"
+            )
+            memory_cell = f"{memory['median']:.3f}" if memory else "-"
+            outliers = str(runtime["outliers"]) if runtime else "-"
+            comparison = metrics.get("runtime_vs_baseline")
+            if comparison:
+                style = {"regression": "red", "improvement": "green"}.get(comparison["verdict"], "dim")
+                versus = f"[{style}]{comparison['change']:+.1%} (p={comparison['p_value']:.3f})[/{style}]"
+            else:
+                versus = "-"
+            table.add_row(f"{script}::{name}", entry["status"], time_cell, memory_cell, outliers, versus)
+    console.print(table)
+
+
+def update_test_log(report: dict[str, Any]) -> None:
+    """Record each script's latest outcome in the TEST_LOG.md next to it."""
+    date = report["timestamp"][:10]
+    by_log: dict[Path, dict[str, dict[str, Any]]] = {}
+    for script, entry in report["scripts"].items():
+        path = PERFORMANCE_DIR / script
+        by_log.setdefault(path.parent / "TEST_LOG.md", {})[path.name] = entry
+
+    for log_path, entries in by_log.items():
+        if not log_path.exists():
+            continue
+        lines = log_path.read_text().splitlines()
+        current = None
+        for i, line in enumerate(lines):
+            if line.startswith("### "):
+                current = line[4:].strip()
+            elif line.startswith("> Tests not yet run"):
+                lines[i] = "> Updated by `run_benchmarks.py`."
+            elif line.startswith("**Status:**") and current in entries:
+                entry = entries[current]
+                status = {"ok": "PASS", "skipped": "SKIPPED"}.get(entry["status"], "FAIL")
+                medians = [
+                    f"{name} {m['runtime']['median'] * 1000:.3f} ms"
+                    for name, m in entry["evals"].items()
+                    if m.get("runtime")
+                ]
+                lines[i] = f"**Status:** {status} ({date}{', ' + '; '.join(medians) if medians else ''})"
+        log_path.write_text("\n".join(lines) + "\n")
+
+
+# ---------------------------------------------------------------------------
+# Run Benchmarks
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the performance evals in isolated processes")
+    parser.add_argument("--filter", "-f", action="append", default=[], help="Only scripts whose path contains this")
+    parser.add_argument("--no-comparison", action="store_true", help="Skip the framework comparison scripts")
+    parser.add_argument("--iterations", type=int, help="Override num_iterations for every eval")
+    parser.add_argument("--warmup", type=int, help="Override warmup_runs for every eval")
+    parser.add_argument(
+        "--min-iterations",
+        type=int,
+        default=MIN_GATE_SAMPLES,
+        help="Raise num_iterations of evals that run fewer, so the gate can detect changes",
+    )
+    parser.add_argument("--timeout", type=int, default=900, help="Seconds allowed per script")
+    parser.add_argument("--python", default=sys.executable, help="Interpreter for the benchmark processes")
+    parser.add_argument("--report", type=Path, default=RESULTS_DIR / "report.json")
+    parser.add_argument("--history", type=Path, default=RESULTS_DIR / "history.jsonl")
+    parser.add_argument("--baseline", type=Path, help="Compare against this report instead of the history")
+    parser.add_argument("--alpha", type=float, default=0.01, help="Significance level for regressions")
+    parser.add_argument("--threshold", type=float, default=0.05, help="Minimum relative change to flag")
+    parser.add_argument("--no-history", action="store_true", help="Don't append this run to the history")
+    parser.add_argument("--update-test-log", action="store_true", help="Write PASS/FAIL into TEST_LOG.md")
+    parser.add_argument("--child", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    fewest_iterations = args.iterations if args.iterations is not None else args.min_iterations
+    if args.baseline and fewest_iterations < MIN_GATE_SAMPLES:
+        parser.error(f"comparing against --baseline needs at least {MIN_GATE_SAMPLES} iterations per eval")
+
+    if args.child:
+        run_child(args.child, args.result_file, args.iterations, args.warmup, args.min_iterations)
+        raise SystemExit(0)
+
+    env = environment()
+    report: dict[str, Any] = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "environment": env,
+        "settings": {"iterations": args.iterations, "warmup": args.warmup, "alpha": args.alpha},
+        "scripts": {},
+    }
+    for script in discover(args.filter, not args.no_comparison):
+        name = script.relative_to(PERFORMANCE_DIR).as_posix()
+        console.print(f"[cyan]Running {name}...[/cyan]")
+        report["scripts"][name] = run_script(script, args)
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else load_baseline(args.history, env)
+    regressions = apply_gate(report, baseline, args.alpha, args.threshold)
+    failures = [name for name, entry in report["scripts"].items() if entry["status"] in ("error", "timeout")]
+    report["regressions"] = regressions
+    report["failures"] = failures
+
+    display(report)
+    args.report.parent.mkdir(parents=True, exist_ok=True)
+    args.report.write_text(json.dumps(report, indent=2))
+    if not args.no_history:
+        with args.history.open("a") as f:
+            f.write(json.dumps(report) + "\n")
+    if args.update_test_log:
+        update_test_log(report)
+
+    console.print(f"Report written to {args.report}")
+    for regression in regressions:
+        console.print(f"[red]Regression: {regression}[/red]")
+    insufficient = [
+        f"{script}::{name}"
+        for script, entry in report["scripts"].items()
+        for name, metrics in entry["evals"].items()
+        if metrics.get("runtime_vs_baseline", {}).get("verdict") == "insufficient"
+    ]
+    if insufficient:
+        console.print(f"[yellow]Too few samples to gate: {', '.join(insufficient)}[/yellow]")
+    for failure in failures:
+        console.print(f"[red]Failed: {failure}[/red]")
+    raise SystemExit(1 if regressions or failures else 0)
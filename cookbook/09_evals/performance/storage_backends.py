@@ -0,0 +1,316 @@
+"""
+Storage Backend Benchmark
+=========================
+
+Runs the same session workload against each storage backend from
+`cookbook/06_storage` that has a local stand-in. The workload is four phases:
+- create sessions
+- append runs
+- read history
+- list sessions
+
+It runs across many users and at several session sizes.
+
+Key concepts:
+- Backends: sqlite, json, in_memory, and postgres (when reachable). redis runs
+  on fakeredis and mongo on mongomock, unless `--redis-url` or `--mongo-url`
+  point at real servers. A backend whose driver isn't installed is skipped.
+- Each phase uses the same calls an agent makes on every run. Appending a run
+  reads the session, writes the run to the runs table, and upserts the session
+  row. Backends without a runs table store the run inline with the session.
+- Each phase reports throughput and latency percentiles. Storage growth is
+  reported per backend and session size.
+
+Usage:
+    python cookbook/09_evals/performance/storage_backends.py
+    python cookbook/09_evals/performance/storage_backends.py --backend sqlite --backend postgres --runs 1,10,50
+    python cookbook/09_evals/performance/storage_backends.py --users 50 --sessions-per-user 4 --json storage.json
+"""
+
+import argparse
+import inspect
+import json
+import os
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable
+
+from agno.db.base import BaseDb, SessionType
+from agno.models.message import Message
+from agno.run.agent import RunOutput
+from agno.run.base import RunStatus
+from agno.session import AgentSession
+from rich.console import Console
+from rich.table import Table
+from run_benchmarks import percentile
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+BACKENDS = ("sqlite", "json", "in_memory", "postgres", "redis", "mongo")
+PHASES = ("create", "append_run", "read_history", "list_sessions")
+AGENT_ID = "storage-bench-agent"
+LIST_PAGE_SIZE = 20
+# Runs loaded when reading history, like an agent with num_history_runs=10
+HISTORY_RUNS = 10
+
+console = Console()
+
+
+# ---------------------------------------------------------------------------
+# Create Backends
+# ---------------------------------------------------------------------------
+def make_backend(name: str, workdir: Path, args: argparse.Namespace) -> tuple[BaseDb, Callable[[], int | None]]:
+    """Return a fresh backend and a function reporting its storage size in bytes (None if unknown)."""
+    suffix = uuid.uuid4().hex[:8]
+    if name == "sqlite":
+        from agno.db.sqlite import SqliteDb
+
+        path = workdir / f"bench_{suffix}.db"
+        return SqliteDb(db_file=str(path)), lambda: _dir_size(workdir, f"{path.name}*")
+    if name == "json":
+        from agno.db.json import JsonDb
+
+        path = workdir / f"json_{suffix}"
+        return JsonDb(db_path=str(path)), lambda: _dir_size(path, "**/*")
+    if name == "in_memory":
+        from agno.db.in_memory import InMemoryDb
+
+        return InMemoryDb(), lambda: None
+    if name == "postgres":
+        from agno.db.postgres import PostgresDb
+        from sqlalchemy import create_engine, text
+
+        engine = create_engine(args.postgres_url)
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        table = f"bench_sessions_{suffix}"
+
+        def postgres_size() -> int | None:
+            with engine.connect() as conn:
+                return conn.execute(
+                    text("SELECT pg_total_relation_size(to_regclass(:t))"), {"t": f"ai.{table}"}
+                ).scalar()
+
+        return PostgresDb(db_engine=engine, session_table=table), postgres_size
+    if name == "redis":
+        from agno.db.redis import RedisDb
+
+        if args.redis_url:
+            from redis import Redis
+
+            client = Redis.from_url(args.redis_url)
+        else:
+            import fakeredis
+
+            client = fakeredis.FakeRedis()
+
+        def redis_size() -> int | None:
+            return sum(len(client.dump(key) or b"") for key in client.scan_iter(f"bench_{suffix}*"))
+
+        return RedisDb(redis_client=client, db_prefix=f"bench_{suffix}"), redis_size
+    if name == "mongo":
+        from agno.db.mongo import MongoDb
+
+        if args.mongo_url:
+            from pymongo import MongoClient
+
+            client = MongoClient(args.mongo_url)
+        else:
+            import mongomock
+
+            client = mongomock.MongoClient()
+        db_name = f"bench_{suffix}"
+
+        def mongo_size() -> int | None:
+            database = client[db_name]
+            return sum(
+                len(json.dumps(doc, default=str))
+                for name in database.list_collection_names()
+                for doc in database[name].find()
+            )
+
+        return MongoDb(db_client=client, db_name=db_name), mongo_size
+    raise ValueError(f"Unknown backend: {name}")
+
+
+def _dir_size(path: Path, pattern: str) -> int:
+    return sum(f.stat().st_size for f in path.glob(pattern) if f.is_file()) if path.exists() else 0
+
+
+def _supports(method: Callable, parameter: str) -> bool:
+    return parameter in inspect.signature(method).parameters
+
+
+# ---------------------------------------------------------------------------
+# Create Workload
+# ---------------------------------------------------------------------------
+def make_run(session_id: str, user_id: str, index: int, message_chars: int) -> RunOutput:
+    question = f"Question {index}: " + "q" * message_chars
+    answer = f"Answer {index}: " + "a" * message_chars
+    return RunOutput(
+        run_id=str(uuid.uuid4()),
+        agent_id=AGENT_ID,
+        session_id=session_id,
+        user_id=user_id,
+        content=answer,
+        status=RunStatus.completed,
+        messages=[Message(role="user", content=question), Message(role="assistant", content=answer)],
+        created_at=int(time.time()),
+    )
+
+
+def timed(latencies: list[float], fn: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+    result = fn()
+    latencies.append(time.perf_counter() - start)
+    return result
+
+
+def run_workload(
+    db: BaseDb, users: int, sessions_per_user: int, runs: int, message_chars: int
+) -> dict[str, list[float]]:
+    """Drive the four phases and return per-operation latencies (seconds) per phase."""
+    latencies: dict[str, list[float]] = {phase: [] for phase in PHASES}
+    sessions = [(f"user-{u}", f"session-{u}-{s}") for u in range(users) for s in range(sessions_per_user)]
+
+    for user_id, session_id in sessions:
+        session = AgentSession(
+            session_id=session_id,
+            agent_id=AGENT_ID,
+            user_id=user_id,
+            session_data={"session_name": session_id},
+            runs=[],
+            created_at=int(time.time()),
+        )
+        timed(latencies["create"], lambda: db.upsert_session(session))
+
+    # Only where the adapter has a runs table; otherwise upsert_session stores the run inline
+    separate_runs = hasattr(db, "upsert_run")
+    # Round-robin so every session grows together, like concurrent users
+    for index in range(runs):
+        for user_id, session_id in sessions:
+
+            def append() -> None:
+                stored = db.get_session(session_id=session_id, session_type=SessionType.AGENT, user_id=user_id)
+                run = make_run(session_id, user_id, index, message_chars)
+                stored.upsert_run(run)
+                if separate_runs:
+                    try:
+                        db.upsert_run(run=run, session_id=session_id, user_id=user_id, run_index=index)
+                    except NotImplementedError:
+                        pass
+                db.upsert_session(stored)
+
+            timed(latencies["append_run"], append)
+
+    history_kwargs = {"runs_limit": HISTORY_RUNS} if _supports(db.get_session, "runs_limit") else {}
+    for user_id, session_id in sessions:
+
+        def read() -> None:
+            stored = db.get_session(
+                session_id=session_id, session_type=SessionType.AGENT, user_id=user_id, **history_kwargs
+            )
+            stored.get_messages(last_n_runs=HISTORY_RUNS)
+
+        timed(latencies["read_history"], read)
+
+    # List views don't need each session's runs
+    list_kwargs = {"include_runs": False} if _supports(db.get_sessions, "include_runs") else {}
+    for u in range(users):
+        timed(
+            latencies["list_sessions"],
+            lambda: db.get_sessions(
+                session_type=SessionType.AGENT, user_id=f"user-{u}", limit=LIST_PAGE_SIZE, page=1, **list_kwargs
+            ),
+        )
+    return latencies
+
+
+def summarize_phase(latencies: list[float]) -> dict[str, float]:
+    total = sum(latencies)
+    return {
+        "ops": len(latencies),
+        "ops_per_sec": len(latencies) / total if total else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def display(results: list[dict[str, Any]]) -> None:
+    table = Table(title="Storage Backends")
+    for column in ("Backend", "Runs/session", "Phase", "Ops/s", "p50 ms", "p95 ms", "p99 ms", "Storage KiB"):
+        table.add_column(column, justify="left" if column in ("Backend", "Phase") else "right")
+    for r in results:
+        if r["status"] != "ok":
+            table.add_row(r["backend"], str(r["runs"]), f"[dim]{r['status']}: {r.get('error', '')[:60]}[/dim]")
+            continue
+        size = f"{r['storage_bytes'] / 1024:.0f}" if r["storage_bytes"] is not None else "-"
+        for i, (phase, stats) in enumerate(r["phases"].items()):
+            table.add_row(
+                r["backend"] if i == 0 else "",
+                str(r["runs"]) if i == 0 else "",
+                phase,
+                f"{stats['ops_per_sec']:.0f}",
+                f"{stats['p50_ms']:.2f}",
+                f"{stats['p95_ms']:.2f}",
+                f"{stats['p99_ms']:.2f}",
+                size if i == 0 else "",
+            )
+    console.print(table)
+
+
+# ---------------------------------------------------------------------------
+# Run Benchmark
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare storage backends on identical session workloads")
+    parser.add_argument("--backend", action="append", choices=BACKENDS, help="Backends to run (default: all)")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--sessions-per-user", type=int, default=3)
+    parser.add_argument("--runs", default="1,10,50", help="Runs per session, one workload each")
+    parser.add_argument("--message-chars", type=int, default=500, help="Characters per user/assistant message")
+    parser.add_argument(
+        "--postgres-url", default=os.getenv("BENCH_POSTGRES_URL", "postgresql+psycopg://ai:ai@localhost:5532/ai")
+    )
+    parser.add_argument("--redis-url", default=os.getenv("BENCH_REDIS_URL"), help="Real Redis instead of fakeredis")
+    parser.add_argument("--mongo-url", default=os.getenv("BENCH_MONGO_URL"), help="Real MongoDB instead of mongomock")
+    parser.add_argument("--json", type=Path, help="Write results to this file")
+    args = parser.parse_args()
+
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="storage_bench_") as tmp:
+        for backend in args.backend or list(BACKENDS):
+            for runs in [int(r) for r in args.runs.split(",") if r]:
+                console.print(f"[cyan]{backend}: {runs} runs per session...[/cyan]")
+                entry: dict[str, Any] = {"backend": backend, "runs": runs}
+                try:
+                    db, storage_size = make_backend(backend, Path(tmp), args)
+                except ImportError as e:
+                    results.append({**entry, "status": "skipped", "error": str(e)})
+                    break
+                except Exception as e:
+                    # e.g. Postgres container not running
+                    results.append({**entry, "status": "unavailable", "error": str(e).splitlines()[0]})
+                    break
+                try:
+                    latencies = run_workload(db, args.users, args.sessions_per_user, runs, args.message_chars)
+                except Exception as e:
+                    results.append({**entry, "status": "error", "error": str(e).splitlines()[0]})
+                    continue
+                results.append(
+                    {
+                        **entry,
+                        "status": "ok",
+                        "phases": {phase: summarize_phase(values) for phase, values in latencies.items()},
+                        "storage_bytes": storage_size(),
+                    }
+                )
+
+    display(results)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+        console.print(f"Results written to {args.json}")
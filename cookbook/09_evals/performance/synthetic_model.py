@@ -0,0 +1,125 @@
+"""
+Synthetic Model for Benchmarks
+==============================
+
+Demonstrates a deterministic, offline model for performance benchmarks.
+
+Key concepts:
+- No network: responses come back after a fixed, configurable latency, so the
+  measured time is agno's own overhead (context building, storage, memory).
+- Token usage is estimated from the prompt size, so metrics and prompt growth
+  stay visible as history, memories, and session state grow.
+- `last_input_messages` and `last_input_chars` expose the size of the last
+  prompt the model received.
+- With `memory_update_rate`, the model calls `update_user_memory` on that
+  share of turns when agentic memory is enabled, and adds one memory when the
+  memory manager asks it to. This exercises the memory-update path instead of
+  only the prompt.
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from agno.agent import Agent
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.response import ModelResponse
+
+
+# ---------------------------------------------------------------------------
+# Create Synthetic Model
+# ---------------------------------------------------------------------------
+@dataclass
+class SyntheticModel(Model):
+    id: str = "synthetic"
+    name: str = "SyntheticModel"
+    provider: str = "Synthetic"
+
+    # Fixed reply and simulated provider latency
+    reply: str = "This is a synthetic reply."
+    latency_ms: float = 0.0
+    chars_per_token: int = 4
+
+    # Share of turns that call update_user_memory (needs enable_agentic_memory)
+    memory_update_rate: float = 0.0
+
+    # Size of the last prompt received
+    last_input_messages: int = 0
+    last_input_chars: int = 0
+
+    # Turns seen and memory tool calls made
+    turns: int = 0
+    memory_updates: int = 0
+
+    def _respond(self, messages: List[Message], tools: Optional[List[Dict[str, Any]]] = None) -> ModelResponse:
+        self.last_input_messages = len(messages)
+        self.last_input_chars = sum(len(m.get_content_string()) for m in messages)
+        input_tokens = self.last_input_chars // self.chars_per_token + 1
+        output_tokens = len(self.reply) // self.chars_per_token + 1
+        usage = Metrics(
+            input_tokens=input_tokens, output_tokens=output_tokens, total_tokens=input_tokens + output_tokens
+        )
+
+        tool_call = None if messages and messages[-1].role == "tool" else self._tool_call(tools or [])
+        if tool_call is not None:
+            return ModelResponse(role="assistant", tool_calls=[tool_call], response_usage=usage)
+        return ModelResponse(role="assistant", content=self.reply, response_usage=usage)
+
+    def _tool_call(self, tools: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """The memory tool call to make this turn, if any."""
+        names = {tool.get("function", {}).get("name") for tool in tools if isinstance(tool, dict)}
+        if "add_memory" in names:
+            # The memory manager's own model call
+            name, arguments = "add_memory", {"memory": f"Synthetic memory {self.memory_updates}", "topics": ["bench"]}
+        elif "update_user_memory" in names:
+            self.turns += 1
+            # Spread the calls evenly: every 1/rate turns
+            if int(self.turns * self.memory_update_rate) == int((self.turns - 1) * self.memory_update_rate):
+                return None
+            self.memory_updates += 1
+            name, arguments = "update_user_memory", {"task": f"Remember preference {self.memory_updates}"}
+        else:
+            return None
+        return {
+            "id": f"call_{name}_{self.memory_updates}",
+            "type": "function",
+            "function": {"name": name, "arguments": json.dumps(arguments)},
+        }
+
+    def invoke(self, messages: List[Message], *args: Any, **kwargs: Any) -> ModelResponse:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        return self._respond(messages, kwargs.get("tools"))
+
+    async def ainvoke(self, messages: List[Message], *args: Any, **kwargs: Any) -> ModelResponse:
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+        return self._respond(messages, kwargs.get("tools"))
+
+    def invoke_stream(self, messages: List[Message], *args: Any, **kwargs: Any) -> Iterator[ModelResponse]:
+        yield self.invoke(messages, **kwargs)
+
+    async def ainvoke_stream(self, messages: List[Message], *args: Any, **kwargs: Any) -> AsyncIterator[ModelResponse]:
+        yield await self.ainvoke(messages, **kwargs)
+
+    def _parse_provider_response(self, response: Any, **kwargs: Any) -> ModelResponse:
+        return response
+
+    def _parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return response
+
+
+# ---------------------------------------------------------------------------
+# Run Synthetic Model
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    model = SyntheticModel(latency_ms=5)
+    agent = Agent(model=model, system_message="Be concise.")
+    response = agent.run("What is the capital of France?")
+    print(response.content)
+    print(f"Prompt: {model.last_input_messages} messages, {model.last_input_chars} chars")
+    print(f"Metrics: {response.metrics}")